@@ -1,23 +1,184 @@
+import os
+import re
 import sys
 import json
-import winreg
-from datetime import datetime
-import traceback
+import time
+import gzip
+import struct
+import argparse
+import sqlite3
+import hashlib
+import uuid
+import random
+import zlib
+import threading
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from collections import OrderedDict, deque
+from datetime import datetime, time as dt_time
+from functools import lru_cache
+from difflib import SequenceMatcher
+from string import Template
+
+STARTUP_STARTED = time.perf_counter()  # Qt 모듈을 불러오기 전 시각 (시작 시간 보고의 기준)
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QListWidget, QTextEdit, QLineEdit, QPushButton,
     QLabel, QVBoxLayout, QHBoxLayout, QSplitter, QSystemTrayIcon, QMenu, 
-    QListWidgetItem, QDialog, QFormLayout, QDialogButtonBox, QInputDialog, QTreeWidget, QTreeWidgetItem,
-    QScrollArea, QFrame, QTabWidget, QDateEdit, QCheckBox, QComboBox, QGroupBox, QCompleter
+    QListWidgetItem, QDialog, QFormLayout, QDialogButtonBox, QInputDialog,
+    QFrame, QTabWidget, QDateEdit, QCheckBox, QComboBox, QGroupBox, QCompleter,
+    QListView, QStyledItemDelegate, QStyle, QAbstractItemView, QDockWidget, QTableView, QPlainTextEdit,
+    QFileDialog
+)
+from PySide6.QtGui import (
+    QIcon, QTextCursor, QMouseEvent, QAction, QFont, QColor, QStandardItemModel, QStandardItem,
+    QPen, QFontMetrics, QKeySequence, QShortcut, QFontDatabase
+)
+from PySide6.QtCore import (
+    Qt, QUrl, QObject, Signal, Slot, QThread, QMetaObject, Q_ARG, QTimer, QSize, QDate,
+    QAbstractListModel, QAbstractTableModel, QModelIndex, QRect, QStandardPaths, QThreadPool
 )
-from PySide6.QtGui import QIcon, QTextCursor, QMouseEvent, QAction, QFont, QColor, QStandardItemModel, QStandardItem
-from PySide6.QtCore import Qt, QUrl, QObject, Signal, Slot, QThread, QMetaObject, Q_ARG, QTimer, QSize, QDate
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QAbstractSocket
 from PySide6.QtWebSockets import QWebSocket
 
+try:
+    import winreg
+except ImportError:
+    winreg = None  # Windows 이외 환경에서는 파일 설정 백엔드 사용
+
+# 선택적 바이너리 인코딩 (설치되어 있지 않으면 JSON만 사용)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
 # Registry key for storing settings
 REG_PATH = r"Software\SlackClone"
 SERVER_URL = "ws://localhost:8081/ws"
+HISTORY_PAGE_SIZE = 50  # 채널 히스토리 한 페이지의 메시지 수
+CHANNEL_CACHE_MAX_ROWS = 20000  # 채널 캐시에 보관할 최대 행 수 (모든 채널 합계)
+RENDER_BATCH_SIZE = 500  # 이벤트 루프 한 틱에 표시할 최대 메시지 수
+STORE_WRITE_CHUNK = 250  # 이벤트 루프 한 틱에 로컬 저장소에 저장할 최대 메시지 수
+INGEST_FLUSH_INTERVAL_MS = 16  # 실시간 메시지를 모아서 반영하는 주기 (약 한 프레임)
+OUTBOX_MAX_FRAMES = 1000  # 연결이 끊긴 동안 보관할 최대 전송 프레임 수
+ACK_TIMEOUT_SEC = 5  # 사용자 메시지 ack 대기 시간
+MAX_SEND_ATTEMPTS = 5  # 사용자 메시지 최대 전송 시도 횟수
+RECONNECT_BASE_MS = 1000  # 첫 재연결 지연
+RECONNECT_MAX_MS = 60000  # 재연결 지연 상한
+COMPRESS_MIN_BYTES = 512  # 이보다 작은 바이너리 프레임은 압축하지 않음
+TRAFFIC_FLUSH_SEC = 1  # 트래픽 기록 파일을 디스크에 내보내는 주기
+REQUEST_TIMEOUT_SEC = 15  # 요청 응답 대기 시간 (기본값)
+# action별 응답 대기 시간 (bootstrap은 미지원 서버 대비로 짧게, send_message는 outbox가 재전송과 실패를
+# 처리하므로 확인이 오지 않은 요청만 정리하도록 길게)
+REQUEST_TIMEOUTS = {"search": 30, "bootstrap": 5, "send_message": 120}
+LOCAL_SEARCH_LIMIT = 500  # 로컬 검색 결과 최대 개수
+SEARCH_DEBOUNCE_MS = 250  # 입력이 멈춘 뒤 빠른 검색을 시작하기까지의 대기 시간
+SEARCH_MIN_CHARS = 2  # 빠른 검색을 시작할 최소 글자 수
+SEARCH_PAGE_SIZE = 100  # 서버 검색 결과 한 페이지의 개수
+SEARCH_STREAM_PAGES = 3  # 빠른 검색에서 이어서 받아 올 최대 페이지 수
+METRICS_EXPORT_INTERVAL_SEC = 30  # 지표 파일 내보내기 주기
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)  # 시간 히스토그램 구간
+LOG_SAMPLE_PER_SEC = 20  # 대량 로그(sampled)를 메시지별로 초당 남길 최대 개수
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024  # 로그 파일 하나의 최대 크기 (넘으면 교체)
+LOG_FILE_BACKUPS = 3  # 보관할 이전 로그 파일 수
+
+# 연결이 끊긴 동안에는 보관하지 않는 조회 요청 (연결 시 다시 요청하고, 검색은 로컬 결과만 표시)
+VOLATILE_ACTIONS = {"bootstrap", "register_user", "get_workspace_list", "get_channel_list", "get_channel_data",
+                    "search"}
+
+# 구성 요소별 로거 (setup_logging 전에는 파이썬 기본 동작대로 경고 이상만 출력)
+log = logging.getLogger("slackclone")
+settings_log = logging.getLogger("slackclone.settings")
+metrics_log = logging.getLogger("slackclone.metrics")
+store_log = logging.getLogger("slackclone.store")
+net_log = logging.getLogger("slackclone.net")
+ui_log = logging.getLogger("slackclone.ui")
+
+# LogRecord 기본 속성 (나머지는 extra로 넘긴 구조화 필드)
+LOG_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sampled"}
+
+class StructuredFormatter(logging.Formatter):
+    """로그 레코드를 한 줄로 출력 (text는 key=value를 덧붙이고 json은 JSON 객체 한 줄)"""
+
+    def __init__(self, fmt="text"):
+        super().__init__()
+        self.json = fmt == "json"
+
+    def format(self, record):
+        timestamp = datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds")
+        fields = {key: value for key, value in vars(record).items() if key not in LOG_RECORD_FIELDS}
+        if self.json:
+            entry = {"time": timestamp, "level": record.levelname, "logger": record.name,
+                     "thread": record.threadName, "message": record.getMessage()}
+            entry.update(fields)
+            if record.exc_info:
+                entry["exception"] = self.formatException(record.exc_info)
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        text = f"{timestamp} {record.levelname:<7} {record.name}: {record.getMessage()}"
+        if fields:
+            text += " " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+        if record.exc_info:
+            text += "\n" + self.formatException(record.exc_info)
+        return text
+
+class SamplingFilter(logging.Filter):
+    """sampled로 표시한 대량 로그를 메시지별로 초당 정해진 개수까지만 통과
+
+    버린 개수는 다음 구간에 처음 통과하는 레코드의 suppressed 필드로 남긴다.
+    """
+
+    def __init__(self, per_sec=LOG_SAMPLE_PER_SEC):
+        super().__init__()
+        self.per_sec = per_sec
+        self.windows = {}  # 메시지 -> [구간 시작 시각, 통과 수, 버린 수]
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        if not getattr(record, "sampled", False):
+            return True
+        now = time.monotonic()
+        with self.lock:
+            window = self.windows.get(record.msg)
+            if window is None or now - window[0] >= 1:
+                if window is not None and window[2]:
+                    record.suppressed = window[2]
+                window = self.windows[record.msg] = [now, 0, 0]
+            if window[1] >= self.per_sec:
+                window[2] += 1
+                return False
+            window[1] += 1
+        return True
+
+def setup_logging(level="INFO", path=None, fmt="text"):
+    """로그 설정 후 QueueListener 반환 (종료 시 stop() 호출)
+
+    로그를 남기는 스레드는 큐에 넣기만 하고, 콘솔과 파일 출력은 리스너의
+    백그라운드 스레드에서 처리한다. 콘솔이 느리거나 출력이 리디렉션되어도
+    GUI 스레드와 WebSocket 워커 스레드는 기다리지 않는다.
+    """
+    formatter = StructuredFormatter(fmt)
+    handlers = [logging.StreamHandler()]
+    if path:
+        handlers.append(RotatingFileHandler(path, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS,
+                                            encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(SamplingFilter())
+    log.handlers[:] = [queue_handler]
+    log.setLevel(level.upper() if isinstance(level, str) else level)
+    log.propagate = False
+
+    listener = QueueListener(queue_handler.queue, *handlers)
+    listener.start()
+    return listener
 
 def save_to_registry(key, value):
     try:
@@ -25,18 +186,9 @@ def save_to_registry(key, value):
         registry_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_WRITE)
         winreg.SetValueEx(registry_key, key, 0, winreg.REG_SZ, value)
         winreg.CloseKey(registry_key)
-    except WindowsError:
+    except OSError:
         pass
 
-def load_from_registry(key):
-    try:
-        registry_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_READ)
-        value, regtype = winreg.QueryValueEx(registry_key, key)
-        winreg.CloseKey(registry_key)
-        return value
-    except WindowsError:
-        return None
-
 # 날짜 변환 유틸리티 함수
 def format_date_korean(date_str):
     """날짜 문자열을 한국어 형식으로 변환 (예: '2023-12-25' -> '2023년 12월 25일 월요일')"""
@@ -48,6 +200,851 @@ def format_date_korean(date_str):
     except:
         return date_str
 
+@lru_cache(maxsize=4096)
+def format_time_12h(time_str):
+    """24시간 형식 시간을 12시간 형식으로 변환 (예: '13:05:00' -> 'PM 01:05')"""
+    # strptime은 대량 히스토리에서 병목이 되므로 직접 분리해서 변환
+    try:
+        hour, minute, second = (int(part) for part in time_str.split(":"))
+        return dt_time(hour, minute, second).strftime("%p %I:%M")
+    except:
+        return time_str
+
+def app_data_path(filename):
+    """앱 데이터 디렉터리 안의 파일 경로 반환 (디렉터리가 없으면 생성)"""
+    base = QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
+    os.makedirs(base, exist_ok=True)
+    return os.path.join(base, filename)
+
+def display_messages(messages):
+    """표시용 메시지 목록 생성 (시간을 12시간 형식으로 변환한 사본)"""
+    return [dict(message, time=format_time_12h(message.get("time", ""))) for message in messages]
+
+class RegistrySettingsBackend:
+    """Windows 레지스트리 설정 백엔드"""
+
+    def load(self):
+        values = {}
+        try:
+            registry_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_READ)
+        except OSError:
+            return values
+        try:
+            index = 0
+            while True:
+                name, value, regtype = winreg.EnumValue(registry_key, index)
+                values[name] = value
+                index += 1
+        except OSError:
+            pass  # 더 이상 값이 없음
+        finally:
+            winreg.CloseKey(registry_key)
+        return values
+
+    def save(self, key, value):
+        save_to_registry(key, value)
+
+class FileSettingsBackend:
+    """JSON 파일 설정 백엔드 (Windows 이외 환경)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.values = {}
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.values = json.load(f)
+        except (OSError, ValueError):
+            self.values = {}
+        return dict(self.values)
+
+    def save(self, key, value):
+        self.values[key] = value
+        # 임시 파일에 쓴 뒤 교체해서 쓰는 도중 종료되어도 파일이 깨지지 않게 함
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.values, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            settings_log.error("Failed to save settings: %s", e)
+
+class SettingsService(QObject):
+    """설정 서비스 (시작 시 한 번 읽고 메모리에서 조회, 저장은 백그라운드로 기록)"""
+    valueChanged = Signal(str, str)
+
+    def __init__(self, backend, parent=None):
+        super().__init__(parent)
+        self.backend = backend
+        self.values = backend.load()
+
+        # 쓰기는 순서가 보장되도록 단일 스레드 풀에서 처리
+        self.writer = QThreadPool(self)
+        self.writer.setMaxThreadCount(1)
+
+    def value(self, key, default=None):
+        return self.values.get(key, default)
+
+    def setValue(self, key, value):
+        """값 변경 (메모리에 즉시 반영하고 백엔드 기록은 비동기로 처리)"""
+        if self.values.get(key) == value:
+            return
+        self.values[key] = value
+        self.writer.start(lambda: self.backend.save(key, value))
+        self.valueChanged.emit(key, value)
+
+    def sync(self):
+        """대기 중인 쓰기 완료까지 대기"""
+        self.writer.waitForDone()
+
+_settings = None
+
+def app_settings():
+    """앱 설정 서비스 반환 (처음 호출 시 생성)"""
+    global _settings
+    if _settings is None:
+        if winreg is not None:
+            backend = RegistrySettingsBackend()
+        else:
+            backend = FileSettingsBackend(app_data_path("settings.json"))
+        _settings = SettingsService(backend)
+    return _settings
+
+# 테마 팔레트 (스타일시트와 델리게이트가 함께 사용)
+THEMES = {
+    "light": {
+        "window_bg": "#FFFFFF",
+        "text": "#1D1C1D",
+        "muted_text": "#616061",
+        "border": "#BBBABB",
+        "separator": "#E8E8E8",
+        "focus": "#1264A3",
+        "highlight": "#E8F5FA",
+        "alt_row": "#F8F8F8",
+        "primary": "#007a5a",
+        "primary_hover": "#148567",
+        "sidebar_bg": "#3F0E40",
+        "sidebar_border": "#522653",
+        "sidebar_text": "#CFC3CF",
+        "sidebar_section": "#BCABBC",
+        "sidebar_title": "#FFFFFF",
+        "channel_text": "#1D1C1D",
+        "channel_hash": "#616061",
+        "channel_selected": "#1164A3",
+        "channel_hover": "rgba(0, 0, 0, 0.1)",
+    },
+    "dark": {
+        "window_bg": "#1A1D21",
+        "text": "#D1D2D3",
+        "muted_text": "#ABABAD",
+        "border": "#565856",
+        "separator": "#35373B",
+        "focus": "#1D9BD1",
+        "highlight": "#27343F",
+        "alt_row": "#222529",
+        "primary": "#007a5a",
+        "primary_hover": "#148567",
+        "sidebar_bg": "#19171D",
+        "sidebar_border": "#2E2C33",
+        "sidebar_text": "#ABABAD",
+        "sidebar_section": "#8E8D91",
+        "sidebar_title": "#FFFFFF",
+        "channel_text": "#D1D2D3",
+        "channel_hash": "#8E8D91",
+        "channel_selected": "#1164A3",
+        "channel_hover": "rgba(255, 255, 255, 0.1)",
+    },
+}
+
+# 앱 전체 스타일시트 (팔레트 값만 바꿔 테마 전환, 상태는 동적 속성 선택자로 표현)
+THEME_STYLESHEET = Template("""
+    QMainWindow, QDialog, QDockWidget {
+        background-color: $window_bg;
+        color: $text;
+    }
+    QSplitter::handle {
+        background-color: $separator;
+        width: 1px;
+    }
+    QLabel, QCheckBox, QGroupBox {
+        color: $text;
+        font-size: 14px;
+    }
+    QLineEdit, QComboBox, QDateEdit {
+        background-color: $window_bg;
+        color: $text;
+        border: 1px solid $border;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    QLineEdit:focus {
+        border: 1px solid $focus;
+    }
+    QPushButton {
+        background-color: $primary;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 12px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: $primary_hover;
+    }
+    QPushButton[variant="icon"] {
+        background: transparent;
+    }
+    QPushButton[variant="toolbar"] {
+        background: transparent;
+        color: $muted_text;
+    }
+    QPushButton[variant="header"] {
+        background: transparent;
+        color: $sidebar_title;
+        font-weight: bold;
+    }
+    QPushButton[variant="sidebarLink"] {
+        background: transparent;
+        color: $sidebar_text;
+        text-align: left;
+        padding: 5px 10px 5px 25px;
+        margin: 2px 8px;
+        font-size: 15px;
+    }
+    QTextEdit, QTableView, QTabWidget::pane {
+        background-color: $window_bg;
+        color: $text;
+        alternate-background-color: $alt_row;
+        border: none;
+        font-size: 14px;
+    }
+    QHeaderView::section {
+        background-color: $window_bg;
+        color: $muted_text;
+        border: none;
+        border-bottom: 1px solid $separator;
+        padding: 4px;
+    }
+    #workspaceSidebar {
+        background-color: $sidebar_bg;
+    }
+    #leftSidebar {
+        background-color: $sidebar_bg;
+        min-width: 220px;
+        max-width: 260px;
+    }
+    #workspaceHeader {
+        background-color: $sidebar_bg;
+        color: $sidebar_title;
+        font-weight: bold;
+        font-size: 18px;
+        padding: 10px;
+        border-bottom: 1px solid $sidebar_border;
+    }
+    #workspaceTitle {
+        color: $sidebar_title;
+        font-weight: bold;
+    }
+    #channelList {
+        background-color: $sidebar_bg;
+        border: none;
+    }
+    #searchBox {
+        background-color: rgba(255, 255, 255, 0.2);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 4px;
+        color: white;
+        padding: 5px 8px;
+        margin: 8px;
+    }
+    #sectionLabel {
+        color: $sidebar_section;
+        font-size: 13px;
+        font-weight: bold;
+        padding: 8px 10px;
+    }
+    #channelHeader {
+        background-color: $window_bg;
+        border-bottom: 1px solid $separator;
+        padding: 10px;
+    }
+    #channelTitle {
+        font-weight: bold;
+        font-size: 16px;
+    }
+    #messageInput {
+        border: 1px solid $border;
+        border-radius: 4px;
+        margin: 10px;
+        padding: 8px;
+    }
+    #messageArea {
+        background-color: $window_bg;
+        border: none;
+        padding: 10px;
+    }
+    #workspaceButton {
+        background-color: white;
+        color: #FFFFFF;
+        font-weight: bold;
+        font-size: 18px;
+        width: 60px;
+        height: 60px;
+        border-radius: 4px;
+        text-align: center;
+        margin: 5px;
+    }
+    #sidebarItem {
+        background: transparent;
+        padding: 5px 10px;
+        border-radius: 4px;
+        margin: 2px 8px;
+        color: $sidebar_text;
+        font-size: 15px;
+    }
+    #sidebarItem:hover {
+        background-color: rgba(255, 255, 255, 0.1);
+    }
+    #sidebarItem[active="true"] {
+        background-color: rgba(255, 255, 255, 0.2);
+    }
+    #bodyContainer {
+        background-color: $window_bg;
+    }
+""")
+
+class ThemeManager(QObject):
+    """앱 전체 테마 관리
+
+    스타일시트는 테마를 바꿀 때 한 번만 앱 전체에 적용하고, 위젯별 상태는
+    동적 속성(set_state)으로 바꾼다. 직접 그리는 델리게이트는 color()로 팔레트를 읽는다.
+    """
+    themeChanged = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name = None
+        self.palette = {}
+        self.colors = {}
+
+    def apply(self, name):
+        """테마 적용 (알 수 없는 이름이면 라이트 테마)"""
+        if name not in THEMES:
+            name = "light"
+        if name == self.name:
+            return
+        self.name = name
+        self.palette = THEMES[name]
+        self.colors = {}
+        QApplication.instance().setStyleSheet(THEME_STYLESHEET.substitute(self.palette))
+        self.themeChanged.emit(name)
+
+    def color(self, key):
+        """팔레트 색상 (QColor는 한 번만 만들어 재사용)"""
+        color = self.colors.get(key)
+        if color is None:
+            value = self.palette.get(key) or THEMES["light"][key]
+            match = re.fullmatch(r"rgba\((\d+), (\d+), (\d+), ([\d.]+)\)", value)
+            if match:
+                r, g, b, a = match.groups()
+                color = QColor(int(r), int(g), int(b), int(float(a) * 255))
+            else:
+                color = QColor(value)
+            self.colors[key] = color
+        return color
+
+_theme = None
+
+def app_theme():
+    """앱 테마 관리자 반환 (처음 호출 시 생성)"""
+    global _theme
+    if _theme is None:
+        _theme = ThemeManager()
+    return _theme
+
+def set_state(widget, name, value):
+    """동적 속성으로 위젯 상태 변경 (해당 위젯만 다시 스타일 적용)"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+class Histogram:
+    """구간별 관측 횟수를 세는 히스토그램 (구간 상한 이하인 값을 해당 구간에 집계)"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 상한 초과
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        index = 0
+        while index < len(self.buckets) and value > self.buckets[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """q 분위수가 속한 구간의 상한 (상한 초과 구간이면 최대값)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts))
+        }
+
+class MetricsRegistry:
+    """카운터, 게이지, 히스토그램 지표 저장소
+
+    WebSocket 워커 스레드와 GUI 스레드에서 함께 기록하므로 잠금으로 보호한다.
+    지표는 이름과 레이블(action 등)의 조합으로 구분한다. 수집기(collector)는
+    스냅샷을 만들 때마다 호출되어 대기열 길이 같은 게이지를 채운다.
+    """
+    PREFIX = "slackclone_"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}    # (name, labels) -> 값
+        self.gauges = {}      # (name, labels) -> 값
+        self.histograms = {}  # (name, labels) -> Histogram
+        self.collectors = []
+        self.started = time.time()
+
+    @staticmethod
+    def key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self.key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self.lock:
+            self.gauges[self.key(name, labels)] = value
+
+    def observe(self, name, value, **labels):
+        key = self.key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def addCollector(self, collector):
+        self.collectors.append(collector)
+
+    def collect(self):
+        for collector in self.collectors:
+            try:
+                collector(self)
+            except Exception as e:
+                metrics_log.exception("Metrics collector failed: %s", e)
+
+    def snapshot(self):
+        """모든 지표를 JSON으로 직렬화할 수 있는 dict로 반환"""
+        self.collect()
+
+        def entries(items, value):
+            return [{"name": name, "labels": dict(labels), "value": value(v)} for (name, labels), v in sorted(items)]
+
+        with self.lock:
+            return {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "uptime_sec": round(time.time() - self.started, 1),
+                "counters": entries(self.counters.items(), lambda v: v),
+                "gauges": entries(self.gauges.items(), lambda v: v),
+                "histograms": entries(self.histograms.items(), lambda h: h.snapshot())
+            }
+
+    def toJson(self):
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def toPrometheus(self):
+        """Prometheus 텍스트 형식으로 변환"""
+        snapshot = self.snapshot()
+
+        def escape(value):
+            return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        def series(name, labels, extra=None):
+            labels = dict(labels, **(extra or {}))
+            if not labels:
+                return self.PREFIX + name
+            text = ",".join(f'{k}="{escape(v)}"' for k, v in labels.items())
+            return f"{self.PREFIX}{name}{{{text}}}"
+
+        lines = []
+        declared = set()
+        for kind, items in (("counter", snapshot["counters"]), ("gauge", snapshot["gauges"])):
+            for item in items:
+                if item["name"] not in declared:
+                    declared.add(item["name"])
+                    lines.append(f"# TYPE {self.PREFIX}{item['name']} {kind}")
+                lines.append(f"{series(item['name'], item['labels'])} {item['value']}")
+        for item in snapshot["histograms"]:
+            name, labels, histogram = item["name"], item["labels"], item["value"]
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {self.PREFIX}{name} histogram")
+            cumulative = 0
+            for bound, count in histogram["buckets"].items():
+                cumulative += count
+                lines.append(f"{series(name + '_bucket', labels, {'le': bound})} {cumulative}")
+            lines.append(f"{series(name + '_sum', labels)} {histogram['sum']}")
+            lines.append(f"{series(name + '_count', labels)} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path, fmt="json"):
+        """지표를 파일로 저장 (다른 프로그램이 읽는 도중 덮어쓰지 않도록 임시 파일을 거침)"""
+        text = self.toPrometheus() if fmt == "prometheus" else self.toJson()
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            metrics_log.error("Failed to export metrics: %s", e, extra={"path": path})
+
+_metrics = None
+
+def app_metrics():
+    """앱 지표 저장소 반환 (처음 호출 시 생성)"""
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
+
+class StartupTimer:
+    """시작 단계별 소요 시간 기록
+
+    mark(phase)는 직전 mark 이후 걸린 시간을 그 단계의 시간으로 기록한다.
+    첫 화면을 그린 뒤 finish()로 로그와 지표(startup_phase_ms)에 보고한다.
+    """
+
+    def __init__(self, started=None, report_path=None):
+        self.started = started if started is not None else time.perf_counter()
+        self.last = self.started
+        self.phases = []
+        self.report_path = report_path  # 보고서를 저장할 JSON 파일 (--startup-report)
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.last) * 1000))
+        self.last = now
+
+    def report(self):
+        """단계별 시간과 전체 시간 (ms)"""
+        return {
+            "phases": {phase: round(ms, 2) for phase, ms in self.phases},
+            "total_ms": round((self.last - self.started) * 1000, 2)
+        }
+
+    def finish(self, metrics):
+        """시작 시간 보고 (로그, 지표, 지정된 경우 JSON 파일)"""
+        report = self.report()
+        for phase, ms in report["phases"].items():
+            metrics.set("startup_phase_ms", ms, phase=phase)
+        metrics.set("startup_total_ms", report["total_ms"])
+        ui_log.info("Startup finished in %.1f ms", report["total_ms"], extra=report)
+        if self.report_path:
+            try:
+                with open(self.report_path, "w", encoding="utf-8") as f:
+                    json.dump(report, f, ensure_ascii=False, indent=2)
+            except OSError as e:
+                ui_log.error("Failed to write startup report: %s", e, extra={"path": self.report_path})
+        return report
+
+# 한글 음절은 두 글자씩(bigram), 그 밖의 글자는 단어 단위로 색인
+HANGUL_RUN = re.compile(r"[\uac00-\ud7a3]+")
+TOKEN_RUN = re.compile(r"[\uac00-\ud7a3]+|[^\W_\uac00-\ud7a3\u3131-\u318e]+")
+
+def hangul_bigrams(run):
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+def search_terms(text):
+    """색인용 토큰 문자열 (조사가 붙은 한국어 단어도 부분 일치로 찾을 수 있게 bigram 사용)"""
+    terms = []
+    for run in TOKEN_RUN.findall(text.lower()):
+        if HANGUL_RUN.fullmatch(run):
+            terms.extend(hangul_bigrams(run))
+        else:
+            terms.append(run)
+    return " ".join(terms)
+
+def search_query(text):
+    """검색어를 FTS5 MATCH 식으로 변환 (각 단어는 접두어 일치, 모두 포함해야 함)
+
+    입력 중인 자모(예: '회ㅇ')는 무시한다. 검색할 단어가 없으면 None.
+    """
+    phrases = []
+    for run in TOKEN_RUN.findall(text.lower()):
+        terms = hangul_bigrams(run) if HANGUL_RUN.fullmatch(run) else [run]
+        phrases.append('"' + " ".join(terms) + '"*')
+    return " ".join(phrases) or None
+
+class MessageStore:
+    """워크스페이스, 채널, 메시지를 보관하는 로컬 SQLite 저장소
+
+    큰 페이지는 queueMessages()로 넣어 두고 writeQueued()로 조금씩 나누어 저장해
+    한 번에 오래 멈추지 않게 한다. 대기 중인 메시지는 아직 조회되지 않는다.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS workspaces (
+            name TEXT PRIMARY KEY
+        );
+        CREATE TABLE IF NOT EXISTS channels (
+            workspace TEXT NOT NULL,
+            name TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            PRIMARY KEY (workspace, name)
+        );
+        CREATE TABLE IF NOT EXISTS messages (
+            workspace TEXT NOT NULL,
+            channel TEXT NOT NULL,
+            id TEXT NOT NULL,
+            has_id INTEGER NOT NULL,
+            sort_key TEXT NOT NULL,
+            date TEXT,
+            time TEXT,
+            sender TEXT,
+            message TEXT,
+            PRIMARY KEY (workspace, channel, id)
+        );
+        CREATE INDEX IF NOT EXISTS messages_order ON messages (workspace, channel, sort_key);
+    """
+    # 메시지 본문 검색 색인 (rowid = messages.rowid, terms = search_terms(message))
+    INDEX_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS message_index USING fts5(terms, tokenize='unicode61')"
+    INDEX_VERSION = 1
+    ROWID_QUERY_CHUNK = 500  # 색인할 메시지의 rowid를 한 번에 조회할 개수
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.searchEnabled = self.initSearchIndex()
+        self.pendingWrites = deque()  # 나누어 저장할 [workspace, channel, messages, 저장한 개수]
+
+    def initSearchIndex(self):
+        """검색 색인 생성 (FTS5가 없는 SQLite면 로컬 검색 없이 서버 검색만 사용)"""
+        try:
+            self.conn.execute(self.INDEX_SCHEMA)
+        except sqlite3.OperationalError as e:
+            store_log.warning("Local search disabled: %s", e)
+            return False
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < self.INDEX_VERSION:
+            self.rebuildSearchIndex()
+        return True
+
+    def rebuildSearchIndex(self):
+        """저장된 모든 메시지로 검색 색인 다시 생성"""
+        with self.conn:
+            self.conn.execute("DELETE FROM message_index")
+            self.conn.executemany(
+                "INSERT INTO message_index (rowid, terms) VALUES (?, ?)",
+                ((rowid, search_terms(text or "")) for rowid, text in
+                 self.conn.execute("SELECT rowid, message FROM messages").fetchall())
+            )
+            self.conn.execute(f"PRAGMA user_version = {self.INDEX_VERSION}")
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    @staticmethod
+    def messageKey(message):
+        """메시지의 저장 키와 정렬 키 계산"""
+        message_id = message.get("id")
+        date = message.get("date", "")
+        time = message.get("time", "")
+        if message_id is None:
+            # ID가 없는 메시지는 내용 해시로 중복 저장 방지
+            digest = hashlib.sha1(f"{date}|{time}|{message.get('sender', '')}|{message.get('message', '')}".encode("utf-8")).hexdigest()
+            return f"h:{digest}", False, f"{date} {'':>20} {time}"
+        # 숫자 ID는 자릿수를 맞춰 문자열 정렬과 순서를 일치시킴
+        seq = f"{message_id:>20}" if isinstance(message_id, int) else str(message_id)
+        return str(message_id), True, f"{date} {seq} {time}"
+
+    @staticmethod
+    def rowToMessage(row):
+        message_id, has_id, date, time, sender, text = row
+        if has_id and message_id.isdigit():
+            message_id = int(message_id)
+        return {
+            "id": message_id if has_id else None,
+            "date": date,
+            "time": time,
+            "sender": sender,
+            "message": text
+        }
+
+    def saveWorkspaces(self, workspace_list):
+        """워크스페이스 목록과 각 채널 목록 저장"""
+        with self.conn:
+            self.conn.execute("DELETE FROM workspaces")
+            self.conn.executemany("INSERT INTO workspaces (name) VALUES (?)", [(ws,) for ws in workspace_list])
+        for workspace, channels in workspace_list.items():
+            if channels:
+                self.saveChannels(workspace, channels)
+
+    def saveChannels(self, workspace, channels):
+        """워크스페이스의 채널 목록 저장"""
+        with self.conn:
+            self.conn.execute("DELETE FROM channels WHERE workspace = ?", (workspace,))
+            self.conn.executemany(
+                "INSERT INTO channels (workspace, name, position) VALUES (?, ?, ?)",
+                [(workspace, channel, i) for i, channel in enumerate(channels)]
+            )
+
+    def loadWorkspaces(self):
+        """저장된 워크스페이스별 채널 목록 반환"""
+        workspace_list = {ws: [] for (ws,) in self.conn.execute("SELECT name FROM workspaces ORDER BY rowid")}
+        for workspace, channel in self.conn.execute("SELECT workspace, name FROM channels ORDER BY workspace, position"):
+            workspace_list.setdefault(workspace, []).append(channel)
+        return workspace_list
+
+    def saveMessages(self, workspace, channel, messages):
+        """메시지 저장 (이미 있는 메시지는 갱신하고 검색 색인도 함께 갱신)"""
+        rows = []
+        for message in messages:
+            key, has_id, sort_key = self.messageKey(message)
+            rows.append((workspace, channel, key, int(has_id), sort_key,
+                         message.get("date", ""), message.get("time", ""),
+                         message.get("sender", ""), message.get("message", "")))
+        with self.conn:
+            # UPSERT는 rowid를 유지하므로 색인 행과의 연결이 끊기지 않음
+            self.conn.executemany(
+                "INSERT INTO messages (workspace, channel, id, has_id, sort_key, date, time, sender, message) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (workspace, channel, id) DO UPDATE SET has_id = excluded.has_id, "
+                "sort_key = excluded.sort_key, date = excluded.date, time = excluded.time, "
+                "sender = excluded.sender, message = excluded.message",
+                rows
+            )
+            if self.searchEnabled:
+                rowids = self.rowidsOf(workspace, channel, [row[2] for row in rows])
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO message_index (rowid, terms) VALUES (?, ?)",
+                    ((rowids[row[2]], search_terms(row[8] or "")) for row in rows)
+                )
+
+    def rowidsOf(self, workspace, channel, keys):
+        """메시지 키별 rowid (SQLite 변수 개수 제한에 맞춰 나누어 조회)"""
+        rowids = {}
+        for i in range(0, len(keys), self.ROWID_QUERY_CHUNK):
+            chunk = keys[i:i + self.ROWID_QUERY_CHUNK]
+            rowids.update(self.conn.execute(
+                f"SELECT id, rowid FROM messages WHERE workspace = ? AND channel = ? "
+                f"AND id IN ({', '.join('?' * len(chunk))})",
+                [workspace, channel, *chunk]
+            ))
+        return rowids
+
+    def queueMessages(self, workspace, channel, messages):
+        """나누어 저장할 메시지 추가 (writeQueued 호출 시 순서대로 저장)"""
+        if messages:
+            self.pendingWrites.append([workspace, channel, list(messages), 0])
+
+    def writeQueued(self, max_messages=STORE_WRITE_CHUNK):
+        """대기 중인 메시지를 최대 max_messages개 저장 (남은 메시지가 있으면 True)"""
+        while self.pendingWrites and max_messages > 0:
+            entry = self.pendingWrites[0]
+            workspace, channel, messages, offset = entry
+            chunk = messages[offset:offset + max_messages]
+            entry[3] = offset + len(chunk)
+            if entry[3] >= len(messages):
+                self.pendingWrites.popleft()
+            self.saveMessages(workspace, channel, chunk)
+            max_messages -= len(chunk)
+        return bool(self.pendingWrites)
+
+    def flush(self):
+        """대기 중인 메시지를 모두 저장"""
+        while self.writeQueued():
+            pass
+
+    def search(self, query, workspace=None, channel=None, sender=None, date_from=None, date_to=None,
+               limit=LOCAL_SEARCH_LIMIT):
+        """저장된 메시지 검색 (최신 순, 서버 검색 결과와 같은 형식)"""
+        match = search_query(query or "")
+        if not self.searchEnabled or match is None:
+            return []
+        sql = ("SELECT m.workspace, m.channel, m.id, m.has_id, m.date, m.time, m.sender, m.message "
+               "FROM message_index JOIN messages m ON m.rowid = message_index.rowid "
+               "WHERE message_index MATCH ?")
+        args = [match]
+        for column, op, value in (("workspace", "=", workspace), ("channel", "=", channel),
+                                  ("date", ">=", date_from), ("date", "<=", date_to)):
+            if value:
+                sql += f" AND m.{column} {op} ?"
+                args.append(value)
+        if sender:
+            sql += " AND m.sender LIKE ?"
+            args.append(f"%{sender}%")
+        sql += " ORDER BY m.date DESC, m.sort_key DESC LIMIT ?"
+        args.append(limit)
+
+        results = []
+        for row in self.conn.execute(sql, args):
+            result = self.rowToMessage(row[2:])
+            result["workspace"] = row[0]
+            result["channel"] = row[1]
+            results.append(result)
+        return results
+
+    def loadLatest(self, workspace, channel, limit):
+        """가장 최근 메시지 limit개를 오래된 순으로 반환"""
+        rows = self.conn.execute(
+            "SELECT id, has_id, date, time, sender, message FROM messages "
+            "WHERE workspace = ? AND channel = ? ORDER BY sort_key DESC LIMIT ?",
+            (workspace, channel, limit)
+        ).fetchall()
+        return [self.rowToMessage(row) for row in reversed(rows)]
+
+    def loadBefore(self, workspace, channel, before_id, limit):
+        """before_id 메시지보다 오래된 메시지 limit개를 오래된 순으로 반환"""
+        rows = self.conn.execute(
+            "SELECT id, has_id, date, time, sender, message FROM messages "
+            "WHERE workspace = ? AND channel = ? AND sort_key < "
+            "(SELECT sort_key FROM messages WHERE workspace = ? AND channel = ? AND id = ?) "
+            "ORDER BY sort_key DESC LIMIT ?",
+            (workspace, channel, workspace, channel, str(before_id), limit)
+        ).fetchall()
+        return [self.rowToMessage(row) for row in reversed(rows)]
+
+    def lastMessageId(self, workspace, channel):
+        """서버 ID가 있는 가장 최근 메시지의 ID 반환 (증분 동기화 커서)"""
+        row = self.conn.execute(
+            "SELECT id, has_id, date, time, sender, message FROM messages "
+            "WHERE workspace = ? AND channel = ? AND has_id = 1 ORDER BY sort_key DESC LIMIT 1",
+            (workspace, channel)
+        ).fetchone()
+        return self.rowToMessage(row)["id"] if row else None
+
 class SearchDialog(QDialog):
     def __init__(self, parent=None, workspaces=None, channels=None, current_workspace=None, current_channel=None):
         super().__init__(parent)
@@ -59,6 +1056,7 @@ class SearchDialog(QDialog):
         self.current_channel = current_channel
         
         self.initUI()
+        self.setChoices(self.workspaces, self.channels, current_workspace, current_channel)
         
     def initUI(self):
         layout = QVBoxLayout(self)
@@ -73,26 +1071,10 @@ class SearchDialog(QDialog):
         
         # 워크스페이스 선택
         self.workspaceCombo = QComboBox()
-        self.workspaceCombo.addItem("모든 워크스페이스")
-        if self.workspaces:
-            for workspace in self.workspaces:
-                self.workspaceCombo.addItem(workspace)
-        if self.current_workspace:
-            index = self.workspaceCombo.findText(self.current_workspace)
-            if index >= 0:
-                self.workspaceCombo.setCurrentIndex(index)
         formLayout.addRow("워크스페이스:", self.workspaceCombo)
         
         # 채널 선택
         self.channelCombo = QComboBox()
-        self.channelCombo.addItem("모든 채널")
-        if self.channels:
-            for channel in self.channels:
-                self.channelCombo.addItem(channel)
-        if self.current_channel:
-            index = self.channelCombo.findText(self.current_channel)
-            if index >= 0:
-                self.channelCombo.setCurrentIndex(index)
         formLayout.addRow("채널:", self.channelCombo)
         
         # 보낸 사람 입력
@@ -138,6 +1120,29 @@ class SearchDialog(QDialog):
         layout.addLayout(formLayout)
         layout.addLayout(buttonLayout)
         
+    def setChoices(self, workspaces, channels, current_workspace=None, current_channel=None):
+        """워크스페이스/채널 선택 목록 갱신 (대화상자를 다시 열 때 사용)"""
+        self.workspaces = workspaces or []
+        self.channels = channels or []
+        self.current_workspace = current_workspace
+        self.current_channel = current_channel
+
+        self.workspaceCombo.clear()
+        self.workspaceCombo.addItem("모든 워크스페이스")
+        self.workspaceCombo.addItems(self.workspaces)
+        if current_workspace:
+            index = self.workspaceCombo.findText(current_workspace)
+            if index >= 0:
+                self.workspaceCombo.setCurrentIndex(index)
+
+        self.channelCombo.clear()
+        self.channelCombo.addItem("모든 채널")
+        self.channelCombo.addItems(self.channels)
+        if current_channel:
+            index = self.channelCombo.findText(current_channel)
+            if index >= 0:
+                self.channelCombo.setCurrentIndex(index)
+
     def toggleDateRange(self, checked):
         self.fromDate.setEnabled(checked)
         self.toDate.setEnabled(checked)
@@ -166,30 +1171,155 @@ class SearchDialog(QDialog):
             
         return params
 
-class SearchResultsDialog(QDialog):
+class SearchResultsModel(QAbstractTableModel):
+    """검색 결과 테이블 모델
+
+    결과 dict를 그대로 보관하고 화면에 보이는 칸만 그때그때 만든다. 서버에 남은 결과가
+    있으면 canFetchMore/fetchMore로 다음 페이지를 요청하고, 정렬은 모델에서 처리한다.
+    """
+    fetchRequested = Signal()
+    COLUMNS = [
+        ("date", "날짜"), ("time", "시간"), ("workspace", "워크스페이스"),
+        ("channel", "채널"), ("sender", "보낸 사람"), ("message", "메시지")
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results = []
+        self.keys = set()
+        self.moreAvailable = False
+        self.sortColumn = -1
+        self.sortOrder = Qt.AscendingOrder
+
+    @staticmethod
+    def resultKey(result):
+        """로컬 결과와 서버 결과에서 같은 메시지를 찾기 위한 키"""
+        key, _, _ = MessageStore.messageKey(result)
+        return (result.get("workspace", ""), result.get("channel", ""), key)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        result = self.results[index.row()]
+        field = self.COLUMNS[index.column()][0]
+        if role == Qt.DisplayRole:
+            text = result.get(field, "")
+            # 메시지가 너무 길면 truncate
+            if field == "message" and len(text) > 100:
+                text = text[:97] + "..."
+            return text
+        if role == Qt.ToolTipRole and field == "message":
+            return result.get("message", "")
+        if role == Qt.UserRole:
+            return result
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section][1]
+        return None
+
+    def clear(self):
+        self.beginResetModel()
+        self.results = []
+        self.keys.clear()
+        self.moreAvailable = False
+        self.endResetModel()
+
+    def addResults(self, results):
+        """이미 있는 메시지를 제외하고 결과 추가 (정렬 중이면 정렬 순서 유지)"""
+        new_results = []
+        for result in results:
+            key = self.resultKey(result)
+            if key not in self.keys:
+                self.keys.add(key)
+                new_results.append(result)
+        if not new_results:
+            return 0
+        if self.sortColumn >= 0:
+            self.layoutAboutToBeChanged.emit()
+            self.results.extend(new_results)
+            self.sortResults()
+            self.layoutChanged.emit()
+        else:
+            first = len(self.results)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_results) - 1)
+            self.results.extend(new_results)
+            self.endInsertRows()
+        return len(new_results)
+
+    def setMoreAvailable(self, available):
+        self.moreAvailable = available
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.moreAvailable
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self.moreAvailable = False  # 응답이 올 때까지 중복 요청 방지
+            self.fetchRequested.emit()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sortColumn = column
+        self.sortOrder = order
+        self.layoutAboutToBeChanged.emit()
+        self.sortResults()
+        self.layoutChanged.emit()
+
+    def sortResults(self):
+        field = self.COLUMNS[self.sortColumn][0]
+        if field in ("date", "time"):
+            key = lambda r: (r.get("date", ""), r.get("time", ""))
+        else:
+            key = lambda r: (r.get(field, ""), r.get("date", ""), r.get("time", ""))
+        self.results.sort(key=key, reverse=(self.sortOrder == Qt.DescendingOrder))
+
+class SearchResultsPanel(QWidget):
+    """검색 결과 목록 (검색 결과 창과 빠른 검색 패널에서 함께 사용)"""
     messageSelected = Signal(dict)
-    
-    def __init__(self, parent=None, results=None):
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setWindowTitle("검색 결과")
-        self.setMinimumSize(800, 600)
-        self.results = results or []
-        
+        self.query = ""
+        self.loading = False
+        self.nextPage = None  # 다음 서버 결과 페이지를 요청하는 함수
+
         self.initUI()
-        self.populateResults()
-        
+
+    @property
+    def results(self):
+        return self.model.results
+
     def initUI(self):
         layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
         
         # 결과 수 표시
-        self.resultCountLabel = QLabel(f"검색 결과: {len(self.results)}개")
+        self.resultCountLabel = QLabel("검색 결과: 0개")
         layout.addWidget(self.resultCountLabel)
         
         # 결과 목록
-        self.resultsList = QTreeWidget()
-        self.resultsList.setHeaderLabels(["날짜", "시간", "워크스페이스", "채널", "보낸 사람", "메시지"])
+        self.model = SearchResultsModel(self)
+        self.model.fetchRequested.connect(self.fetchNextPage)
+        # QTreeView는 배치할 때 fetchMore를 바로 호출하므로 스크롤할 때만 요청하는 QTableView 사용
+        self.resultsList = QTableView()
+        self.resultsList.setModel(self.model)
         self.resultsList.setAlternatingRowColors(True)
-        self.resultsList.itemDoubleClicked.connect(self.onItemDoubleClicked)
+        self.resultsList.setShowGrid(False)
+        self.resultsList.setWordWrap(False)
+        self.resultsList.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.resultsList.verticalHeader().hide()
+        self.resultsList.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 6)
+        self.resultsList.horizontalHeader().setStretchLastSection(True)
+        self.resultsList.setSortingEnabled(True)
+        self.resultsList.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.resultsList.doubleClicked.connect(self.onItemDoubleClicked)
         
         # 열 너비 설정
         self.resultsList.setColumnWidth(0, 100)  # 날짜
@@ -199,6 +1329,66 @@ class SearchResultsDialog(QDialog):
         self.resultsList.setColumnWidth(4, 120)  # 보낸 사람
         
         layout.addWidget(self.resultsList)
+
+    def setQuery(self, query):
+        """새 검색 시작 (이전 결과 제거)"""
+        self.query = query
+        self.nextPage = None
+        self.model.clear()
+        self.setLoading(True)
+
+    def setLoading(self, loading):
+        """서버 결과를 기다리는 중인지 표시"""
+        self.loading = loading
+        self.updateCountLabel()
+
+    def setNextPage(self, request):
+        """스크롤이 끝에 닿으면 호출할 다음 페이지 요청 (없으면 None)"""
+        self.nextPage = request
+        self.model.setMoreAvailable(request is not None)
+        self.updateCountLabel()
+
+    def fetchNextPage(self):
+        request, self.nextPage = self.nextPage, None
+        if request is not None:
+            self.setLoading(True)
+            request()
+
+    def updateCountLabel(self):
+        text = f"검색 결과: {len(self.model.results)}개"
+        if self.loading:
+            text += " (서버 검색 중...)"
+        elif self.nextPage is not None:
+            text += " (스크롤하면 더 보기)"
+        self.resultCountLabel.setText(text)
+
+    def addResults(self, results):
+        """이미 표시한 메시지를 제외하고 결과 추가 (로컬 결과 뒤에 서버 결과 병합)"""
+        self.model.addResults(results)
+        self.updateCountLabel()
+
+    def onItemDoubleClicked(self, index):
+        result_data = index.data(Qt.UserRole)
+        if result_data:
+            self.messageSelected.emit(result_data)
+
+class SearchResultsDialog(QDialog):
+    messageSelected = Signal(dict)
+    
+    def __init__(self, parent=None, results=None):
+        super().__init__(parent)
+        self.setWindowTitle("검색 결과")
+        self.setMinimumSize(800, 600)
+        
+        self.initUI()
+        self.panel.addResults(results or [])
+        
+    def initUI(self):
+        layout = QVBoxLayout(self)
+        
+        self.panel = SearchResultsPanel(self)
+        self.panel.messageSelected.connect(self.messageSelected)
+        layout.addWidget(self.panel)
         
         # 닫기 버튼
         buttonLayout = QHBoxLayout()
@@ -209,41 +1399,16 @@ class SearchResultsDialog(QDialog):
         buttonLayout.addWidget(self.closeButton)
         
         layout.addLayout(buttonLayout)
-        
-    def populateResults(self):
-        self.resultsList.clear()
-        
-        for result in self.results:
-            item = QTreeWidgetItem()
-            item.setText(0, result.get("date", ""))
-            item.setText(1, result.get("time", ""))
-            item.setText(2, result.get("workspace", ""))
-            item.setText(3, result.get("channel", ""))
-            item.setText(4, result.get("sender", ""))
-            
-            # 메시지가 너무 길면 truncate
-            message = result.get("message", "")
-            if len(message) > 100:
-                message = message[:97] + "..."
-            item.setText(5, message)
-            
-            # 원본 데이터 저장
-            item.setData(0, Qt.UserRole, result)
-            
-            self.resultsList.addTopLevelItem(item)
-            
-    def onItemDoubleClicked(self, item, column):
-        result_data = item.data(0, Qt.UserRole)
-        if result_data:
-            self.messageSelected.emit(result_data)
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("설정")
         self.setFixedSize(400, 300)
+        self.settings = app_settings()
         
         self.initUI()
+        self.loadSettings()
         
     def initUI(self):
         layout = QVBoxLayout(self)
@@ -256,11 +1421,9 @@ class SettingsDialog(QDialog):
         userLayout = QFormLayout(userTab)
         
         self.usernameEdit = QLineEdit()
-        self.usernameEdit.setText(load_from_registry("username") or "")
         userLayout.addRow("사용자 이름:", self.usernameEdit)
         
         self.emailEdit = QLineEdit()
-        self.emailEdit.setText(load_from_registry("email") or "")
         userLayout.addRow("이메일:", self.emailEdit)
         
         # 서버 탭
@@ -268,7 +1431,6 @@ class SettingsDialog(QDialog):
         serverLayout = QFormLayout(serverTab)
         
         self.serverUrlEdit = QLineEdit()
-        self.serverUrlEdit.setText(load_from_registry("server_url") or SERVER_URL)
         serverLayout.addRow("서버 URL:", self.serverUrlEdit)
         
         # 알림 탭
@@ -276,19 +1438,26 @@ class SettingsDialog(QDialog):
         notificationLayout = QVBoxLayout(notificationTab)
         
         self.desktopNotifications = QCheckBox("데스크톱 알림 사용")
-        self.desktopNotifications.setChecked(load_from_registry("desktop_notifications") == "true")
-        
         self.soundNotifications = QCheckBox("소리 알림 사용")
-        self.soundNotifications.setChecked(load_from_registry("sound_notifications") == "true")
         
         notificationLayout.addWidget(self.desktopNotifications)
         notificationLayout.addWidget(self.soundNotifications)
         notificationLayout.addStretch()
         
+        # 화면 탭
+        displayTab = QWidget()
+        displayLayout = QFormLayout(displayTab)
+        
+        self.themeCombo = QComboBox()
+        self.themeCombo.addItem("라이트", "light")
+        self.themeCombo.addItem("다크", "dark")
+        displayLayout.addRow("테마:", self.themeCombo)
+        
         # 탭 추가
         self.tabWidget.addTab(userTab, "사용자 정보")
         self.tabWidget.addTab(serverTab, "서버 설정")
         self.tabWidget.addTab(notificationTab, "알림 설정")
+        self.tabWidget.addTab(displayTab, "화면 설정")
         
         layout.addWidget(self.tabWidget)
         
@@ -297,132 +1466,817 @@ class SettingsDialog(QDialog):
         self.buttonBox.accepted.connect(self.saveSettings)
         self.buttonBox.rejected.connect(self.reject)
         layout.addWidget(self.buttonBox)
+
+    def loadSettings(self):
+        """현재 설정 값을 입력란에 채움 (대화상자를 다시 열 때 사용)"""
+        self.usernameEdit.setText(self.settings.value("username") or "")
+        self.emailEdit.setText(self.settings.value("email") or "")
+        self.serverUrlEdit.setText(self.settings.value("server_url") or SERVER_URL)
+        self.desktopNotifications.setChecked(self.settings.value("desktop_notifications") == "true")
+        self.soundNotifications.setChecked(self.settings.value("sound_notifications") == "true")
+        index = self.themeCombo.findData(self.settings.value("theme") or "light")
+        self.themeCombo.setCurrentIndex(max(index, 0))
         
     def saveSettings(self):
         # 사용자 설정 저장
         username = self.usernameEdit.text().strip()
         if username:
-            save_to_registry("username", username)
+            self.settings.setValue("username", username)
             
         email = self.emailEdit.text().strip()
-        save_to_registry("email", email)
+        self.settings.setValue("email", email)
         
         # 서버 설정 저장
         server_url = self.serverUrlEdit.text().strip()
         if server_url:
-            save_to_registry("server_url", server_url)
+            self.settings.setValue("server_url", server_url)
             
         # 알림 설정 저장
-        save_to_registry("desktop_notifications", "true" if self.desktopNotifications.isChecked() else "false")
-        save_to_registry("sound_notifications", "true" if self.soundNotifications.isChecked() else "false")
+        self.settings.setValue("desktop_notifications", "true" if self.desktopNotifications.isChecked() else "false")
+        self.settings.setValue("sound_notifications", "true" if self.soundNotifications.isChecked() else "false")
         
+        # 화면 설정 저장
+        self.settings.setValue("theme", self.themeCombo.currentData())
+
         self.accept()
 
+class MetricsDialog(QDialog):
+    """성능 지표 디버그 패널 (Ctrl+Shift+M)
+
+    열려 있는 동안 1초마다 지표를 다시 읽고, 주기적으로 내보낼 파일과 형식을 설정한다.
+    """
+
+    def __init__(self, metrics, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("성능 지표")
+        self.resize(720, 560)
+        self.metrics = metrics
+        self.settings = app_settings()
+
+        layout = QVBoxLayout(self)
+
+        topLayout = QHBoxLayout()
+        self.formatCombo = QComboBox()
+        self.formatCombo.addItem("JSON", "json")
+        self.formatCombo.addItem("Prometheus", "prometheus")
+        index = self.formatCombo.findData(self.settings.value("metrics_export_format") or "json")
+        self.formatCombo.setCurrentIndex(max(index, 0))
+        self.formatCombo.currentIndexChanged.connect(self.onFormatChanged)
+        topLayout.addWidget(QLabel("형식:"))
+        topLayout.addWidget(self.formatCombo)
+        topLayout.addStretch()
+        layout.addLayout(topLayout)
+
+        self.textView = QPlainTextEdit()
+        self.textView.setReadOnly(True)
+        self.textView.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        layout.addWidget(self.textView, 1)
+
+        exportLayout = QHBoxLayout()
+        self.exportPathEdit = QLineEdit(self.settings.value("metrics_export_path") or "")
+        self.exportPathEdit.setPlaceholderText(f"{METRICS_EXPORT_INTERVAL_SEC}초마다 내보낼 파일 (비우면 내보내지 않음)")
+        self.exportPathEdit.editingFinished.connect(self.onExportPathChanged)
+        browseButton = QPushButton("찾아보기")
+        browseButton.clicked.connect(self.browseExportPath)
+        exportLayout.addWidget(QLabel("내보내기:"))
+        exportLayout.addWidget(self.exportPathEdit, 1)
+        exportLayout.addWidget(browseButton)
+        layout.addLayout(exportLayout)
+
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setInterval(1000)
+        self.refreshTimer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refreshTimer.start()
+
+    def hideEvent(self, event):
+        self.refreshTimer.stop()
+        super().hideEvent(event)
+
+    @Slot()
+    def refresh(self):
+        # 스크롤 위치를 유지한 채 내용만 교체
+        scroll = self.textView.verticalScrollBar().value()
+        if self.formatCombo.currentData() == "prometheus":
+            self.textView.setPlainText(self.metrics.toPrometheus())
+        else:
+            self.textView.setPlainText(self.metrics.toJson())
+        self.textView.verticalScrollBar().setValue(scroll)
+
+    def onFormatChanged(self):
+        self.settings.setValue("metrics_export_format", self.formatCombo.currentData())
+        self.refresh()
+
+    def onExportPathChanged(self):
+        self.settings.setValue("metrics_export_path", self.exportPathEdit.text().strip())
+
+    def browseExportPath(self):
+        path, _ = QFileDialog.getSaveFileName(self, "지표 내보내기", self.exportPathEdit.text())
+        if path:
+            self.exportPathEdit.setText(path)
+            self.onExportPathChanged()
+
+# 수신 프레임 action별 필드 형식 (워커 스레드에서 검증)
+FRAME_SCHEMAS = {
+    "channel_data": {"message": list},
+    "workspace_list": {"message": dict},
+    "workspace_update": {"message": dict},
+    "channel_list": {"message": list},
+    "channel_update": {"message": list},
+    "search_response": {"results": list},
+    "bootstrap_response": {"registration": dict, "workspaces": dict, "channel_data": dict},
+}
+
+class Frame:
+    """디코딩과 검증을 마친 수신 프레임"""
+    __slots__ = ("action", "data", "size")
+
+    def __init__(self, action, data, size=0):
+        self.action = action
+        self.data = data
+        self.size = size  # 원본 프레임 크기 (텍스트는 문자 수, 바이너리는 바이트 수)
+
+    def __repr__(self):
+        return f"Frame({self.action!r}, size={self.size})"
+
+class WireCodec:
+    """WebSocket 프레임 인코딩
+
+    텍스트 프레임은 항상 JSON이고, hello 핸드셰이크로 서버와 합의한 경우에만
+    바이너리 프레임을 쓴다. 바이너리 프레임은 첫 바이트가 플래그(0x01 = zlib 압축)이고
+    나머지가 합의한 인코딩(msgpack, cbor, json)의 본문이다.
+    """
+
+    FLAG_COMPRESSED = 0x01
+
+    def __init__(self, encoding="json", compression=None):
+        self.encoding = encoding
+        self.compression = compression
+
+    @property
+    def binary(self):
+        return self.encoding != "json" or self.compression is not None
+
+    @staticmethod
+    def supportedEncodings():
+        """선호 순서대로 사용 가능한 인코딩 목록"""
+        encodings = []
+        if msgpack is not None:
+            encodings.append("msgpack")
+        if cbor2 is not None:
+            encodings.append("cbor")
+        encodings.append("json")
+        return encodings
+
+    @staticmethod
+    def supportedCompressions():
+        return ["zlib"]
+
+    def dumps(self, data):
+        if self.encoding == "msgpack":
+            return msgpack.packb(data, use_bin_type=True)
+        if self.encoding == "cbor":
+            return cbor2.dumps(data)
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, body):
+        if self.encoding == "msgpack":
+            return msgpack.unpackb(body, raw=False)
+        if self.encoding == "cbor":
+            return cbor2.loads(body)
+        return json.loads(body)
+
+    def encode(self, data):
+        """dict를 바이너리 프레임으로 인코딩"""
+        body = self.dumps(data)
+        if self.compression == "zlib" and len(body) >= COMPRESS_MIN_BYTES:
+            return bytes([self.FLAG_COMPRESSED]) + zlib.compress(body)
+        return b"\x00" + body
+
+    def decode(self, payload):
+        """바이너리 프레임을 dict로 디코딩 (형식이 잘못되면 ValueError)"""
+        if not payload:
+            raise ValueError("empty binary frame")
+        body = payload[1:]
+        if payload[0] & self.FLAG_COMPRESSED:
+            try:
+                body = zlib.decompress(body)
+            except zlib.error as e:
+                raise ValueError(f"bad compressed frame: {e}")
+        try:
+            return self.loads(body)
+        except ValueError:
+            raise
+        except Exception as e:  # msgpack/cbor 디코딩 오류 형식이 라이브러리마다 다름
+            raise ValueError(f"bad {self.encoding} frame: {e}")
+
+def decode_frame(message, codec=None):
+    """수신 프레임을 Frame으로 디코딩 (형식이 잘못되면 ValueError)
+
+    텍스트 프레임은 JSON으로, 바이너리 프레임은 합의한 codec으로 디코딩한다.
+    """
+    if isinstance(message, (bytes, bytearray)):
+        data = (codec or WireCodec()).decode(bytes(message))
+    else:
+        data = json.loads(message)
+    if not isinstance(data, dict):
+        raise ValueError("frame is not an object")
+
+    action = data.get("action")
+    for field, field_type in FRAME_SCHEMAS.get(action, {}).items():
+        if field in data and not isinstance(data[field], field_type):
+            raise ValueError(f"'{action}' field '{field}' must be {field_type.__name__}")
+
+    return Frame(action, data, len(message))
+
+class Outbox:
+    """WebSocket 전송 대기열
+
+    연결이 끊긴 동안의 프레임을 순서대로 보관했다가 재연결 시 전송한다.
+    사용자 메시지(client_msg_id가 있는 프레임)는 서버 확인(ack)까지 디스크에
+    보존하고, 시간 안에 확인이 오지 않으면 재전송한다.
+    """
+
+    def __init__(self, path=None, max_frames=OUTBOX_MAX_FRAMES):
+        self.path = path
+        self.max_frames = max_frames
+        self.queue = deque()           # 미전송 프레임 (frame, client_msg_id)
+        self.inflight = OrderedDict()  # client_msg_id -> {"frame", "sent_at", "attempts"}
+        self.acksSupported = False     # 서버가 ack를 보내는 것을 확인한 뒤에만 재전송
+        self.load()
+
+    @staticmethod
+    def describe(frame):
+        """프레임의 action과 client_msg_id 반환"""
+        try:
+            data = json.loads(frame)
+            return data.get("action"), data.get("client_msg_id")
+        except (ValueError, AttributeError):
+            return None, None
+
+    def load(self):
+        """이전 실행에서 전송하지 못한 사용자 메시지 복원"""
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.acksSupported = saved.get("acks_supported", False)
+        for entry in saved.get("messages", []):
+            self.queue.append((entry["frame"], entry["client_msg_id"]))
+
+    def save(self):
+        """확인되지 않은 사용자 메시지를 디스크에 기록"""
+        if not self.path:
+            return
+        messages = [{"frame": entry["frame"], "client_msg_id": cid} for cid, entry in self.inflight.items()]
+        messages += [{"frame": frame, "client_msg_id": cid} for frame, cid in self.queue if cid]
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"acks_supported": self.acksSupported, "messages": messages}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            net_log.error("Failed to save outbox: %s", e)
+
+    def enqueue(self, frame, client_msg_id=None):
+        """프레임을 대기열에 추가 (한도를 넘으면 가장 오래된 프레임을 버리고 반환)"""
+        dropped = []
+        while len(self.queue) >= self.max_frames:
+            dropped.append(self.queue.popleft())
+        self.queue.append((frame, client_msg_id))
+        if client_msg_id or any(cid for _, cid in dropped):
+            self.save()
+        return dropped
+
+    def markSent(self, frame, client_msg_id, save=True):
+        """사용자 메시지 전송 기록 (ack 대기, 처음 보낸 메시지는 save가 참이면 바로 디스크에 기록)"""
+        if not self.acksSupported:
+            return  # ack를 보내지 않는 서버는 전송으로 완료 처리
+        entry = self.inflight.get(client_msg_id)
+        attempts = entry["attempts"] + 1 if entry else 1
+        self.inflight[client_msg_id] = {"frame": frame, "sent_at": time.monotonic(), "attempts": attempts}
+        if entry is None and save:
+            self.save()
+
+    def ack(self, client_msg_id):
+        """서버 확인 처리 (대기 중이던 메시지면 True)"""
+        if not self.acksSupported:
+            self.acksSupported = True
+            self.save()
+        if self.inflight.pop(client_msg_id, None) is None:
+            return False
+        self.save()
+        return True
+
+    def expired(self, timeout):
+        """ack 대기 시간이 지난 메시지 목록 (client_msg_id, entry)"""
+        now = time.monotonic()
+        return [(cid, entry) for cid, entry in self.inflight.items() if now - entry["sent_at"] >= timeout]
+
+    def drop(self, client_msg_id):
+        self.inflight.pop(client_msg_id, None)
+        self.save()
+
+class TrafficRecorder:
+    """WebSocket 송수신 프레임 기록 (버그 재현 및 재생용)
+
+    gzip 파일에 매직 헤더 뒤로 (기록 시작부터의 단조 시간 초, 방향, 종류, 길이) 헤더와
+    원본 프레임을 이어 붙인다. 텍스트 프레임은 UTF-8, 바이너리 프레임은 받은 그대로 저장한다.
+    """
+    MAGIC = b"SLACKCLONE-TRAFFIC 1\n"
+    RECORD = struct.Struct("<dBBI")
+    INBOUND = 0
+    OUTBOUND = 1
+    TEXT = 0
+    BINARY = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.file = gzip.open(path, "wb", compresslevel=6)
+        self.file.write(self.MAGIC)
+        self.started = time.monotonic()
+        self.lastFlush = self.started
+        self.count = 0
+
+    def record(self, direction, payload):
+        now = time.monotonic()
+        if isinstance(payload, str):
+            kind, payload = self.TEXT, payload.encode("utf-8")
+        else:
+            kind, payload = self.BINARY, bytes(payload)
+        self.file.write(self.RECORD.pack(now - self.started, direction, kind, len(payload)))
+        self.file.write(payload)
+        self.count += 1
+        # 비정상 종료에도 최근 기록이 남도록 주기적으로 내보냄
+        if now - self.lastFlush >= TRAFFIC_FLUSH_SEC:
+            self.file.flush()
+            self.lastFlush = now
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            net_log.info("Traffic recording closed", extra={"frames": self.count, "path": self.path})
+
+    @classmethod
+    def read(cls, path):
+        """기록 파일의 (시간 초, 방향, 프레임) 목록 (텍스트 프레임은 str, 바이너리는 bytes)
+
+        기록 중에 비정상 종료되어 마지막 프레임이 잘린 경우 그 앞까지 반환한다.
+        """
+        records = []
+        with gzip.open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"not a traffic recording: {path}")
+            try:
+                while True:
+                    header = f.read(cls.RECORD.size)
+                    if len(header) < cls.RECORD.size:
+                        break
+                    timestamp, direction, kind, length = cls.RECORD.unpack(header)
+                    payload = f.read(length)
+                    if len(payload) < length:
+                        break
+                    records.append((timestamp, direction, payload.decode("utf-8") if kind == cls.TEXT else payload))
+            except EOFError:
+                pass  # 마지막 압축 블록이 기록되지 않음
+        return records
+
+class ReconnectPolicy:
+    """지수 백오프 + 지터 재연결 지연 계산 (서버 재시작 시 클라이언트 재연결 분산)"""
+
+    def __init__(self, base_ms=RECONNECT_BASE_MS, max_ms=RECONNECT_MAX_MS):
+        self.base_ms = base_ms
+        self.max_ms = max_ms
+        self.attempt = 0
+
+    def nextDelay(self):
+        """다음 재연결까지의 지연 (ms): 상한 안에서 2배씩 늘리고 절반 구간에 무작위 분산"""
+        ceiling = min(self.max_ms, self.base_ms * (2 ** self.attempt))
+        self.attempt += 1
+        return int(random.uniform(ceiling / 2, ceiling))
+
+    def reset(self):
+        self.attempt = 0
+
 class WebSocketWorker(QObject):
-    newMessage = Signal(str)
+    frameReceived = Signal(object)
     errorOccurred = Signal(str)
     connected = Signal()
     disconnected = Signal()
+    deliveryFailed = Signal(str)  # 전송에 실패한 사용자 메시지의 client_msg_id
+    reconnecting = Signal(int, int)  # 재연결 시도 횟수, 지연 (ms)
 
-    def __init__(self, url: QUrl, parent=None):
+    # 연결 상태
+    STOPPED = "stopped"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    BACKOFF = "backoff"
+
+    def __init__(self, url: QUrl, outbox_path=None, recorder=None, parent=None):
         super().__init__(parent)
         self.url = url
+        self.recorder = recorder  # 송수신 프레임 기록 (TrafficRecorder, 선택)
         self.websocket = None
+        self.state = self.STOPPED
+        self.outbox = Outbox(outbox_path)
+        self.reconnectPolicy = ReconnectPolicy()
+        self.codec = WireCodec()
+        self.metrics = app_metrics()
+        self.retryTimer = None
+        self.reconnectTimer = None
 
     @Slot()
     def start(self):
+        # 타이머는 워커 스레드에서 생성
+        if self.retryTimer is None:
+            self.retryTimer = QTimer(self)
+            self.retryTimer.setInterval(1000)
+            self.retryTimer.timeout.connect(self.retryUnacknowledged)
+            self.reconnectTimer = QTimer(self)
+            self.reconnectTimer.setSingleShot(True)
+            self.reconnectTimer.timeout.connect(self.openSocket)
+
+        self.retryTimer.start()
+        self.reconnectTimer.stop()
+        self.openSocket()
+
+    @Slot()
+    def openSocket(self):
+        """이전 소켓을 정리하고 새 소켓으로 연결"""
+        self.closeSocket()
+        self.state = self.CONNECTING
+        self.codec = WireCodec()  # 연결마다 다시 협상
         self.websocket = QWebSocket()
         self.websocket.error.connect(self.onError)
         self.websocket.textMessageReceived.connect(self.onTextMessageReceived)
+        self.websocket.binaryMessageReceived.connect(self.onBinaryMessageReceived)
         self.websocket.connected.connect(self.onConnected)
         self.websocket.disconnected.connect(self.onDisconnected)
         self.websocket.open(self.url)
 
+    def closeSocket(self):
+        """현재 소켓의 시그널 연결을 끊고 해제"""
+        if self.websocket is None:
+            return
+        websocket, self.websocket = self.websocket, None
+        websocket.error.disconnect(self.onError)
+        websocket.textMessageReceived.disconnect(self.onTextMessageReceived)
+        websocket.binaryMessageReceived.disconnect(self.onBinaryMessageReceived)
+        websocket.connected.disconnect(self.onConnected)
+        websocket.disconnected.disconnect(self.onDisconnected)
+        websocket.abort()
+        websocket.deleteLater()
+
     @Slot()
     def stop(self):
-        if self.websocket and self.websocket.state() == QAbstractSocket.ConnectedState:
+        """타이머를 멈추고 소켓을 닫음 (타이머와 소켓을 만든 워커 스레드에서 호출해야 함)"""
+        self.state = self.STOPPED
+        if self.retryTimer:
+            self.retryTimer.stop()
+            self.reconnectTimer.stop()
+        if self.isConnected():
             self.websocket.close()
+        self.closeSocket()
+
+    @Slot(str)
+    def reconnect(self, url):
+        """새 주소로 즉시 다시 연결 (서버 URL 변경 시)"""
+        self.url = QUrl(url)
+        self.reconnectPolicy.reset()
+        self.start()
+
+    def scheduleReconnect(self):
+        """백오프 지연 후 재연결 예약 (이미 예약되어 있으면 무시)"""
+        if self.state in (self.STOPPED, self.BACKOFF):
+            return
+        self.state = self.BACKOFF
+        delay = self.reconnectPolicy.nextDelay()
+        net_log.info("Reconnecting", extra={"delay_ms": delay, "attempt": self.reconnectPolicy.attempt})
+        self.metrics.inc("reconnects_total")
+        self.reconnectTimer.start(delay)
+        self.reconnecting.emit(self.reconnectPolicy.attempt, delay)
+
+    def isConnected(self):
+        return self.websocket is not None and self.websocket.state() == QAbstractSocket.ConnectedState
 
     @Slot(str)
     def sendMessage(self, msg: str):
-        if self.websocket and self.websocket.state() == QAbstractSocket.ConnectedState:
-            self.websocket.sendTextMessage(msg)
-        else:
+        action, client_msg_id = Outbox.describe(msg)
+        if self.isConnected() and (not self.outbox.queue or action in VOLATILE_ACTIONS):
+            # 조회 요청은 대기열 순서와 무관하므로 대기열이 남아 있어도 바로 전송
+            self.transmit(msg, client_msg_id)
+        elif action in VOLATILE_ACTIONS:
+            # 연결이 실제로 끊긴 경우에만 실패 처리 (다시 연결되면 새로 요청함)
             self.errorOccurred.emit("WebSocket이 연결되지 않았습니다.")
+        else:
+            # 연결될 때까지 대기열에 보관 (한도를 넘으면 오래된 프레임부터 버림)
+            for frame, cid in self.outbox.enqueue(msg, client_msg_id):
+                if cid:
+                    self.deliveryFailed.emit(cid)
+            if self.isConnected():
+                self.flushOutbox()
+
+    def transmit(self, msg, client_msg_id=None, save=True):
+        if self.codec.binary:
+            payload = self.codec.encode(json.loads(msg))
+            self.websocket.sendBinaryMessage(payload)
+        else:
+            payload = msg
+            self.websocket.sendTextMessage(msg)
+        if self.recorder:
+            self.recorder.record(TrafficRecorder.OUTBOUND, payload)
+        action = Outbox.describe(msg)[0] or "unknown"
+        self.metrics.inc("frames_out_total", action=action)
+        self.metrics.inc("bytes_out_total", len(payload.encode("utf-8") if isinstance(payload, str) else payload),
+                         action=action)
+        if client_msg_id:
+            self.outbox.markSent(msg, client_msg_id, save)
+
+    def flushOutbox(self):
+        """재연결 후 ack를 받지 못한 메시지와 대기열을 순서대로 전송"""
+        for cid, entry in list(self.outbox.inflight.items()):
+            self.transmit(entry["frame"], cid)
+        while self.outbox.queue and self.isConnected():
+            # 대기열에 있던 메시지는 이미 디스크에 있으므로 다 보낸 뒤 한 번만 기록
+            frame, cid = self.outbox.queue.popleft()
+            self.transmit(frame, cid, save=False)
+        self.outbox.save()
+
+    @Slot()
+    def retryUnacknowledged(self):
+        """ack 대기 시간이 지난 사용자 메시지 재전송 (최대 횟수를 넘으면 실패 처리)"""
+        if not self.isConnected():
+            return
+        for cid, entry in self.outbox.expired(ACK_TIMEOUT_SEC):
+            if entry["attempts"] >= MAX_SEND_ATTEMPTS:
+                net_log.warning("Message delivery failed", extra={"client_msg_id": cid})
+                self.outbox.drop(cid)
+                self.deliveryFailed.emit(cid)
+            else:
+                self.transmit(entry["frame"], cid)
 
     @Slot()
     def onConnected(self):
-        print("[WebSocketWorker] Connected to", self.url.toString())
+        net_log.info("Connected", extra={"url": self.url.toString()})
+        self.state = self.CONNECTED
+        self.reconnectPolicy.reset()
+        self.sendHello()
+        self.flushOutbox()
         self.connected.emit()
 
+    def sendHello(self):
+        """지원하는 인코딩과 압축 방식 제안 (응답이 없으면 JSON 텍스트 유지)"""
+        hello = json.dumps({
+            "action": "hello",
+            "encodings": WireCodec.supportedEncodings(),
+            "compression": WireCodec.supportedCompressions()
+        })
+        self.websocket.sendTextMessage(hello)
+        if self.recorder:
+            self.recorder.record(TrafficRecorder.OUTBOUND, hello)
+        self.metrics.inc("frames_out_total", action="hello")
+        self.metrics.inc("bytes_out_total", len(hello), action="hello")
+
+    def onHelloResponse(self, data):
+        """서버가 선택한 인코딩 적용 (지원하지 않는 값이면 JSON 텍스트 유지)"""
+        encoding = data.get("encoding") or "json"
+        compression = data.get("compression") or None
+        if (encoding not in WireCodec.supportedEncodings() or
+                (compression is not None and compression not in WireCodec.supportedCompressions())):
+            net_log.warning("Unsupported wire format from server",
+                            extra={"encoding": encoding, "compression": compression})
+            return
+        self.codec = WireCodec(encoding, compression)
+        net_log.info("Wire format negotiated", extra={"encoding": encoding, "compression": compression})
+
     @Slot()
     def onDisconnected(self):
-        print("[WebSocketWorker] Disconnected from", self.url.toString())
+        net_log.info("Disconnected", extra={"url": self.url.toString()})
         self.disconnected.emit()
+        self.scheduleReconnect()
 
     @Slot(str)
     def onTextMessageReceived(self, message: str):
-        print("[WebSocketWorker] Message received:", message[:200], "..." if len(message) > 200 else "")
-        self.newMessage.emit(message)
+        if self.recorder:
+            self.recorder.record(TrafficRecorder.INBOUND, message)
+        # 프레임 본문은 디버그 수준에서만 기록 (대량이면 표본만 남김)
+        if net_log.isEnabledFor(logging.DEBUG):
+            net_log.debug("Frame received", extra={"sampled": True, "transport": "text", "size": len(message),
+                                                   "body": message[:200]})
+        # JSON 디코딩과 검증은 워커 스레드에서 처리하고 GUI 스레드에는 결과만 전달
+        started = time.perf_counter()
+        try:
+            frame = decode_frame(message)
+        except ValueError as e:
+            net_log.warning("Failed to decode frame: %s", e, extra={"transport": "text", "body": message[:200]})
+            self.metrics.inc("decode_errors_total", transport="text")
+            return
+        self.recordInbound(frame, len(message.encode("utf-8")), started, "text")
+        self.dispatchFrame(frame)
+
+    @Slot(bytes)
+    def onBinaryMessageReceived(self, message):
+        payload = message.data() if hasattr(message, "data") else bytes(message)
+        if self.recorder:
+            self.recorder.record(TrafficRecorder.INBOUND, payload)
+        if net_log.isEnabledFor(logging.DEBUG):
+            net_log.debug("Frame received", extra={"sampled": True, "transport": "binary", "size": len(payload)})
+        started = time.perf_counter()
+        try:
+            frame = decode_frame(payload, self.codec)
+        except ValueError as e:
+            net_log.warning("Failed to decode frame: %s", e, extra={"transport": "binary", "size": len(payload)})
+            self.metrics.inc("decode_errors_total", transport="binary")
+            return
+        self.recordInbound(frame, len(payload), started, "binary")
+        self.dispatchFrame(frame)
+
+    def recordInbound(self, frame, size, started, transport):
+        """수신 프레임 수, 크기, 디코딩 시간 기록"""
+        action = frame.action or "unknown"
+        self.metrics.observe("decode_ms", (time.perf_counter() - started) * 1000, transport=transport)
+        self.metrics.inc("frames_in_total", action=action)
+        self.metrics.inc("bytes_in_total", size, action=action)
+
+    def dispatchFrame(self, frame):
+        if frame.action == "hello_response":
+            self.onHelloResponse(frame.data)
+            return
+
+        # 사용자 메시지 전송 확인 (응답 또는 브로드캐스트에 client_msg_id 포함)
+        client_msg_id = frame.data.get("client_msg_id")
+        if client_msg_id:
+            self.outbox.ack(client_msg_id)
+
+        self.frameReceived.emit(frame)
 
     @Slot()
     def onError(self):
         err_msg = self.websocket.errorString() if self.websocket else "알 수 없는 오류"
-        print("[WebSocketWorker] WebSocket Error:", err_msg)
+        net_log.warning("WebSocket error: %s", err_msg)
         self.errorOccurred.emit(err_msg)
+        self.scheduleReconnect()
 
-class ChannelItem(QWidget):
-    clicked = Signal(str)
-    
-    def __init__(self, channel_name, is_selected=False, parent=None):
+class ChannelListModel(QAbstractListModel):
+    """채널 목록 모델 (선택/호버 상태 포함)
+
+    새 목록을 받으면 이전 목록과의 차이(추가, 삭제, 이름 변경)만 반영한다.
+    """
+    SelectedRole = Qt.UserRole + 1
+    HoverRole = Qt.UserRole + 2
+
+    def __init__(self, channels=None, parent=None):
         super().__init__(parent)
-        self.channel_name = channel_name
-        self.is_selected = is_selected
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 2, 5, 2)
-        
-        icon_label = QLabel("#")
-        icon_label.setStyleSheet("color: #616061; font-weight: bold;")
-        
-        self.name_label = QLabel(channel_name)
-        self.name_label.setStyleSheet("color: #1D1C1D;")
-        
-        layout.addWidget(icon_label)
-        layout.addWidget(self.name_label)
-        layout.addStretch()
-        
-        self.setStyleSheet("""
-            ChannelItem {
-                border-radius: 4px;
-                padding: 2px;
-            }
-            ChannelItem:hover {
-                background-color: rgba(0, 0, 0, 0.1);
-            }
-        """)
-        self.update_selection(is_selected)
-        
-    def update_selection(self, is_selected):
-        self.is_selected = is_selected
-        if is_selected:
-            self.setStyleSheet("""
-                background-color: #1164A3;
-                border-radius: 4px;
-                padding: 2px;
-            """)
-            self.name_label.setStyleSheet("color: white; font-weight: bold;")
-        else:
-            self.setStyleSheet("""
-                border-radius: 4px;
-                padding: 2px;
-            """)
-            self.name_label.setStyleSheet("color: #1D1C1D;")
-            
-    def mousePressEvent(self, event):
-        self.clicked.emit(self.channel_name)
-        super().mousePressEvent(event)
-        
+        self.channels = list(channels or [])
+        self.selected = None
+        self.hoverRow = -1
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.channels)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        channel = self.channels[index.row()]
+        if role == Qt.DisplayRole:
+            return channel
+        if role == self.SelectedRole:
+            return channel == self.selected
+        if role == self.HoverRole:
+            return index.row() == self.hoverRow
+        return None
+
+    def contains(self, channel):
+        return channel in self.channels
+
+    def rowOf(self, channel):
+        try:
+            return self.channels.index(channel)
+        except ValueError:
+            return -1
+
+    def setChannels(self, channels):
+        """새 채널 목록과의 차이만 반영 (변경된 행만 다시 그림)"""
+        channels = list(channels)
+        # 행 번호가 바뀌기 전에 호버 표시를 지우고 그 행을 다시 그림
+        self.setHoverRow(-1)
+        opcodes = SequenceMatcher(None, self.channels, channels, autojunk=False).get_opcodes()
+        # 뒤에서부터 반영해야 앞쪽 행 번호가 바뀌지 않음
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                continue
+            if tag == "replace" and i2 - i1 == j2 - j1:
+                # 같은 자리의 이름 변경
+                self.channels[i1:i2] = channels[j1:j2]
+                self.dataChanged.emit(self.index(i1), self.index(i2 - 1))
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self.channels[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self.channels[i1:i1] = channels[j1:j2]
+                self.endInsertRows()
+
+    def addChannel(self, channel):
+        if channel in self.channels:
+            return
+        row = len(self.channels)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.channels.append(channel)
+        self.endInsertRows()
+
+    def setSelected(self, channel):
+        """선택 채널 변경 (이전/새 선택 행만 다시 그림)"""
+        previous, self.selected = self.rowOf(self.selected), channel
+        for row in (previous, self.rowOf(channel)):
+            if row >= 0:
+                self.dataChanged.emit(self.index(row), self.index(row), [self.SelectedRole])
+
+    def setHoverRow(self, row):
+        if row == self.hoverRow:
+            return
+        previous, self.hoverRow = self.hoverRow, row
+        for changed in (previous, row):
+            if 0 <= changed < len(self.channels):
+                self.dataChanged.emit(self.index(changed), self.index(changed), [self.HoverRole])
+
+class ChannelDelegate(QStyledItemDelegate):
+    """채널 행을 그리는 델리게이트 (선택/호버 상태는 모델에서 읽음)"""
+    ROW_HEIGHT = 28
+    MARGIN = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.nameFont = QFont()
+        self.nameFont.setPixelSize(14)
+        self.selectedFont = QFont(self.nameFont)
+        self.selectedFont.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        selected = index.data(ChannelListModel.SelectedRole)
+        theme = app_theme()
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+
+        rect = option.rect.adjusted(self.MARGIN, 2, -self.MARGIN, -2)
+        if selected:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(theme.color("channel_selected"))
+            painter.drawRoundedRect(rect, 4, 4)
+        elif index.data(ChannelListModel.HoverRole):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(theme.color("channel_hover"))
+            painter.drawRoundedRect(rect, 4, 4)
+
+        text_rect = rect.adjusted(self.MARGIN, 0, -self.MARGIN, 0)
+        painter.setFont(self.selectedFont)
+        painter.setPen(QColor("white") if selected else theme.color("channel_hash"))
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, "#")
+
+        hash_width = QFontMetrics(self.selectedFont).horizontalAdvance("# ")
+        painter.setFont(self.selectedFont if selected else self.nameFont)
+        painter.setPen(QColor("white") if selected else theme.color("channel_text"))
+        name_rect = text_rect.adjusted(hash_width, 0, 0, 0)
+        name = QFontMetrics(painter.font()).elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignVCenter | Qt.AlignLeft, name)
+
+        painter.restore()
+
+class ChannelListView(QListView):
+    """채널 목록 뷰 (보이는 행만 그림)"""
+    channelClicked = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setItemDelegate(ChannelDelegate(self))
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.NoFrame)
+        self.clicked.connect(lambda index: self.channelClicked.emit(index.data(Qt.DisplayRole)))
+
+    def mouseMoveEvent(self, event):
+        self.model().setHoverRow(self.indexAt(event.position().toPoint()).row())
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self.model().setHoverRow(-1)
+        super().leaveEvent(event)
+
 class WorkspaceDialog(QDialog):
     def __init__(self, parent=None, workspaces=None):
         super().__init__(parent)
@@ -433,9 +2287,6 @@ class WorkspaceDialog(QDialog):
         
         # 현재 워크스페이스 목록
         self.workspaceList = QListWidget(self)
-        if workspaces:
-            for ws in workspaces:
-                self.workspaceList.addItem(ws)
         
         # 새 워크스페이스 추가 영역
         inputLayout = QHBoxLayout()
@@ -456,6 +2307,14 @@ class WorkspaceDialog(QDialog):
         layout.addWidget(self.workspaceList)
         layout.addLayout(inputLayout)
         layout.addWidget(buttonBox)
+
+        self.setWorkspaces(workspaces)
+
+    def setWorkspaces(self, workspaces):
+        """워크스페이스 목록을 다시 채움 (대화상자를 다시 열 때 사용)"""
+        self.workspaceList.clear()
+        self.workspaceList.addItems(workspaces or [])
+        self.wsNameEdit.clear()
         
     def addWorkspace(self):
         name = self.wsNameEdit.text().strip()
@@ -512,132 +2371,556 @@ class CreateChannelDialog(QDialog):
             "workspace": self.workspace
         }
         
+class MessageListModel(QAbstractListModel):
+    """채널 메시지 목록 모델 (날짜 구분선 행 포함)"""
+    RowRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.messageIds = set()  # 이미 표시된 서버 메시지 ID (중복 표시 방지)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        row = self.rows[index.row()]
+        if role == self.RowRole:
+            return row
+        if role == Qt.DisplayRole:
+            if row["kind"] == "date":
+                return format_date_korean(row["date"])
+            if row["kind"] == "notice":
+                return f"{row['title']}\n{row['text']}"
+            return f"{row['sender']} {row['time']}\n{row['message']}"
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self.rows[index.row()]["kind"] == "message":
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled
+
+    def uniqueMessages(self, messages):
+        """이미 표시된 ID의 메시지를 제외하고 ID 목록에 등록"""
+        unique = []
+        for message in messages:
+            message_id = message.get("id")
+            if message_id is not None:
+                if message_id in self.messageIds:
+                    continue
+                self.messageIds.add(message_id)
+            unique.append(message)
+        return unique
+
+    def buildRows(self, messages, last_date=None):
+        """메시지 목록을 날짜별로 묶어 표시 행 목록으로 변환"""
+        message_groups = {}
+        for message in messages:
+            date = message.get("date", "Unknown")
+            message_groups.setdefault(date, []).append(message)
+
+        rows = []
+        for date in sorted(message_groups.keys()):
+            if date != last_date:
+                rows.append({"kind": "date", "date": date})
+            for message in message_groups[date]:
+                rows.append(self.messageRow(message))
+            last_date = date
+        return rows
+
+    def messageRow(self, message):
+        """메시지 딕셔너리를 표시 행으로 변환"""
+        return {
+            "kind": "message",
+            "id": message.get("id"),
+            "date": message.get("date", "Unknown"),
+            "sender": message.get("sender", "Unknown"),
+            "time": message.get("time", ""),
+            "message": message.get("message", "")
+        }
+
+    def clear(self):
+        self.beginResetModel()
+        self.rows = []
+        self.messageIds = set()
+        self.endResetModel()
+
+    def setMessages(self, messages):
+        """전체 메시지 목록 교체"""
+        self.beginResetModel()
+        self.messageIds = set()
+        self.rows = self.buildRows(self.uniqueMessages(messages))
+        self.endResetModel()
+
+    def prependMessages(self, messages):
+        """이전 페이지 메시지를 목록 앞에 추가"""
+        new_rows = self.buildRows(self.uniqueMessages(messages))
+        if not new_rows:
+            return
+
+        # 기존 첫 날짜 구분선과 날짜가 이어지면 중복 구분선 제거
+        if self.rows and self.rows[0]["kind"] == "date" and self.rows[0]["date"] == new_rows[-1]["date"]:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            del self.rows[0]
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, len(new_rows) - 1)
+        self.rows[0:0] = new_rows
+        self.endInsertRows()
+
+    def appendMessages(self, messages):
+        """새 메시지들을 목록 끝에 한 번에 추가"""
+        new_rows = self.buildRows(self.uniqueMessages(messages), self.lastDate())
+        if not new_rows:
+            return
+
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self.rows.extend(new_rows)
+        self.endInsertRows()
+
+    def showNotice(self, title, text):
+        """안내 화면 표시 (홈, DM 등)"""
+        self.beginResetModel()
+        self.messageIds = set()
+        self.rows = [{"kind": "notice", "title": title, "text": text}]
+        self.endResetModel()
+
+    def lastDate(self):
+        """마지막으로 표시된 메시지의 날짜 반환"""
+        for row in reversed(self.rows):
+            if row["kind"] in ("date", "message"):
+                return row["date"]
+        return None
+
+class MessageDelegate(QStyledItemDelegate):
+    """화면에 보이는 메시지 행만 배치하고 그리는 델리게이트"""
+    PADDING = 10
+    MESSAGE_SPACING = 12
+    DATE_MARGIN = 20
+    NOTICE_MARGIN = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.textFont = QFont()
+        self.textFont.setPixelSize(14)
+        self.senderFont = QFont(self.textFont)
+        self.senderFont.setBold(True)
+        self.timeFont = QFont()
+        self.timeFont.setPixelSize(12)
+        self.titleFont = QFont()
+        self.titleFont.setPixelSize(20)
+        self.titleFont.setBold(True)
+
+    def textWidth(self, option):
+        """줄바꿈 기준이 되는 본문 너비"""
+        view = self.parent()
+        width = view.viewport().width() if view else option.rect.width()
+        return max(width - 2 * self.PADDING, 50)
+
+    def textHeight(self, font, width, text, flags=Qt.TextWordWrap):
+        return QFontMetrics(font).boundingRect(QRect(0, 0, width, 1000000), flags, text).height()
+
+    def sizeHint(self, option, index):
+        row = index.data(MessageListModel.RowRole)
+        width = self.textWidth(option)
+
+        # 너비가 같으면 이전에 계산한 높이를 재사용
+        cached = row.get("_size")
+        if cached and cached[0] == width:
+            return QSize(width, cached[1])
+
+        kind = row["kind"]
+        if kind == "date":
+            height = QFontMetrics(self.senderFont).height() + 2 * self.DATE_MARGIN
+        elif kind == "notice":
+            height = (self.NOTICE_MARGIN
+                      + QFontMetrics(self.titleFont).height() + self.PADDING
+                      + self.textHeight(self.textFont, width, row["text"], Qt.TextWordWrap | Qt.AlignHCenter))
+        else:
+            height = (QFontMetrics(self.senderFont).height()
+                      + self.textHeight(self.textFont, width, row["message"])
+                      + self.MESSAGE_SPACING)
+
+        row["_size"] = (width, height)
+        return QSize(width, height)
+
+    def paint(self, painter, option, index):
+        row = index.data(MessageListModel.RowRole)
+        theme = app_theme()
+        painter.save()
+
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, theme.color("highlight"))
+
+        rect = option.rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        kind = row["kind"]
+
+        if kind == "date":
+            painter.setFont(self.senderFont)
+            label = format_date_korean(row["date"])
+            label_width = QFontMetrics(self.senderFont).horizontalAdvance(label) + 2 * self.PADDING
+            center_y = rect.center().y()
+            label_left = rect.center().x() - label_width // 2
+
+            painter.setPen(QPen(theme.color("separator"), 1))
+            painter.drawLine(rect.left(), center_y, label_left, center_y)
+            painter.drawLine(label_left + label_width, center_y, rect.right(), center_y)
+
+            painter.setPen(theme.color("muted_text"))
+            painter.drawText(QRect(label_left, rect.top(), label_width, rect.height()), Qt.AlignCenter, label)
+
+        elif kind == "notice":
+            title_height = QFontMetrics(self.titleFont).height()
+            title_rect = QRect(rect.left(), rect.top() + self.NOTICE_MARGIN, rect.width(), title_height)
+            painter.setPen(theme.color("text"))
+            painter.setFont(self.titleFont)
+            painter.drawText(title_rect, Qt.AlignHCenter, row["title"])
+
+            painter.setFont(self.textFont)
+            text_rect = QRect(rect.left(), title_rect.bottom() + self.PADDING, rect.width(), rect.bottom() - title_rect.bottom())
+            painter.drawText(text_rect, Qt.TextWordWrap | Qt.AlignHCenter, row["text"])
+
+        else:
+            sender_metrics = QFontMetrics(self.senderFont)
+            header_rect = QRect(rect.left(), rect.top(), rect.width(), sender_metrics.height())
+
+            # 보낸 사람 + 시간 헤더
+            painter.setPen(theme.color("text"))
+            painter.setFont(self.senderFont)
+            painter.drawText(header_rect, Qt.AlignLeft | Qt.AlignVCenter, row["sender"])
+
+            sender_width = sender_metrics.horizontalAdvance(row["sender"]) + 6
+            painter.setPen(theme.color("muted_text"))
+            painter.setFont(self.timeFont)
+            painter.drawText(header_rect.adjusted(sender_width, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, row["time"])
+
+            # 본문
+            painter.setPen(theme.color("text"))
+            painter.setFont(self.textFont)
+            body_rect = QRect(rect.left(), header_rect.bottom() + 1, rect.width(), rect.bottom() - header_rect.bottom())
+            painter.drawText(body_rect, Qt.TextWordWrap, row["message"])
+
+        painter.restore()
+
+class MessageView(QListView):
+    """가상화된 메시지 목록 뷰"""
+    reachedTop = Signal()
+    TOP_THRESHOLD = 100  # 이전 페이지를 요청할 상단 여유 (픽셀)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stickToBottom = True
+        self.prependAnchor = None  # 앞에 행이 추가될 때 유지할 하단 기준 거리
+        self.adjustingScroll = False
+
+        self.setItemDelegate(MessageDelegate(self))
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setUniformItemSizes(False)
+        self.setWordWrap(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+
+        self.verticalScrollBar().valueChanged.connect(self.onScrollValueChanged)
+        self.verticalScrollBar().rangeChanged.connect(self.onScrollRangeChanged)
+
+    def setModel(self, model):
+        old_model = self.model()
+        if old_model is not None:
+            old_model.modelReset.disconnect(self.onModelReset)
+            old_model.rowsAboutToBeInserted.disconnect(self.onRowsAboutToBeInserted)
+        super().setModel(model)
+        if model is not None:
+            model.modelReset.connect(self.onModelReset)
+            model.rowsAboutToBeInserted.connect(self.onRowsAboutToBeInserted)
+        self.stickToBottom = True
+        self.prependAnchor = None
+
+    def isAtBottom(self):
+        scrollBar = self.verticalScrollBar()
+        return scrollBar.value() >= scrollBar.maximum() - 4
+
+    def scrollState(self):
+        """현재 스크롤 위치 (맨 아래면 None, 아니면 하단으로부터의 거리)"""
+        if self.stickToBottom:
+            return None
+        scrollBar = self.verticalScrollBar()
+        return scrollBar.maximum() - scrollBar.value()
+
+    def restoreScrollState(self, state):
+        """scrollState()로 저장한 위치 복원 (레이아웃이 끝나는 대로 적용)"""
+        if state is None:
+            self.stickToBottom = True
+            self.scrollToBottom()
+        else:
+            self.stickToBottom = False
+            self.prependAnchor = state
+            scrollBar = self.verticalScrollBar()
+            self.adjustingScroll = True
+            scrollBar.setValue(scrollBar.maximum() - state)
+            self.adjustingScroll = False
+
+    def onModelReset(self):
+        # 채널을 새로 열면 최신 메시지부터 표시
+        self.stickToBottom = True
+        self.prependAnchor = None
+
+    def onRowsAboutToBeInserted(self, parent, first, last):
+        # 이전 페이지가 앞에 추가되어도 보고 있던 위치 유지
+        if first == 0 and self.model().rowCount() > 0 and not self.stickToBottom:
+            scrollBar = self.verticalScrollBar()
+            self.prependAnchor = scrollBar.maximum() - scrollBar.value()
+
+    def onScrollValueChanged(self, value):
+        if self.adjustingScroll:
+            return
+        self.prependAnchor = None
+        self.stickToBottom = self.isAtBottom()
+        if value <= self.TOP_THRESHOLD and self.verticalScrollBar().maximum() > 0:
+            self.reachedTop.emit()
+
+    def onScrollRangeChanged(self, minimum, maximum):
+        # 맨 아래를 보고 있었다면 새 메시지(또는 배치 레이아웃)를 따라 스크롤
+        self.adjustingScroll = True
+        if self.stickToBottom:
+            self.verticalScrollBar().setValue(maximum)
+        elif self.prependAnchor is not None:
+            self.verticalScrollBar().setValue(maximum - self.prependAnchor)
+        self.adjustingScroll = False
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Copy):
+            self.copySelection()
+            return
+        super().keyPressEvent(event)
+
+    def copySelection(self):
+        """선택한 메시지를 클립보드로 복사"""
+        indexes = sorted(self.selectionModel().selectedIndexes(), key=lambda i: i.row())
+        if indexes:
+            QApplication.clipboard().setText("\n\n".join(i.data(Qt.DisplayRole) for i in indexes))
+
+class IngestBuffer(QObject):
+    """짧은 시간(한 프레임) 안에 도착한 실시간 메시지를 모아 한 번에 반영하는 버퍼"""
+    flushed = Signal(list)
+    RATE_WINDOW = 1.0  # 수신률 계산 구간 (초)
+
+    def __init__(self, interval_ms=INGEST_FLUSH_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.pending = []
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+        self.metrics = app_metrics()
+        self.recent = deque()  # (반영 시각, 메시지 수)
+
+    def add(self, data):
+        """메시지를 버퍼에 추가 (첫 메시지가 들어오면 반영 타이머 시작)"""
+        self.pending.append(data)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """모인 메시지를 한 번에 반영"""
+        self.timer.stop()
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+
+        now = time.monotonic()
+        self.metrics.observe("ingest_batch_size", len(batch))
+        self.metrics.inc("ingest_messages_total", len(batch))
+        self.recent.append((now, len(batch)))
+        self.pruneRecent(now)
+
+        self.flushed.emit(batch)
+
+    def pruneRecent(self, now):
+        """수신률 계산 구간을 벗어난 기록 제거 (rate()를 부르지 않아도 계속 쌓이지 않게 함)"""
+        cutoff = now - self.RATE_WINDOW
+        while self.recent and self.recent[0][0] < cutoff:
+            self.recent.popleft()
+
+    def rate(self):
+        """최근 1초간 초당 수신 메시지 수"""
+        self.pruneRecent(time.monotonic())
+        return sum(count for _, count in self.recent) / self.RATE_WINDOW
+
+class ChannelCache:
+    """최근 본 채널의 메시지 모델을 보관하는 LRU 캐시 (전체 행 수로 크기 제한)"""
+
+    def __init__(self, max_rows=CHANNEL_CACHE_MAX_ROWS):
+        self.max_rows = max_rows
+        self.entries = OrderedDict()  # (workspace, channel) -> {"model", "cursor", "has_more", "scroll", "pending"}
+        self.metrics = app_metrics()
+
+    def get(self, key):
+        """캐시된 채널 항목 반환 (없거나 비어 있으면 None)"""
+        entry = self.entries.get(key)
+        if entry is None or entry["model"].rowCount() == 0:
+            self.metrics.inc("channel_cache_misses_total")
+            return None
+        self.metrics.inc("channel_cache_hits_total")
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+
+    def totalRows(self):
+        return sum(entry["model"].rowCount() for entry in self.entries.values())
+
+    def trim(self, keep=None):
+        """크기 제한을 넘으면 가장 오래 사용하지 않은 채널부터 제거 (keep 채널은 유지)"""
+        total = self.totalRows()
+        for key in list(self.entries.keys()):
+            if total <= self.max_rows:
+                break
+            if key == keep:
+                continue
+            entry = self.entries.pop(key)
+            rows = entry["model"].rowCount()
+            total -= rows
+            self.metrics.inc("channel_cache_evictions_total")
+            self.metrics.inc("channel_cache_evicted_rows_total", rows)
+            entry["model"].deleteLater()
+            ui_log.info("Channel evicted from cache", extra={"workspace": key[0], "channel": key[1], "rows": rows})
+
+class PendingRequest:
+    """응답을 기다리는 요청"""
+    __slots__ = ("request_id", "action", "key", "sent_at", "deadline", "on_response", "on_timeout")
+
+    def __init__(self, request_id, action, key, timeout, on_response, on_timeout):
+        self.request_id = request_id
+        self.action = action
+        self.key = key
+        self.sent_at = time.monotonic()
+        self.deadline = self.sent_at + timeout if timeout is not None else float("inf")
+        self.on_response = on_response
+        self.on_timeout = on_timeout
+
+class RequestTracker(QObject):
+    """요청 ID로 응답을 요청과 연결하는 요청 계층
+
+    요청마다 고유한 request_id를 발급하고 서버가 응답에 그대로 돌려준 ID로
+    콜백을 호출한다. 같은 key로 새 요청을 보내거나 cancel()하면 이전 요청은
+    무효가 되고, 시간 안에 응답이 없으면 on_timeout을 호출한다. 무효가 된 요청의
+    응답은 늦게 도착해도 버린다. action별 요청 수, 왕복 시간, 시간 초과는 지표 저장소에 기록한다.
+    """
+    RETIRED_MAX = 1000  # 늦은 응답을 알아보기 위해 기억할 무효 요청 ID 수
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pending = {}           # request_id -> PendingRequest
+        self.keys = {}              # key -> request_id
+        self.retired = OrderedDict()  # 취소되거나 시간이 지난 request_id -> action
+        self.metrics = app_metrics()
+        self.timer = QTimer(self)
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.checkTimeouts)
+
+    def track(self, action, timeout, on_response=None, on_timeout=None, key=None):
+        """새 요청 등록 후 request_id 반환 (같은 key의 이전 요청은 취소)"""
+        if key is not None:
+            self.cancel(key)
+        request_id = uuid.uuid4().hex
+        self.pending[request_id] = PendingRequest(request_id, action, key, timeout, on_response, on_timeout)
+        if key is not None:
+            self.keys[key] = request_id
+        self.metrics.inc("requests_total", action=action)
+        if not self.timer.isActive():
+            self.timer.start()
+        return request_id
+
+    def cancel(self, key):
+        """key로 등록된 진행 중인 요청 취소 (응답이 오면 버림)"""
+        request_id = self.keys.pop(key, None)
+        request = self.pending.pop(request_id, None) if request_id is not None else None
+        if request is not None:
+            self.retire(request)
+
+    def complete(self, key):
+        """key로 등록된 진행 중인 요청을 응답 없이 완료 처리 (이후 도착한 응답은 일반 프레임으로 처리)"""
+        request_id = self.keys.pop(key, None)
+        if request_id is not None:
+            self.pending.pop(request_id, None)
+
+    def retire(self, request):
+        self.retired[request.request_id] = request.action
+        while len(self.retired) > self.RETIRED_MAX:
+            self.retired.popitem(last=False)
+
+    def release(self, request):
+        self.pending.pop(request.request_id, None)
+        if request.key is not None and self.keys.get(request.key) == request.request_id:
+            del self.keys[request.key]
+
+    def resolve(self, frame):
+        """응답 프레임을 요청과 연결
+
+        (처리 여부, PendingRequest) 반환. 무효가 된 요청의 응답이면 (True, None)으로
+        버리고, request_id가 없거나 모르는 ID면 (False, None)으로 action별 처리에 맡긴다.
+        """
+        request_id = frame.data.get("request_id")
+        if request_id is None:
+            return False, None
+        request = self.pending.get(request_id)
+        if request is None:
+            if request_id in self.retired:
+                self.metrics.inc("request_stale_total", action=self.retired[request_id])
+                net_log.info("Dropped stale response", extra={"action": frame.action})
+                return True, None
+            return False, None
+
+        self.release(request)
+        latency = (time.monotonic() - request.sent_at) * 1000
+        self.metrics.observe("request_latency_ms", latency, action=request.action)
+        return False, request
+
+    @Slot()
+    def checkTimeouts(self):
+        """응답 대기 시간이 지난 요청 처리"""
+        now = time.monotonic()
+        expired = [request for request in self.pending.values() if request.deadline <= now]
+        for request in expired:
+            self.release(request)
+            self.retire(request)
+            self.metrics.inc("request_timeouts_total", action=request.action)
+            net_log.warning("Request timed out", extra={"action": request.action})
+            if request.on_timeout:
+                request.on_timeout()
+        if not self.pending:
+            self.timer.stop()
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, record_path=None, startup=None):
         super().__init__()
+        self.record_path = record_path  # 송수신 프레임을 기록할 파일 (--record-traffic)
+        self.startup = startup or StartupTimer()  # 단계별 시작 시간 (첫 화면을 그린 뒤 보고)
+        self.firstShown = False
         self.setWindowTitle("Slack 클론")
         self.resize(1280, 800)
-        
-        # 스타일 시트 설정
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #FFFFFF;
-                color: #1D1C1D;
-            }
-            QSplitter::handle {
-                background-color: #E8E8E8;
-                width: 1px;
-            }
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QLabel {
-                color: #1D1C1D;
-                font-size: 14px;
-            }
-            QLineEdit {
-                background-color: #FFFFFF;
-                color: #1D1C1D;
-                border: 1px solid #BBBABB;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #1264A3;
-            }
-            QPushButton {
-                background-color: #007a5a;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #148567;
-            }
-            QTextEdit {
-                background-color: #FFFFFF;
-                color: #1D1C1D;
-                border: none;
-                font-size: 14px;
-            }
-            #leftSidebar {
-                background-color: #3F0E40;
-                min-width: 220px;
-                max-width: 260px;
-            }
-            #workspaceHeader {
-                background-color: #3F0E40;
-                color: white;
-                font-weight: bold;
-                font-size: 18px;
-                padding: 10px;
-                border-bottom: 1px solid #522653;
-            }
-            #channelList {
-                background-color: #3F0E40;
-            }
-            #searchBox {
-                background-color: rgba(255, 255, 255, 0.2);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 4px;
-                color: white;
-                padding: 5px 8px;
-                margin: 8px;
-            }
-            #sectionLabel {
-                color: #BCABBC;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 8px 10px;
-            }
-            #channelHeader {
-                background-color: #FFFFFF;
-                border-bottom: 1px solid #E8E8E8;
-                padding: 10px;
-            }
-            #channelTitle {
-                font-weight: bold;
-                font-size: 16px;
-            }
-            #messageInput {
-                border: 1px solid #BBBABB;
-                border-radius: 4px;
-                margin: 10px;
-                padding: 8px;
-            }
-            #messageArea {
-                border: none;
-                padding: 10px;
-            }
-            #workspaceButton {
-                background-color: white;
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 18px;
-                width: 60px;
-                height: 60px;
-                border-radius: 4px;
-                text-align: center;
-                margin: 5px;
-            }
-            #sidebarItem {
-                padding: 5px 10px;
-                border-radius: 4px;
-                margin: 2px 8px;
-                color: #CFC3CF;
-                font-size: 15px;
-            }
-            #sidebarItem:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-            }
-            #bodyContainer {
-                background-color: white;
-            }
-        """)
+
+        # 설정 서비스 (변경 시 바로 적용)
+        self.settings = app_settings()
+        self.settings.valueChanged.connect(self.onSettingChanged)
+        
+        # 테마 (앱 전체 스타일시트는 테마를 바꿀 때만 적용)
+        self.theme = app_theme()
+        self.theme.apply(self.settings.value("theme") or "light")
+        self.theme.themeChanged.connect(self.onThemeChanged)
+        self.startup.mark("settings_theme")
 
         # 메인 위젯 설정
         self.mainWidget = QWidget()
@@ -650,7 +2933,6 @@ class MainWindow(QMainWindow):
         self.workspaceSidebar = QWidget()
         self.workspaceSidebar.setObjectName("workspaceSidebar")
         self.workspaceSidebar.setFixedWidth(65)
-        self.workspaceSidebar.setStyleSheet("background-color: #3F0E40;")
         
         wsLayout = QVBoxLayout(self.workspaceSidebar)
         wsLayout.setContentsMargins(5, 5, 5, 5)
@@ -670,6 +2952,7 @@ class MainWindow(QMainWindow):
             {"text": "더 보기", "icon": "...", "action": self.showMoreMenu}
         ]
 
+        self.navButtons = {}
         for item in menuIcons:
             btn = QPushButton(item["icon"])
             btn.setToolTip(item["text"])
@@ -678,6 +2961,7 @@ class MainWindow(QMainWindow):
             if "action" in item and item["action"]:
                 btn.clicked.connect(item["action"])
             wsLayout.addWidget(btn, 0, Qt.AlignHCenter)
+            self.navButtons[item["text"]] = btn
         
         wsLayout.addStretch()
         
@@ -703,11 +2987,11 @@ class MainWindow(QMainWindow):
         wsHeaderLayout.setContentsMargins(10, 10, 10, 10)
         
         wsTitle = QLabel("실험실")
-        wsTitle.setStyleSheet("color: white; font-weight: bold;")
+        wsTitle.setObjectName("workspaceTitle")
         wsHeaderLayout.addWidget(wsTitle)
         
         newButton = QPushButton("▼")
-        newButton.setStyleSheet("background: transparent; color: white; font-weight: bold;")
+        newButton.setProperty("variant", "header")
         newButton.setFixedSize(40, 40)
         wsHeaderLayout.addWidget(newButton)
         
@@ -718,6 +3002,7 @@ class MainWindow(QMainWindow):
         self.searchBox.setObjectName("searchBox")
         self.searchBox.setPlaceholderText("전체 검색")
         self.searchBox.returnPressed.connect(self.onGlobalSearch)
+        self.searchBox.textEdited.connect(self.scheduleQuickSearch)
         leftLayout.addWidget(self.searchBox)
         
         # 섹션 & 채널 목록
@@ -736,40 +3021,23 @@ class MainWindow(QMainWindow):
         channelLabel.setObjectName("sectionLabel")
         channelContainerLayout.addWidget(channelLabel)
         
-        # 채널 목록
-        self.channelListWidget = QWidget()
-        self.channelListWidget.setObjectName("channelList")
-        self.channelListLayout = QVBoxLayout(self.channelListWidget)
-        self.channelListLayout.setContentsMargins(0, 0, 0, 0)
-        self.channelListLayout.setAlignment(Qt.AlignTop)
-        self.channelListLayout.setSpacing(0)
-        
-        # 채널 항목 추가
+        # 채널 목록 (모델/뷰, 보이는 행만 그림)
         self.channels = ["전체", "소셜"]
-        self.channel_items = {}
-        
-        for channel in self.channels:
-            channel_item = ChannelItem(channel, channel == "전체")
-            channel_item.clicked.connect(self.onChannelSelected)
-            self.channel_items[channel] = channel_item
-            self.channelListLayout.addWidget(channel_item)
+        self.channelModel = ChannelListModel(self.channels, self)
+        self.channelModel.setSelected("전체")
+        self.channelList = ChannelListView()
+        self.channelList.setObjectName("channelList")
+        self.channelList.setModel(self.channelModel)
+        self.channelList.channelClicked.connect(self.onChannelSelected)
+        channelContainerLayout.addWidget(self.channelList, 1)
         
         # 채널 추가 버튼
         addChannelBtn = QPushButton("+ 채널 추가")
-        addChannelBtn.setObjectName("sidebarItem")
-        addChannelBtn.setStyleSheet("background: transparent; color: #CFC3CF; text-align: left; padding-left: 25px;")
+        addChannelBtn.setProperty("variant", "sidebarLink")
         addChannelBtn.clicked.connect(self.addChannel)
-        self.channelListLayout.addWidget(addChannelBtn)
+        channelContainerLayout.addWidget(addChannelBtn)
         
-        # 스크롤 영역에 채널 목록 추가
-        channelScroll = QScrollArea()
-        channelScroll.setWidgetResizable(True)
-        channelScroll.setWidget(self.channelListWidget)
-        channelScroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        channelScroll.setStyleSheet("background-color: #3F0E40; border: none;")
-        
-        channelContainerLayout.addWidget(channelScroll)
-        leftLayout.addWidget(channelContainer)
+        leftLayout.addWidget(channelContainer, 1)
         
         # 메인 컨텐츠 영역
         self.bodyContainer = QWidget()
@@ -792,6 +3060,7 @@ class MainWindow(QMainWindow):
         self.headerSearch.setPlaceholderText("채널 검색")
         self.headerSearch.setFixedWidth(250)
         self.headerSearch.returnPressed.connect(self.onChannelSearch)
+        self.headerSearch.textEdited.connect(self.scheduleQuickSearch)
         chHeaderLayout.addWidget(self.headerSearch)
         
         # 헤더 아이콘들
@@ -802,14 +3071,14 @@ class MainWindow(QMainWindow):
         # 채널별 검색 버튼 추가
         self.channelSearchBtn = QPushButton("🔍")
         self.channelSearchBtn.setToolTip("채널 내 검색")
-        self.channelSearchBtn.setStyleSheet("background: transparent;")
+        self.channelSearchBtn.setProperty("variant", "icon")
         self.channelSearchBtn.setFixedSize(40, 40)
         self.channelSearchBtn.clicked.connect(self.showChannelSearchDialog)
         headerIconsLayout.addWidget(self.channelSearchBtn)
         
         for icon in ["🔔", "👥", "ⓘ"]:
             btn = QPushButton(icon)
-            btn.setStyleSheet("background: transparent;")
+            btn.setProperty("variant", "icon")
             btn.setFixedSize(40, 40)
             headerIconsLayout.addWidget(btn)
         
@@ -817,9 +3086,12 @@ class MainWindow(QMainWindow):
         bodyLayout.addWidget(self.channelHeader)
         
         # 메시지 영역
-        self.messageArea = QTextEdit()
+        self.messageModel = MessageListModel(self)
+        self.noticeModel = None  # 홈, DM 등 안내 화면용 (처음 표시할 때 생성)
+        self.messageArea = MessageView()
         self.messageArea.setObjectName("messageArea")
-        self.messageArea.setReadOnly(True)
+        self.messageArea.setModel(self.messageModel)
+        self.messageArea.reachedTop.connect(self.requestOlderMessages)
         bodyLayout.addWidget(self.messageArea)
         
         # 메시지 입력 영역
@@ -840,7 +3112,7 @@ class MainWindow(QMainWindow):
         # 포맷팅 버튼들
         for icon in ["B", "I", "S", "🔗", "•", "1."]:
             btn = QPushButton(icon)
-            btn.setStyleSheet("background: transparent; color: #616061;")
+            btn.setProperty("variant", "toolbar")
             btn.setFixedSize(40, 40)
             toolbarLayout.addWidget(btn)
 
@@ -859,6 +3131,27 @@ class MainWindow(QMainWindow):
         self.mainLayout.addWidget(self.workspaceSidebar)
         self.mainLayout.addWidget(self.leftSidebar)
         self.mainLayout.addWidget(self.bodyContainer, 1)  # 1은 stretch 비율
+        self.startup.mark("widgets")
+
+        # 자주 쓰지 않는 화면은 처음 사용할 때 만들어 재사용
+        self.searchPanel = None  # 빠른 검색 결과 패널 (입력하는 동안 결과 표시)
+        self.searchDock = None
+        self.searchDialog = None
+        self.settingsDialog = None
+        self.workspaceDialog = None
+        self.moreMenu = None
+        self.trayIcon = None  # 첫 화면을 그린 뒤 생성
+
+        self.quickSearchTimer = QTimer(self)
+        self.quickSearchTimer.setSingleShot(True)
+        self.quickSearchTimer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.quickSearchTimer.timeout.connect(self.runQuickSearch)
+        self.quickSearchSource = None
+
+        # 수신 프레임 처리기 및 요청/응답 연결
+        self.metrics = app_metrics()
+        self.registerActionHandlers()
+        self.requests = RequestTracker(self)
 
         # 네트워크 관리자
         self.networkManager = QNetworkAccessManager(self)
@@ -866,62 +3159,134 @@ class MainWindow(QMainWindow):
 
         # WebSocket Worker (별도 스레드)
         self.initWebSocketWorker()
-
-        # 시스템 트레이 설정
-        self.createTrayIcon()
+        self.startup.mark("network")
 
         # 현재 채널 및 워크스페이스 설정
         self.current_channel = "전체"
         self.current_workspace = "실험실"
         self.workspaces = ["실험실"]
+        self.sessionEstablished = False  # 워크스페이스 목록을 한 번이라도 받았는지 여부
+        self.bootstrapSupported = True  # 서버가 bootstrap 요청을 처리하는지 여부 (실패하면 개별 요청 사용)
+        self.bootstrapApplied = False  # 이번 연결에서 bootstrap 응답을 반영했는지 여부
+
+        # 로컬 메시지 저장소 (지난 세션의 워크스페이스와 채널을 서버 응답 전에 복원) 및 최근 채널 캐시
+        self.messageStore = MessageStore(app_data_path("messages.db"))
+        self.storeWriteTimer = QTimer(self)  # 받은 메시지를 틱마다 나누어 저장
+        self.storeWriteTimer.setInterval(0)
+        self.storeWriteTimer.timeout.connect(self.writeStoredMessages)
+        self.restoreSession()
+        self.startup.mark("store")
+        self.channelCache = ChannelCache()
+        self.channelCache.put((self.current_workspace, self.current_channel), {
+            "model": self.messageModel, "cursor": None, "has_more": False, "scroll": None, "pending": []
+        })
+
+        # 채널 히스토리 페이지 상태
+        self.historyLoading = False
+        self.historyRequestKind = None  # 진행 중인 요청 종류 ("latest", "older", "newer")
+        self.historyHasMore = False
+        self.historyCursor = None   # 가장 오래된 메시지 ID (before 커서)
+
+        # 배치 렌더링 대기열 (model, 작업, 메시지 배치)
+        self.renderQueue = deque()
+        self.renderScheduled = False
+        self.renderTiming = None  # channel_data 표시 시간 측정 (모델, 시작 시각)
+
+        # 실시간 메시지 수신 버퍼
+        self.ingestBuffer = IngestBuffer(parent=self)
+        self.ingestBuffer.flushed.connect(self.onLiveMessages)
+
+        # 화면에 먼저 표시한 내 메시지 (서버 브로드캐스트 중복 표시 방지)
+        self.pendingEchoIds = set()
+
+        # 열려 있는 검색 결과 창 (로컬 결과에 서버 결과를 병합)
+        self.searchResultsDialog = None
 
-        # 워크스페이스 초기화
+        # 성능 지표 (Ctrl+Shift+M으로 디버그 패널 표시, 설정에 경로가 있으면 주기적으로 파일로 내보냄)
+        self.metrics.addCollector(self.collectMetrics)
+        self.metricsDialog = None
+        self.metricsExportTimer = QTimer(self)
+        self.metricsExportTimer.setInterval(METRICS_EXPORT_INTERVAL_SEC * 1000)
+        self.metricsExportTimer.timeout.connect(self.exportMetrics)
+        self.applyMetricsExport()
+        QShortcut(QKeySequence("Ctrl+Shift+M"), self, self.showMetricsDialog)
+
+        # 지난 세션의 최근 메시지 표시 (연결되면 이후 메시지만 동기화)
+        self.showStoredMessages(self.current_channel)
+
+        # 워크스페이스 초기화 (사용자 등록과 목록 요청은 연결된 뒤 bootstrap으로 한 번에 처리)
         self.initWorkspaces()
+        self.startup.mark("restore_view")
 
-        # 사용자 등록
-        self.registerUser()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.firstShown:
+            # 첫 화면이 그려진 다음 이벤트 루프에서 시작 시간 보고 후 나머지 준비
+            self.firstShown = True
+            QTimer.singleShot(0, self.finishStartup)
+
+    def finishStartup(self):
+        """시작 시간을 보고하고 화면 표시에 필요 없던 트레이 아이콘 생성"""
+        self.startup.mark("first_frame")
+        self.startup.finish(self.metrics)
+        if self.isVisible():
+            self.createTrayIcon()
         
     def initWebSocketWorker(self):
         """WebSocket 워커 초기화"""
         self.wsThread = QThread()
-        server_url = load_from_registry("server_url") or SERVER_URL
-        self.wsWorker = WebSocketWorker(QUrl(server_url))
+        server_url = self.settings.value("server_url") or SERVER_URL
+        recorder = TrafficRecorder(self.record_path) if self.record_path else None
+        self.wsWorker = WebSocketWorker(QUrl(server_url), app_data_path("outbox.json"), recorder)
         self.wsWorker.moveToThread(self.wsThread)
         self.wsThread.started.connect(self.wsWorker.start)
-        self.wsThread.finished.connect(self.wsWorker.stop)
-        self.wsWorker.newMessage.connect(self.onWebSocketMessage)
+        # 워커의 타이머와 소켓은 워커 스레드에서 정리되도록 스레드가 끝날 때 해제
+        self.wsThread.finished.connect(self.wsWorker.deleteLater)
+        self.wsWorker.frameReceived.connect(self.onWebSocketFrame)
         self.wsWorker.errorOccurred.connect(self.onWebSocketError)
         self.wsWorker.connected.connect(self.onWebSocketConnected)
         self.wsWorker.disconnected.connect(self.onWebSocketDisconnected)
+        self.wsWorker.deliveryFailed.connect(self.onDeliveryFailed)
         self.wsThread.start()
-        
-        self.reconnectTimer = QTimer(self)
-        self.reconnectTimer.setInterval(5000)  # 5초 간격으로 재연결 시도
-        self.reconnectTimer.timeout.connect(self.reconnectWebSocket)
 
     def reconnectWebSocket(self):
-        """WebSocket 재연결"""
-        server_url = load_from_registry("server_url") or SERVER_URL
-        self.wsWorker.url = QUrl(server_url)
-        QMetaObject.invokeMethod(self.wsWorker, "start", Qt.QueuedConnection)
+        """설정된 서버 주소로 WebSocket 재연결"""
+        server_url = self.settings.value("server_url") or SERVER_URL
+        QMetaObject.invokeMethod(self.wsWorker, "reconnect", Qt.QueuedConnection, Q_ARG(str, server_url))
 
-    def registerUser(self):
-        """사용자 등록"""
-        username = load_from_registry("username") or "사용자"
+    def buildRequest(self, action, **fields):
+        """공통 헤더(date, time, sender)를 붙인 요청 프레임 구성"""
         current_time = datetime.now()
-        request_message = json.dumps({
+        request = {
             "date": current_time.strftime("%Y-%m-%d"),
             "time": current_time.strftime("%I:%M:%S"),
-            "sender": username,
-            "action": "register_user",
-            "username": username
-        })
+            "sender": self.settings.value("username") or "사용자",
+            "action": action
+        }
+        request.update(fields)
+        return request
+
+    def sendRequest(self, action, on_response=None, on_timeout=None, key=None, **fields):
+        """요청 프레임을 WebSocket 워커로 전송 (인코딩은 워커가 협상 결과에 맞춰 처리)
+
+        응답은 request_id로 요청과 연결된다. on_response가 없으면 action별 처리기로
+        전달하고, key가 같은 이전 요청은 취소되어 늦게 온 응답을 버린다.
+        """
+        timeout = REQUEST_TIMEOUTS.get(action, REQUEST_TIMEOUT_SEC)
+        request_id = self.requests.track(action, timeout, on_response, on_timeout, key)
+        request = self.buildRequest(action, request_id=request_id, **fields)
         QMetaObject.invokeMethod(
             self.wsWorker,
             "sendMessage",
             Qt.QueuedConnection,
-            Q_ARG(str, request_message)
+            Q_ARG(str, json.dumps(request))
         )
+        return request
+
+    def registerUser(self):
+        """사용자 등록"""
+        username = self.settings.value("username") or "사용자"
+        self.sendRequest("register_user", username=username)
 
     def createTrayIcon(self):
         """시스템 트레이 아이콘 생성"""
@@ -936,8 +3301,10 @@ class MainWindow(QMainWindow):
         self.trayIcon.show()
 
     def showTrayMessage(self, title: str, message: str):
-        """트레이 알림 표시"""
-        if self.trayIcon.isVisible():
+        """트레이 알림 표시 (트레이 아이콘을 만들기 전이면 로그만 남김)"""
+        if self.trayIcon is None:
+            ui_log.info("%s: %s", title, message)
+        elif self.trayIcon.isVisible():
             self.trayIcon.showMessage(title, message, QSystemTrayIcon.Information, 3000)
 
     def onTrayIconActivated(self, reason):
@@ -948,102 +3315,341 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """창 닫기 이벤트 처리"""
-        self.trayIcon.hide()
-        self.wsThread.quit()
-        self.wsThread.wait()
+        if self.trayIcon is not None:
+            self.trayIcon.hide()
+        if self.wsThread.isRunning():
+            QMetaObject.invokeMethod(self.wsWorker, "stop", Qt.BlockingQueuedConnection)
+            self.wsThread.quit()
+            self.wsThread.wait()
+        if self.wsWorker.recorder:
+            self.wsWorker.recorder.close()
+        if self.metricsExportTimer.isActive():
+            self.exportMetrics()
+        self.messageStore.close()
+        self.settings.sync()
         event.accept()
 
     def openSettingsDialog(self):
-        """설정 대화상자 열기"""
-        dialog = SettingsDialog(self)
-        if dialog.exec() == QDialog.Accepted:
-            # 서버 URL이 변경되었는지 확인
-            old_url = load_from_registry("server_url") or SERVER_URL
-            new_url = load_from_registry("server_url")
-            if new_url and old_url != new_url:
-                # WebSocket 재연결
-                self.wsWorker.stop()
-                self.reconnectWebSocket()
-                
-            # 사용자 이름이 변경되었는지 확인
-            username = load_from_registry("username")
-            if username:
-                self.registerUser()
+        """설정 대화상자 열기 (변경 사항은 onSettingChanged에서 바로 적용)"""
+        if self.settingsDialog is None:
+            self.settingsDialog = SettingsDialog(self)
+        else:
+            self.settingsDialog.loadSettings()
+        self.settingsDialog.exec()
+
+    @Slot(str, str)
+    def onSettingChanged(self, key, value):
+        """설정 변경 즉시 적용"""
+        if key == "server_url" and value and value != self.wsWorker.url.toString():
+            # WebSocket 재연결
+            self.reconnectWebSocket()
+        elif key == "username" and value:
+            self.registerUser()
+        elif key == "theme":
+            self.theme.apply(value)
+        elif key in ("metrics_export_path", "metrics_export_format"):
+            self.applyMetricsExport()
+
+    def showMetricsDialog(self):
+        """성능 지표 디버그 패널 표시"""
+        if self.metricsDialog is None:
+            self.metricsDialog = MetricsDialog(self.metrics, self)
+        self.metricsDialog.show()
+        self.metricsDialog.raise_()
+
+    def applyMetricsExport(self):
+        """설정에 내보낼 파일 경로가 있으면 주기적인 지표 내보내기 시작"""
+        if self.settings.value("metrics_export_path"):
+            self.metricsExportTimer.start()
+        else:
+            self.metricsExportTimer.stop()
+
+    @Slot()
+    def exportMetrics(self):
+        path = self.settings.value("metrics_export_path")
+        if path:
+            self.metrics.export(path, self.settings.value("metrics_export_format") or "json")
+
+    def collectMetrics(self, metrics):
+        """대기열 길이와 캐시 상태를 게이지로 기록"""
+        metrics.set("render_queue_batches", len(self.renderQueue))
+        metrics.set("ingest_pending", len(self.ingestBuffer.pending))
+        metrics.set("ingest_rate_per_sec", self.ingestBuffer.rate())
+        metrics.set("requests_pending", len(self.requests.pending))
+        metrics.set("outbox_queued", len(self.wsWorker.outbox.queue))
+        metrics.set("outbox_inflight", len(self.wsWorker.outbox.inflight))
+        metrics.set("channel_cache_channels", len(self.channelCache.entries))
+        metrics.set("channel_cache_rows", self.channelCache.totalRows())
+        metrics.set("message_rows", self.messageModel.rowCount())
+
+    @Slot(str)
+    def onThemeChanged(self, name):
+        """직접 그리는 목록은 새 팔레트로 다시 그림 (위젯은 다시 만들지 않음)"""
+        self.messageArea.viewport().update()
+        self.channelList.viewport().update()
+
+    def setActiveNav(self, name):
+        """좌측 메뉴 버튼의 선택 상태 표시 (None이면 모두 해제)"""
+        for text, btn in self.navButtons.items():
+            set_state(btn, "active", text == name)
 
     def onChannelSelected(self, channel_name):
         """채널 선택 시 동작"""
-        # 이전 선택 해제
-        if self.current_channel in self.channel_items:
-            self.channel_items[self.current_channel].update_selection(False)
-        
-        # 새 채널 선택
-        if channel_name in self.channel_items:
-            self.channel_items[channel_name].update_selection(True)
+        if self.channelModel.contains(channel_name):
+            self.setActiveNav(None)
+            self.channelModel.setSelected(channel_name)
             self.current_channel = channel_name
             self.channelTitle.setText(f"# {channel_name}")
             self.messageInput.setPlaceholderText(f"#{channel_name}에 메시지 보내기")
+            self.saveSession()
             
             # 채널 데이터 요청
             self.requestChannelData(channel_name)
 
+    def restoreSession(self):
+        """지난 세션의 워크스페이스, 채널 목록, 현재 채널을 로컬 저장소에서 복원
+
+        서버 목록을 기다리지 않고 바로 표시하며, 목록이 도착하면 차이만 반영한다.
+        """
+        workspace_list = self.messageStore.loadWorkspaces()
+        if not workspace_list:
+            return
+        workspace = self.settings.value("last_workspace")
+        if workspace not in workspace_list:
+            workspace = next(iter(workspace_list))
+        channels = workspace_list[workspace] or self.channels
+        channel = self.settings.value("last_channel")
+        if channel not in channels:
+            channel = channels[0]
+
+        self.workspaces = list(workspace_list)
+        self.current_workspace = workspace
+        self.current_channel = channel
+        self.channels = channels
+        self.channelModel.setChannels(channels)
+        self.channelModel.setSelected(channel)
+        self.channelTitle.setText(f"# {channel}")
+        self.messageInput.setPlaceholderText(f"#{channel}에 메시지 보내기")
+
+    def saveSession(self):
+        """다음 실행 시 복원할 현재 워크스페이스와 채널 기록"""
+        self.settings.setValue("last_workspace", self.current_workspace)
+        self.settings.setValue("last_channel", self.current_channel)
+
     def requestWorkspaceList(self):
         """워크스페이스 목록 요청"""
-        current_time = datetime.now()
-        username = load_from_registry("username") or "사용자"
-        request_message = json.dumps({
-            "date": current_time.strftime("%Y-%m-%d"),
-            "time": current_time.strftime("%I:%M:%S"),
-            "sender": username,
-            "action": "get_workspace_list",
-            "message": ""
-        })
-        QMetaObject.invokeMethod(
-            self.wsWorker,
-            "sendMessage",
-            Qt.QueuedConnection,
-            Q_ARG(str, request_message)
-        )
+        self.sendRequest("get_workspace_list", message="")
         
     def requestChannelList(self):
         """채널 목록 요청"""
-        current_time = datetime.now()
-        username = load_from_registry("username") or "사용자"
-        request_message = json.dumps({
-            "date": current_time.strftime("%Y-%m-%d"),
-            "time": current_time.strftime("%I:%M:%S"),
-            "sender": username,
-            "action": "get_channel_list",
-            "workspace": self.current_workspace,
-            "message": ""
-        })
-        QMetaObject.invokeMethod(
-            self.wsWorker,
-            "sendMessage",
-            Qt.QueuedConnection,
-            Q_ARG(str, request_message)
-        )
+        self.sendRequest("get_channel_list", workspace=self.current_workspace, message="")
         
     def requestChannelData(self, channel_name):
-        """채널 데이터 요청"""
-        self.messageArea.clear()
-        current_time = datetime.now()
-        username = load_from_registry("username") or "사용자"
-        request_message = json.dumps({
-            "date": current_time.strftime("%Y-%m-%d"),
-            "time": current_time.strftime("%I:%M:%S"),
-            "sender": username,
-            "action": "get_channel_data", 
-            "workspace": self.current_workspace,
-            "channel": channel_name, 
-            "message": ""
-        })
-        QMetaObject.invokeMethod(
-            self.wsWorker,
-            "sendMessage",
-            Qt.QueuedConnection,
-            Q_ARG(str, request_message)
+        """채널 데이터 요청 (캐시 또는 로컬 저장소의 내용을 먼저 표시하고 새 메시지만 동기화)"""
+        self.saveChannelCacheState(detach=True)
+        self.requests.cancel("history")
+        self.historyLoading = False
+        self.historyRequestKind = None
+
+        key = (self.current_workspace, channel_name)
+        entry = self.channelCache.get(key)
+        if entry is not None:
+            # 캐시된 모델을 바로 표시하고 새 메시지는 백그라운드로 동기화
+            self.showChannelModel(entry["model"])
+            self.historyCursor = entry["cursor"]
+            self.historyHasMore = entry["has_more"]
+            self.messageArea.restoreScrollState(entry["scroll"])
+            self.resumeRender(entry)
+            self.requestNewerMessages(channel_name)
+            return
+
+        self.showChannelModel(MessageListModel(self))
+        self.channelCache.put(key, {"model": self.messageModel, "cursor": None, "has_more": False, "scroll": None,
+                                    "pending": []})
+        self.channelCache.trim(keep=key)
+        self.historyHasMore = False
+        self.historyCursor = None
+
+        if self.showStoredMessages(channel_name):
+            self.requestNewerMessages(channel_name)
+        else:
+            self.requestHistoryPage(channel_name)
+
+    def showStoredMessages(self, channel_name):
+        """로컬 저장소의 최근 페이지 표시 (저장된 메시지가 없으면 False)"""
+        stored = self.messageStore.loadLatest(self.current_workspace, channel_name, HISTORY_PAGE_SIZE)
+        if not stored:
+            return False
+        self.renderMessages(display_messages(stored), "replace")
+        # 더 오래된 메시지는 저장소, 서버 순으로 조회
+        self.historyCursor = stored[0]["id"]
+        self.historyHasMore = True
+        return True
+
+    def showChannelModel(self, model):
+        """메시지 영역에 채널 모델 표시"""
+        self.messageModel = model
+        self.messageArea.setModel(model)
+
+    def renderMessages(self, messages, mode):
+        """메시지를 배치로 나누어 표시 (mode: "replace", "prepend", "append")
+
+        큰 목록은 화면에 보이는 최신 배치를 먼저 표시하고 나머지는
+        이벤트 루프 틱마다 한 배치씩 한 번의 모델 편집으로 추가한다.
+        """
+        model = self.messageModel
+        was_idle = not self.renderQueue
+        batches = [messages[i:i + RENDER_BATCH_SIZE] for i in range(0, len(messages), RENDER_BATCH_SIZE)]
+
+        if mode == "replace":
+            # 교체되는 모델의 대기 중인 배치는 버림
+            self.renderQueue = deque(item for item in self.renderQueue if item[0] is not model)
+            model.setMessages(batches.pop() if batches else [])
+            for batch in reversed(batches):
+                self.renderQueue.append((model, "prepend", batch))
+        elif mode == "prepend":
+            for batch in reversed(batches):
+                self.renderQueue.append((model, "prepend", batch))
+        else:
+            for batch in batches:
+                self.renderQueue.append((model, "append", batch))
+
+        # 대기 중인 배치가 없었다면 첫 배치는 바로 표시
+        if was_idle and mode != "replace":
+            self.renderNextBatch()
+        self.finishRenderTiming()
+        self.scheduleRender()
+
+    def scheduleRender(self):
+        if self.renderQueue and not self.renderScheduled:
+            self.renderScheduled = True
+            QTimer.singleShot(0, self.onRenderTimer)
+
+    def onRenderTimer(self):
+        self.renderScheduled = False
+        self.renderNextBatch()
+        self.scheduleRender()
+
+    def renderNextBatch(self):
+        """대기열의 배치 하나를 모델에 반영"""
+        if not self.renderQueue:
+            return
+        model, op, batch = self.renderQueue.popleft()
+        started = time.perf_counter()
+        if op == "prepend":
+            model.prependMessages(batch)
+        else:
+            model.appendMessages(batch)
+        self.metrics.observe("render_batch_ms", (time.perf_counter() - started) * 1000)
+        self.finishRenderTiming()
+
+    def finishRenderTiming(self):
+        """channel_data 페이지의 마지막 배치까지 표시되면 걸린 시간 기록"""
+        if self.renderTiming is None:
+            return
+        model, started = self.renderTiming
+        if not self.hasPendingRender(model):
+            self.renderTiming = None
+            self.metrics.observe("channel_data_render_ms", (time.perf_counter() - started) * 1000)
+
+    def hasPendingRender(self, model):
+        return any(item[0] is model for item in self.renderQueue)
+
+    def takePendingRender(self, model):
+        """모델의 대기 중인 배치를 대기열에서 꺼내 반환 (순서 유지)"""
+        pending = [item for item in self.renderQueue if item[0] is model]
+        if pending:
+            self.renderQueue = deque(item for item in self.renderQueue if item[0] is not model)
+            if self.renderTiming is not None and self.renderTiming[0] is model:
+                self.renderTiming = None
+        return pending
+
+    def resumeRender(self, entry):
+        """캐시에 보관해 둔 배치를 대기열에 되돌려 이어서 표시"""
+        if entry["pending"]:
+            self.renderQueue.extend(entry["pending"])
+            entry["pending"] = []
+            self.scheduleRender()
+
+    def saveChannelCacheState(self, detach=False):
+        """현재 채널의 페이지 커서와 스크롤 위치를 캐시에 기록
+
+        detach가 참이면(채널 전환) 아직 표시하지 않은 배치를 한꺼번에 반영하지 않고
+        채널 모델과 함께 보관했다가 채널을 다시 볼 때 이어서 표시한다.
+        """
+        pending = self.takePendingRender(self.messageModel) if detach else []
+        for entry in self.channelCache.entries.values():
+            if entry["model"] is self.messageModel:
+                entry["pending"] = pending
+                entry["cursor"] = self.historyCursor
+                entry["has_more"] = self.historyHasMore
+                if self.messageArea.model() is self.messageModel:
+                    entry["scroll"] = self.messageArea.scrollState()
+                break
+
+    def requestNewerMessages(self, channel_name):
+        """마지막으로 저장된 메시지 이후의 메시지만 요청 (증분 동기화)"""
+        after = self.messageStore.lastMessageId(self.current_workspace, channel_name)
+        if after is None:
+            self.requestHistoryPage(channel_name)
+        else:
+            self.requestHistoryPage(channel_name, after=after)
+
+    def requestOlderMessages(self):
+        """이전 페이지 요청 (위로 스크롤 시)"""
+        if self.historyLoading or not self.historyHasMore or self.historyCursor is None:
+            return
+        # 이전 배치가 아직 표시 중이면 순서가 섞이지 않도록 대기
+        if self.hasPendingRender(self.messageModel):
+            return
+
+        stored = self.messageStore.loadBefore(self.current_workspace, self.current_channel,
+                                              self.historyCursor, HISTORY_PAGE_SIZE)
+        if stored:
+            self.renderMessages(display_messages(stored), "prepend")
+            self.historyCursor = stored[0]["id"]
+            return
+
+        self.requestHistoryPage(self.current_channel, before=self.historyCursor)
+
+    def requestHistoryPage(self, channel_name, before=None, after=None):
+        """채널 히스토리 한 페이지 요청 (진행 중이던 이전 페이지 요청은 취소)"""
+        self.historyLoading = True
+        if before is not None:
+            self.historyRequestKind = "older"
+        elif after is not None:
+            self.historyRequestKind = "newer"
+        else:
+            self.historyRequestKind = "latest"
+
+        fields = {}
+        if before is not None:
+            fields["before"] = before
+        if after is not None:
+            fields["after"] = after
+        self.sendRequest(
+            "get_channel_data",
+            workspace=self.current_workspace,
+            channel=channel_name,
+            message="",
+            limit=HISTORY_PAGE_SIZE,
+            on_timeout=self.onHistoryTimeout,
+            key="history",
+            **fields
         )
 
+    def onHistoryTimeout(self):
+        """히스토리 응답이 오지 않으면 다음 스크롤 또는 재연결 시 다시 요청할 수 있게 함"""
+        self.historyLoading = False
+        self.historyRequestKind = None
+
+    def isStaleHistoryPage(self, data):
+        """다른 채널의 페이지 응답인지 확인 (request_id를 돌려주지 않는 서버용)"""
+        channel = data.get("channel")
+        workspace = data.get("workspace")
+        return ((channel is not None and channel != self.current_channel) or
+                (workspace is not None and workspace != self.current_workspace))
+
     @Slot()
     def onSendClicked(self):
         """메시지 전송 버튼 클릭 시 동작"""
@@ -1054,215 +3660,287 @@ class MainWindow(QMainWindow):
         channel = self.current_channel
         current_time = datetime.now()
         current_date = current_time.strftime("%Y-%m-%d")
-        username = load_from_registry("username") or "사용자"
-        
-        # WebSocket 메시지 전송
-        request_message = json.dumps({
-            "date": current_date, 
-            "time": current_time.strftime("%I:%M:%S"), 
-            "sender": username,
-            "action": "send_message", 
-            "workspace": self.current_workspace,
-            "channel": channel, 
-            "message": text
-        })
-        QMetaObject.invokeMethod(
-            self.wsWorker,
-            "sendMessage",
-            Qt.QueuedConnection,
-            Q_ARG(str, request_message)
+        username = self.settings.value("username") or "사용자"
+        
+        # WebSocket 메시지 전송 (client_msg_id로 서버 확인 및 내 메시지 브로드캐스트 식별)
+        client_msg_id = uuid.uuid4().hex
+        self.pendingEchoIds.add(client_msg_id)
+        self.sendRequest(
+            "send_message",
+            workspace=self.current_workspace,
+            channel=channel,
+            message=text,
+            client_msg_id=client_msg_id,
+            key=client_msg_id
         )
 
-        # 현재 메시지 영역에 마지막 날짜 구분선이 없는 경우 추가
-        last_date_in_view = self.getLastDateInMessageArea()
-        if last_date_in_view != current_date:
-            self.messageArea.append(self.formatDateSeparator(current_date))
-        
-        # 메시지 추가
-        formatted_time = current_time.strftime('%p %I:%M')
-        self.messageArea.append(self.formatMessage(username, formatted_time, text))
+        # 메시지 추가 (날짜가 바뀐 경우 구분선 포함)
+        self.renderMessages([{
+            "date": current_date,
+            "time": current_time.strftime('%p %I:%M'),
+            "sender": username,
+            "message": text
+        }], "append")
         self.messageInput.clear()
 
-    def formatMessage(self, sender, time, message):
-        """메시지 포맷팅"""
-        return f"""
-        <div style="margin-bottom: 12px;">
-            <div style="font-weight: bold;">{sender} <span style="font-weight: normal; color: #616061; font-size: 12px;">{time}</span></div>
-            <div>{message}</div>
-        </div>
-        """
-
-    def formatDateSeparator(self, date_str):
-        """날짜 구분선 포맷팅"""
-        formatted_date = format_date_korean(date_str)
-        return f"""
-        <div style="display: flex; align-items: center; margin: 20px 0; color: #616061;">
-            <hr style="flex-grow: 1; border: none; border-top: 1px solid #E8E8E8; margin-right: 10px;">
-            <div style="font-size: 14px; font-weight: bold;">{formatted_date}</div>
-            <hr style="flex-grow: 1; border: none; border-top: 1px solid #E8E8E8; margin-left: 10px;">
-        </div>
-        """
-
-    def getLastDateInMessageArea(self):
-        """메시지 영역에 표시된 마지막 날짜 구분선의 날짜를 반환"""
-        # 실제로는 HTML 파싱이 필요하지만, 간단한 구현으로 현재 날짜 반환
-        return datetime.now().strftime("%Y-%m-%d")
-
     @Slot(QNetworkReply)
     def onRestReplyFinished(self, reply: QNetworkReply):
         """REST API 응답 처리"""
         if reply.error() == QNetworkReply.NoError:
             response = reply.readAll().data().decode('utf-8')
-            print("[REST] Response:", response)
+            net_log.debug("REST response", extra={"body": response[:200]})
         else:
             err = reply.errorString()
-            print("[REST] Error:", err)
+            net_log.warning("REST error: %s", err)
             self.showTrayMessage("REST Error", err)
         reply.deleteLater()
 
-    @Slot(str)
-    def onWebSocketMessage(self, msg: str):
-        """WebSocket 메시지 수신 처리"""
+    def registerActionHandlers(self):
+        """수신 프레임 action별 처리기 등록"""
+        self.actionHandlers = {
+            "channel_data": self.onChannelData,
+            "workspace_list": self.onWorkspaceList,
+            "channel_list": self.onChannelList,
+            "workspace_update": self.onWorkspaceUpdate,
+            "channel_update": self.onChannelUpdate,
+            "search_response": self.handleSearchResponse,
+            "register_user_response": self.onRegisterUserResponse,
+            "send_message_response": self.onSendMessageResponse,
+            "bootstrap_response": self.onBootstrap,
+        }
+        for action in ("create_workspace_response", "delete_workspace_response", "update_workspace_response"):
+            self.actionHandlers[action] = self.onWorkspaceOperationResponse
+        for action in ("create_channel_response", "delete_channel_response", "update_channel_response"):
+            self.actionHandlers[action] = self.onChannelOperationResponse
+
+    @Slot(object)
+    def onWebSocketFrame(self, frame):
+        """WebSocket 프레임 수신 처리 (워커 스레드에서 디코딩된 프레임)"""
+        # 취소되거나 시간이 지난 요청의 응답은 버림
+        handled, request = self.requests.resolve(frame)
+        if handled:
+            return
+        # 사용자 메시지 확인(ack 또는 브로드캐스트)이 request_id 없이 오면 대기 중인 전송 요청 정리
+        client_msg_id = frame.data.get("client_msg_id")
+        if client_msg_id:
+            self.requests.complete(client_msg_id)
+        if request is not None and request.on_response is not None:
+            handler = request.on_response
+        else:
+            # 등록되지 않은 action은 일반 메시지로 처리
+            handler = self.actionHandlers.get(frame.action, self.onChatMessage)
+        started = time.perf_counter()
         try:
-            data = json.loads(msg)
-            action = data.get("action")
+            handler(frame.data)
+        except Exception as e:
+            ui_log.exception("Error processing frame: %s", e, extra={"action": frame.action})
+        self.metrics.observe("frame_handle_ms", (time.perf_counter() - started) * 1000,
+                             action=frame.action or "unknown")
+
+    def onChannelData(self, data):
+        """채널 히스토리 페이지 수신"""
+        if self.isStaleHistoryPage(data):
+            return
+        self.renderTiming = (self.messageModel, time.perf_counter())
+
+        messages = data.get("message", [])
+        request_kind = self.historyRequestKind or "latest"
+        self.historyLoading = False
+        self.historyRequestKind = None
+        
+        channel = data.get("channel", self.current_channel)
+        
+        if request_kind == "newer":
+            # 증분 동기화: 새 메시지를 뒤에 추가하고 남은 메시지가 있으면 계속 요청
+            self.renderMessages(display_messages(messages), "append")
+            self.storeMessages(channel, messages)
+            if data.get("has_more") and messages and messages[-1].get("id") is not None:
+                self.requestHistoryPage(channel, after=messages[-1]["id"])
+            return
+        
+        # 페이지 커서 갱신 (ID가 없는 구 서버 응답은 전체 히스토리로 간주)
+        if messages and messages[0].get("id") is not None:
+            self.historyCursor = messages[0]["id"]
+            self.historyHasMore = bool(data.get("has_more", False))
+        else:
+            self.historyHasMore = False
+        
+        # 날짜별로 묶어서 한 번에 표시 (24시간 형식은 12시간 형식으로 변환)
+        if request_kind == "older":
+            self.renderMessages(display_messages(messages), "prepend")
+        else:
+            self.renderMessages(display_messages(messages), "replace")
+        self.channelCache.trim(keep=(self.current_workspace, self.current_channel))
+        self.storeMessages(channel, messages)
+
+    def storeMessages(self, channel, messages):
+        """받은 원본을 로컬 저장소에 저장 (화면에 먼저 표시하고 이벤트 루프 틱마다 나누어 저장)"""
+        self.messageStore.queueMessages(self.current_workspace, channel, messages)
+        if not self.storeWriteTimer.isActive():
+            self.storeWriteTimer.start()
+
+    @Slot()
+    def writeStoredMessages(self):
+        if not self.messageStore.writeQueued():
+            self.storeWriteTimer.stop()
+
+    def onWorkspaceList(self, data):
+        """워크스페이스 목록 수신"""
+        self.sessionEstablished = True
+        self.workspaces = []
+        self.channels = []
+        
+        workspace_list = data.get("message", {})
+        for workspace in workspace_list.keys():
+            self.workspaces.append(workspace)
+        self.messageStore.saveWorkspaces(workspace_list)
+        
+        # 보고 있던 워크스페이스가 없어졌으면 첫 번째 워크스페이스 선택
+        if self.workspaces:
+            if self.current_workspace not in self.workspaces:
+                self.current_workspace = self.workspaces[0]
             
-            if action == "channel_data":
-                self.messageArea.clear()
-                messages = data.get("message", [])
-                
-                # 메시지를 날짜별로 그룹화
-                message_groups = {}
-                for message in messages:
-                    date = message.get("date", "Unknown")
-                    if date not in message_groups:
-                        message_groups[date] = []
-                    message_groups[date].append(message)
-                
-                # 정렬된 날짜 목록
-                sorted_dates = sorted(message_groups.keys())
-                
-                # 날짜별로 메시지 표시
-                for date in sorted_dates:
-                    # 날짜 구분선 추가
-                    self.messageArea.append(self.formatDateSeparator(date))
-                    
-                    # 해당 날짜의 메시지들 추가
-                    for message in message_groups[date]:
-                        sender = message.get("sender", "Unknown")
-                        time = message.get("time", "")
-                        # 24시간 형식을 12시간 형식으로 변환
-                        try:
-                            time_obj = datetime.strptime(time, "%H:%M:%S")
-                            time = time_obj.strftime("%p %I:%M")
-                        except:
-                            pass
-                            
-                        text = message.get("message", "")
-                        self.messageArea.append(self.formatMessage(sender, time, text))
-                        
-            elif action == "workspace_list":
-                self.workspaces = []
-                self.channels = []
-                
-                workspace_list = data.get("message", {})
-                for workspace in workspace_list.keys():
-                    self.workspaces.append(workspace)
-                
-                # 첫 번째 워크스페이스 선택
-                if self.workspaces:
-                    self.updateWorkspaces(self.workspaces[0])
-                    
-                    # 채널 목록 업데이트
-                    if workspace_list.get(self.current_workspace):
-                        self.channels = workspace_list[self.current_workspace]
-                        self.updateChannelList(self.channels)
-                        
-                print("Received workspace list:", self.workspaces)
-                
-            elif action == "channel_list":
-                self.channels = data.get("message", [])
+            # 목록에 채널이 함께 왔으면 채널 목록을 따로 요청하지 않음
+            channels = workspace_list.get(self.current_workspace)
+            if isinstance(channels, list) and channels:
+                self.updateWorkspaceButton()
+                self.setupWorkspaceMenu()
+                self.channels = channels
                 self.updateChannelList(self.channels)
-                print("Received channel list:", self.channels)
-                
-            elif action == "workspace_update":
-                workspace_list = data.get("message", {})
-                self.workspaces = list(workspace_list.keys())
-                
-                # 현재 워크스페이스가 목록에 없으면 첫 번째 워크스페이스로 전환
-                if self.current_workspace not in self.workspaces and self.workspaces:
-                    self.updateWorkspaces(self.workspaces[0])
-                else:
-                    # 워크스페이스 메뉴 업데이트
-                    self.setupWorkspaceMenu()
-                    
-                print("Workspace update:", self.workspaces)
-                
-            elif action == "channel_update":
-                workspace = data.get("workspace")
-                if workspace == self.current_workspace:
-                    self.channels = data.get("message", [])
-                    self.updateChannelList(self.channels)
-                    print("Channel update:", self.channels)
-                    
-            elif action == "search_response":
-                self.handleSearchResponse(data)
-                
-            elif action == "register_user_response":
-                status = data.get("status")
-                message = data.get("message", "")
-                if status == "success":
-                    print("User registration successful:", message)
-                else:
-                    print("User registration failed:", message)
-                    self.showTrayMessage("사용자 등록", message)
-                    
-            elif action == "create_workspace_response" or action == "delete_workspace_response" or action == "update_workspace_response":
-                status = data.get("status")
-                message = data.get("message", "")
-                if status == "success":
-                    print(f"Workspace operation successful: {message}")
-                    self.showTrayMessage("워크스페이스 작업", message)
-                else:
-                    print(f"Workspace operation failed: {message}")
-                    self.showTrayMessage("워크스페이스 작업", message)
-                    
-            elif action == "create_channel_response" or action == "delete_channel_response" or action == "update_channel_response":
-                status = data.get("status")
-                message = data.get("message", "")
-                if status == "success":
-                    print(f"Channel operation successful: {message}")
-                    self.showTrayMessage("채널 작업", message)
-                else:
-                    print(f"Channel operation failed: {message}")
-                    self.showTrayMessage("채널 작업", message)
-                
             else:
-                # 일반 메시지
-                sender = data.get("sender", "Unknown")
-                text = data.get("message", "")
-                time = data.get("time", "")
-                date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
+                self.updateWorkspaces(self.current_workspace)
                 
-                # 현재 채널에 해당하는 메시지인지 확인
-                if data.get("channel") == self.current_channel:
-                    # 메시지 영역에 마지막 날짜 구분선이 없는 경우 추가
-                    last_date_in_view = self.getLastDateInMessageArea()
-                    if date != last_date_in_view:
-                        self.messageArea.append(self.formatDateSeparator(date))
-                        
-                    # 메시지 추가
-                    self.messageArea.append(self.formatMessage(sender, time, text))
-                
-                # 트레이 알림
-                if sender != load_from_registry("username"):
-                    self.showTrayMessage(f"새 메시지 ({data.get('channel', '알 수 없음')})", f"{sender}: {text}")
-                
-        except json.JSONDecodeError:
-            print("[WebSocketWorker] Failed to decode message:", msg)
-        except Exception as e:
-            print("[WebSocketWorker] Error processing message:", str(e))
-            traceback.print_exc()
+        ui_log.info("Workspace list received", extra={"workspaces": len(self.workspaces)})
+        ui_log.debug("Workspace list", extra={"workspaces": self.workspaces})
+
+    def onChannelList(self, data):
+        """채널 목록 수신"""
+        self.channels = data.get("message", [])
+        self.messageStore.saveChannels(data.get("workspace", self.current_workspace), self.channels)
+        self.updateChannelList(self.channels)
+        ui_log.info("Channel list received", extra={"channels": len(self.channels)})
+        ui_log.debug("Channel list", extra={"channels": self.channels})
+
+    def onWorkspaceUpdate(self, data):
+        """워크스페이스 변경 알림 수신"""
+        workspace_list = data.get("message", {})
+        self.workspaces = list(workspace_list.keys())
+        
+        # 현재 워크스페이스가 목록에 없으면 첫 번째 워크스페이스로 전환
+        if self.current_workspace not in self.workspaces and self.workspaces:
+            self.updateWorkspaces(self.workspaces[0])
+        else:
+            # 워크스페이스 메뉴 업데이트
+            self.setupWorkspaceMenu()
+            
+        ui_log.info("Workspace update", extra={"workspaces": len(self.workspaces)})
+
+    def onChannelUpdate(self, data):
+        """채널 변경 알림 수신"""
+        workspace = data.get("workspace")
+        if workspace:
+            self.messageStore.saveChannels(workspace, data.get("message", []))
+        if workspace == self.current_workspace:
+            self.channels = data.get("message", [])
+            self.updateChannelList(self.channels)
+            ui_log.info("Channel update", extra={"channels": len(self.channels)})
+
+    def onRegisterUserResponse(self, data):
+        """사용자 등록 응답 수신"""
+        status = data.get("status")
+        message = data.get("message", "")
+        if status == "success":
+            ui_log.info("User registration successful: %s", message)
+        else:
+            ui_log.warning("User registration failed: %s", message)
+            self.showTrayMessage("사용자 등록", message)
+
+    def onSendMessageResponse(self, data):
+        """메시지 전송 확인 수신 (ack 처리는 워커에서 완료됨)"""
+        if data.get("status") not in (None, "success"):
+            self.showTrayMessage("메시지 전송", data.get("message", "메시지를 전송하지 못했습니다."))
+
+    @Slot(str)
+    def onDeliveryFailed(self, client_msg_id):
+        """재전송 한도를 넘긴 메시지 알림"""
+        self.pendingEchoIds.discard(client_msg_id)
+        self.requests.cancel(client_msg_id)
+        self.showTrayMessage("메시지 전송", "메시지를 전송하지 못했습니다. 연결 상태를 확인하세요.")
+
+    def onWorkspaceOperationResponse(self, data):
+        """워크스페이스 생성/삭제/수정 응답 수신"""
+        status = data.get("status")
+        message = data.get("message", "")
+        if status == "success":
+            ui_log.info("Workspace operation successful: %s", message)
+            self.showTrayMessage("워크스페이스 작업", message)
+        else:
+            ui_log.warning("Workspace operation failed: %s", message)
+            self.showTrayMessage("워크스페이스 작업", message)
+
+    def onChannelOperationResponse(self, data):
+        """채널 생성/삭제/수정 응답 수신"""
+        status = data.get("status")
+        message = data.get("message", "")
+        if status == "success":
+            ui_log.info("Channel operation successful: %s", message)
+            self.showTrayMessage("채널 작업", message)
+        else:
+            ui_log.warning("Channel operation failed: %s", message)
+            self.showTrayMessage("채널 작업", message)
+
+    def onChatMessage(self, data):
+        """일반 메시지 수신 (같은 프레임에 도착한 메시지와 묶어서 반영)"""
+        self.ingestBuffer.add(data)
+
+    def isLocalEcho(self, data):
+        """전송하면서 이미 표시한 내 메시지의 브로드캐스트인지 확인"""
+        client_msg_id = data.get("client_msg_id")
+        if client_msg_id in self.pendingEchoIds:
+            self.pendingEchoIds.discard(client_msg_id)
+            return True
+        return False
+
+    def onLiveMessages(self, batch):
+        """수신 버퍼에 모인 실시간 메시지를 한 번에 반영"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        username = self.settings.value("username")
+        current = []
+        notifications = []
+        
+        for data in batch:
+            # 현재 워크스페이스의 현재 채널에 해당하는 메시지인지 확인
+            # (워크스페이스마다 같은 이름의 채널이 있으므로 둘 다 비교, workspace가 없는 구 서버는 현재 워크스페이스로 간주)
+            if (data.get("workspace", self.current_workspace) == self.current_workspace and
+                    data.get("channel") == self.current_channel):
+                current.append(data)
+            if data.get("sender", "Unknown") != username:
+                notifications.append(data)
+        
+        if current:
+            # 동기화가 끝난 채널만 저장 (다른 채널은 빠진 구간 없이 증분 동기화로 받음)
+            if self.historyRequestKind != "newer":
+                self.storeMessages(self.current_channel, current)
+            
+            # 메시지 추가 (날짜가 바뀐 경우 구분선 포함, 이미 표시한 내 메시지는 제외)
+            self.renderMessages([{
+                "id": data.get("id"),
+                "date": data.get("date", today),
+                "time": data.get("time", ""),
+                "sender": data.get("sender", "Unknown"),
+                "message": data.get("message", "")
+            } for data in current if not self.isLocalEcho(data)], "append")
+        
+        # 트레이 알림 (여러 개면 한 번에 요약)
+        if len(notifications) == 1:
+            data = notifications[0]
+            self.showTrayMessage(f"새 메시지 ({data.get('channel', '알 수 없음')})",
+                                 f"{data.get('sender', 'Unknown')}: {data.get('message', '')}")
+        elif notifications:
+            data = notifications[-1]
+            channels = sorted({n.get("channel", "알 수 없음") for n in notifications})
+            self.showTrayMessage(f"새 메시지 {len(notifications)}개 ({', '.join(channels)})",
+                                 f"{data.get('sender', 'Unknown')}: {data.get('message', '')}")
 
     def handleSearchResponse(self, data):
         """검색 응답 처리"""
@@ -1270,9 +3948,10 @@ class MainWindow(QMainWindow):
         results = data.get("results", [])
         
         if status == "success":
-            dialog = SearchResultsDialog(self, results)
-            dialog.messageSelected.connect(self.navigateToSearchResult)
-            dialog.exec()
+            # request_id를 돌려주지 않는 서버의 응답은 열려 있는 결과 목록에 병합
+            panel = self.searchResultsDialog.panel if self.searchResultsDialog is not None else self.quickSearchPanel()
+            panel.addResults(results)
+            panel.setLoading(False)
         else:
             error_message = data.get("message", "알 수 없는 오류")
             self.showTrayMessage("검색 오류", error_message)
@@ -1289,32 +3968,108 @@ class MainWindow(QMainWindow):
         # 다른 채널로 이동 필요한 경우
         if channel != self.current_channel:
             # 채널 목록에 추가가 필요할 수 있음
-            if channel not in self.channel_items:
-                channel_item = ChannelItem(channel)
-                channel_item.clicked.connect(self.onChannelSelected)
-                self.channel_items[channel] = channel_item
-                self.channelListLayout.addWidget(channel_item)
+            self.channelModel.addChannel(channel)
                 
             self.onChannelSelected(channel)
 
     @Slot(str)
     def onWebSocketError(self, err: str):
         """WebSocket 오류 처리"""
-        print("[WebSocket Error]:", err)
+        ui_log.debug("WebSocket error shown to user: %s", err)
         self.showTrayMessage("WebSocket Error", err)
-        self.reconnectTimer.start()
 
     @Slot()
     def onWebSocketConnected(self):
-        """WebSocket 연결 완료 시 동작"""
-        self.reconnectTimer.stop()
-        self.requestWorkspaceList()
+        """WebSocket 연결 완료 시 동작 (시작 상태를 한 번의 왕복으로 받아옴)"""
+        if self.bootstrapSupported:
+            self.requestBootstrap()
+        else:
+            self.requestStartupPipelined()
+
+    def requestBootstrap(self):
+        """사용자 등록, 워크스페이스와 채널 목록, 현재 채널의 최신 페이지를 한 요청으로 받아옴
+
+        표시 중인 메시지가 있으면 마지막으로 저장된 메시지 이후만 요청한다.
+        """
+        self.requests.cancel("history")
+        self.bootstrapApplied = False
+        after = None
+        if self.messageModel.rowCount() > 0:
+            after = self.messageStore.lastMessageId(self.current_workspace, self.current_channel)
+        self.historyLoading = True
+        self.historyRequestKind = "latest" if after is None else "newer"
+
+        fields = {} if after is None else {"after": after}
+        self.sendRequest(
+            "bootstrap",
+            username=self.settings.value("username") or "사용자",
+            workspace=self.current_workspace,
+            channel=self.current_channel,
+            limit=HISTORY_PAGE_SIZE,
+            on_response=self.onBootstrap,
+            on_timeout=self.onBootstrapTimeout,
+            key="bootstrap",
+            **fields
+        )
+
+    def onBootstrap(self, data):
+        """bootstrap 응답을 각 응답 처리기로 나누어 반영"""
+        page = data.get("channel_data")
+        if data.get("status") not in (None, "success") or page is None:
+            if not self.bootstrapSupported:
+                # 이미 개별 요청으로 전환한 뒤 도착한 응답
+                return
+            # bootstrap을 모르는 서버: 이후로는 개별 요청을 한꺼번에 보냄
+            # (request_id 없이 온 응답이면 대기 중인 요청이 남아 있으므로 함께 정리)
+            self.requests.cancel("bootstrap")
+            net_log.info("Bootstrap not supported, falling back to pipelined requests: %s", data.get("message", ""))
+            self.bootstrapSupported = False
+            self.requestStartupPipelined()
+            return
+        if self.isStaleHistoryPage(page):
+            # 다른 채널로 옮긴 뒤 도착한 응답 (request_id를 돌려주지 않는 서버, 재생 등)
+            return
+
+        # request_id 없이 온 응답도 대기 중인 요청을 정리해 시간 초과로 시작 요청을 다시 보내지 않게 함
+        self.requests.cancel("bootstrap")
+        self.bootstrapApplied = True
+        if "registration" in data:
+            self.onRegisterUserResponse(data["registration"])
+        if "workspaces" in data:
+            self.onWorkspaceList({"message": data["workspaces"]})
+        if isinstance(page.get("message"), list):
+            self.onChannelData(page)
+        else:
+            self.historyLoading = False
+            self.historyRequestKind = None
+
+    def onBootstrapTimeout(self):
+        """bootstrap 응답이 없으면 개별 요청으로 다시 시도"""
+        if self.bootstrapApplied or not self.bootstrapSupported:
+            return
+        net_log.warning("Bootstrap timed out, falling back to pipelined requests")
+        self.bootstrapSupported = False
+        self.requestStartupPipelined()
+
+    def requestStartupPipelined(self):
+        """bootstrap 대신 시작 요청을 응답을 기다리지 않고 한꺼번에 전송"""
         self.registerUser()
+        if not self.sessionEstablished:
+            # 첫 연결: 워크스페이스 목록(채널 목록 포함)을 받아옴
+            self.requestWorkspaceList()
+        # 재연결: 목록은 유지하고 마지막으로 받은 메시지 이후부터 이어서 동기화
+        if self.messageModel.rowCount() > 0:
+            self.requestNewerMessages(self.current_channel)
+        else:
+            self.requestChannelData(self.current_channel)
 
     @Slot()
     def onWebSocketDisconnected(self):
-        """WebSocket 연결 해제 시 동작"""
-        self.reconnectTimer.start()
+        """WebSocket 연결 해제 시 동작 (재연결은 워커가 백오프로 처리)"""
+        self.requests.cancel("bootstrap")
+        self.requests.cancel("history")
+        self.historyLoading = False
+        self.historyRequestKind = None
 
     def addChannel(self):
         """새 채널 추가"""
@@ -1327,42 +4082,17 @@ class MainWindow(QMainWindow):
                 return
                 
             # 서버에 채널 생성 요청
-            current_time = datetime.now()
-            username = load_from_registry("username") or "사용자"
-            
-            request_message = json.dumps({
-                "date": current_time.strftime("%Y-%m-%d"),
-                "time": current_time.strftime("%I:%M:%S"),
-                "sender": username,
-                "action": "create_channel",
-                "workspace": self.current_workspace,
-                "channel_name": channel_data["channel_name"],
-                "description": channel_data["description"]
-            })
-            
-            QMetaObject.invokeMethod(
-                self.wsWorker,
-                "sendMessage",
-                Qt.QueuedConnection,
-                Q_ARG(str, request_message)
+            self.sendRequest(
+                "create_channel",
+                workspace=self.current_workspace,
+                channel_name=channel_data["channel_name"],
+                description=channel_data["description"]
             )
 
     def updateChannelList(self, channels):
-        """채널 목록 업데이트"""
-        # 기존 채널 항목 제거
-        for item in self.channel_items.values():
-            self.channelListLayout.removeWidget(item)
-            item.deleteLater()
-        self.channel_items.clear()
-        
-        # 새 채널 항목 추가
-        for i, channel in enumerate(channels):
-            is_selected = (channel == self.current_channel)
-            channel_item = ChannelItem(channel, is_selected)
-            channel_item.clicked.connect(self.onChannelSelected)
-            self.channel_items[channel] = channel_item
-            # 채널 추가 버튼 앞에 추가
-            self.channelListLayout.insertWidget(i, channel_item)
+        """채널 목록 업데이트 (바뀐 채널만 반영)"""
+        self.channelModel.setChannels(channels)
+        self.channelModel.setSelected(self.current_channel)
             
         # 현재 채널이 목록에 없으면 첫 번째 채널 선택
         if self.current_channel not in channels and channels:
@@ -1371,9 +4101,6 @@ class MainWindow(QMainWindow):
     # 워크스페이스 관련 메소드
     def initWorkspaces(self):
         """워크스페이스 초기화"""
-        # 서버에서 워크스페이스 목록 요청
-        self.requestWorkspaceList()
-        
         # 워크스페이스 버튼 업데이트
         self.updateWorkspaceButton()
         
@@ -1445,27 +4172,15 @@ class MainWindow(QMainWindow):
         workspace_name, ok = QInputDialog.getText(self, "새 워크스페이스 생성", "워크스페이스 이름:")
         if ok and workspace_name:
             # 서버에 워크스페이스 생성 요청
-            current_time = datetime.now()
-            username = load_from_registry("username") or "사용자"
-            
-            request_message = json.dumps({
-                "date": current_time.strftime("%Y-%m-%d"),
-                "time": current_time.strftime("%I:%M:%S"),
-                "sender": username,
-                "action": "create_workspace",
-                "workspace_name": workspace_name
-            })
-            
-            QMetaObject.invokeMethod(
-                self.wsWorker,
-                "sendMessage",
-                Qt.QueuedConnection,
-                Q_ARG(str, request_message)
-            )
+            self.sendRequest("create_workspace", workspace_name=workspace_name)
 
     def manageWorkspaces(self):
         """워크스페이스 관리"""
-        dialog = WorkspaceDialog(self, self.workspaces)
+        if self.workspaceDialog is None:
+            self.workspaceDialog = WorkspaceDialog(self, self.workspaces)
+        else:
+            self.workspaceDialog.setWorkspaces(self.workspaces)
+        dialog = self.workspaceDialog
         if dialog.exec() == QDialog.Accepted:
             new_workspaces = dialog.getWorkspaces()
             
@@ -1487,43 +4202,11 @@ class MainWindow(QMainWindow):
 
     def createWorkspaceFromDialog(self, workspace_name):
         """대화상자에서 워크스페이스 생성"""
-        current_time = datetime.now()
-        username = load_from_registry("username") or "사용자"
-        
-        request_message = json.dumps({
-            "date": current_time.strftime("%Y-%m-%d"),
-            "time": current_time.strftime("%I:%M:%S"),
-            "sender": username,
-            "action": "create_workspace",
-            "workspace_name": workspace_name
-        })
-        
-        QMetaObject.invokeMethod(
-            self.wsWorker,
-            "sendMessage",
-            Qt.QueuedConnection,
-            Q_ARG(str, request_message)
-        )
+        self.sendRequest("create_workspace", workspace_name=workspace_name)
 
     def deleteWorkspace(self, workspace_name):
         """워크스페이스 삭제"""
-        current_time = datetime.now()
-        username = load_from_registry("username") or "사용자"
-        
-        request_message = json.dumps({
-            "date": current_time.strftime("%Y-%m-%d"),
-            "time": current_time.strftime("%I:%M:%S"),
-            "sender": username,
-            "action": "delete_workspace",
-            "workspace": workspace_name
-        })
-        
-        QMetaObject.invokeMethod(
-            self.wsWorker,
-            "sendMessage",
-            Qt.QueuedConnection,
-            Q_ARG(str, request_message)
-        )
+        self.sendRequest("delete_workspace", workspace=workspace_name)
 
     # 검색 관련 메소드
     def onGlobalSearch(self):
@@ -1543,12 +4226,14 @@ class MainWindow(QMainWindow):
             self.showTrayMessage("검색", "검색어를 입력하세요.")
 
     def showSearchDialog(self, query=None, workspace=None, channel=None):
-        """검색 대화상자 표시"""
-        dialog = SearchDialog(self, 
-                            self.workspaces, 
-                            self.channels, 
-                            self.current_workspace, 
-                            self.current_channel)
+        """검색 대화상자 표시 (처음 열 때 만들고, 이후에는 목록만 갱신하고 이전 조건은 유지)"""
+        if self.searchDialog is None:
+            self.searchDialog = SearchDialog(self, self.workspaces, self.channels,
+                                             self.current_workspace, self.current_channel)
+        else:
+            self.searchDialog.setChoices(self.workspaces, self.channels,
+                                         self.current_workspace, self.current_channel)
+        dialog = self.searchDialog
         
         # 기본 검색어 설정
         if query:
@@ -1578,126 +4263,199 @@ class MainWindow(QMainWindow):
         if not params.get("query"):
             self.showTrayMessage("검색", "검색어가 필요합니다.")
             return
-        
-        current_time = datetime.now()
-        username = load_from_registry("username") or "사용자"
-        
-        # 검색 요청 메시지 구성
-        request_message = {
-            "date": current_time.strftime("%Y-%m-%d"),
-            "time": current_time.strftime("%I:%M:%S"),
-            "sender": username,
-            "action": "search",
-            "query": params.get("query")
-        }
-        
-        # 옵션 파라미터 추가
-        for key in ["workspace", "channel", "sender", "date_from", "date_to"]:
-            if key in params and params[key]:
-                request_message[key] = params[key]
-        
-        # 검색 요청 전송
-        QMetaObject.invokeMethod(
-            self.wsWorker,
-            "sendMessage",
-            Qt.QueuedConnection,
-            Q_ARG(str, json.dumps(request_message))
+
+        # 받아 둔 메시지에서 먼저 찾아 바로 표시하고 서버 결과는 도착하면 병합
+        if self.searchResultsDialog is not None:
+            self.searchResultsDialog.close()
+        dialog = SearchResultsDialog(self)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.messageSelected.connect(self.navigateToSearchResult)
+        dialog.finished.connect(lambda _, dialog=dialog: self.onSearchResultsClosed(dialog))
+        self.searchResultsDialog = dialog
+        self.startSearch(dialog.panel, params, "search", 1)
+        dialog.show()
+
+    def onSearchResultsClosed(self, dialog):
+        if self.searchResultsDialog is dialog:
+            self.searchResultsDialog = None
+            self.requests.cancel("search")
+
+    @Slot(str)
+    def scheduleQuickSearch(self, text):
+        """검색창 입력 시 입력이 잠시 멈추면 빠른 검색 (이전 예약은 취소)"""
+        self.quickSearchSource = self.sender()
+        self.quickSearchTimer.start()
+
+    def runQuickSearch(self):
+        """검색창 내용으로 빠른 검색 패널 갱신"""
+        source = self.quickSearchSource or self.searchBox
+        query = source.text().strip()
+        if len(query) < SEARCH_MIN_CHARS:
+            self.requests.cancel("quick_search")
+            if self.searchDock is not None:
+                self.searchPanel.setQuery("")
+                self.searchPanel.setLoading(False)
+                self.searchDock.hide()
+            return
+
+        params = {"query": query}
+        if source is self.headerSearch:
+            params["workspace"] = self.current_workspace
+            params["channel"] = self.current_channel
+        panel = self.quickSearchPanel()
+        self.searchDock.show()
+        self.startSearch(panel, params, "quick_search", SEARCH_STREAM_PAGES)
+
+    def quickSearchPanel(self):
+        """빠른 검색 결과 패널 반환 (처음 호출 시 도킹 창과 함께 생성)"""
+        if self.searchPanel is None:
+            self.searchPanel = SearchResultsPanel()
+            self.searchPanel.messageSelected.connect(self.navigateToSearchResult)
+            self.searchDock = QDockWidget("검색 결과", self)
+            self.searchDock.setObjectName("searchDock")
+            self.searchDock.setWidget(self.searchPanel)
+            self.addDockWidget(Qt.RightDockWidgetArea, self.searchDock)
+            self.searchDock.hide()
+        return self.searchPanel
+
+    def startSearch(self, panel, params, key, max_pages=None):
+        """로컬 검색 결과를 바로 표시하고 서버 검색 결과를 페이지 단위로 이어 받음
+
+        새 검색을 시작하면 같은 key의 이전 서버 요청은 취소되어 늦게 온 응답은 버려진다.
+        """
+        options = {}
+        for field in ["workspace", "channel", "sender", "date_from", "date_to"]:
+            if params.get(field):
+                options[field] = params[field]
+
+        panel.setQuery(params["query"])
+        panel.addResults(self.messageStore.search(params["query"], **options))
+        self.requestSearchPage(panel, params["query"], options, key, 0, max_pages)
+
+    def requestSearchPage(self, panel, query, options, key, offset, max_pages):
+        """서버 검색 결과 한 페이지 요청 (sender 필터는 공통 헤더의 sender를 대체)"""
+        self.sendRequest(
+            "search",
+            on_response=lambda data: self.onSearchPage(data, panel, query, options, key, offset, max_pages),
+            on_timeout=lambda: self.onSearchTimeout(panel),
+            key=key,
+            query=query,
+            limit=SEARCH_PAGE_SIZE,
+            offset=offset,
+            **options
         )
 
+    def onSearchPage(self, data, panel, query, options, key, offset, max_pages):
+        """서버 검색 결과 페이지를 결과 목록에 병합하고 남은 페이지가 있으면 이어서 요청"""
+        if data.get("status") != "success":
+            panel.setLoading(False)
+            self.showTrayMessage("검색 오류", data.get("message", "알 수 없는 오류"))
+            return
+        results = data.get("results", [])
+        panel.addResults(results)
+
+        # 남은 결과는 max_pages까지 바로 이어 받고 그 뒤로는 스크롤할 때 요청
+        next_offset = offset + len(results)
+        if data.get("has_more") and results:
+            request_next = lambda: self.requestSearchPage(panel, query, options, key, next_offset, max_pages)
+            if max_pages is None or next_offset // SEARCH_PAGE_SIZE < max_pages:
+                request_next()
+                return
+            panel.setNextPage(request_next)
+        panel.setLoading(False)
+
+    def onSearchTimeout(self, panel):
+        panel.setLoading(False)
+        self.showTrayMessage("검색 오류", "검색 응답 시간이 초과되었습니다.")
+
+    def showNotice(self, title, text):
+        """채널 대신 안내 화면 표시"""
+        self.saveChannelCacheState()
+        if self.noticeModel is None:
+            self.noticeModel = MessageListModel(self)
+        self.noticeModel.showNotice(title, text)
+        self.messageArea.setModel(self.noticeModel)
+
     def navigateToHome(self):
         """홈 화면으로 이동하는 로직"""
-        self.messageArea.clear()
-        self.messageArea.append("""
-        <div style="text-align:center; margin-top:50px;">
-            <h2>홈</h2>
-            <p>최근 활동 및 알림을 표시하는 화면입니다.</p>
-        </div>
-        """)
+        self.setActiveNav("홈")
+        self.showNotice("홈", "최근 활동 및 알림을 표시하는 화면입니다.")
         self.messageInput.setPlaceholderText("메시지를 입력하세요")
         self.channelTitle.setText("🏠 홈")
 
     def navigateToDM(self):
         """DM 화면으로 이동하는 로직"""
-        self.messageArea.clear()
-        self.messageArea.append("""
-        <div style="text-align:center; margin-top:50px;">
-            <h2>다이렉트 메시지</h2>
-            <p>사용자와의 개인 메시지를 주고받는 화면입니다.</p>
-        </div>
-        """)
+        self.setActiveNav("DM")
+        self.showNotice("다이렉트 메시지", "사용자와의 개인 메시지를 주고받는 화면입니다.")
         self.messageInput.setPlaceholderText("DM을 입력하세요")
         self.channelTitle.setText("✉️ 다이렉트 메시지")
 
     def navigateToActivity(self):
         """내 활동 화면으로 이동하는 로직"""
-        self.messageArea.clear()
-        self.messageArea.append("""
-        <div style="text-align:center; margin-top:50px;">
-            <h2>내 활동</h2>
-            <p>나의 최근 활동 내역을 확인하는 화면입니다.</p>
-        </div>
-        """)
+        self.setActiveNav("내 활동")
+        self.showNotice("내 활동", "나의 최근 활동 내역을 확인하는 화면입니다.")
         self.messageInput.setPlaceholderText("검색어를 입력하세요")
         self.channelTitle.setText("🔍 내 활동")
 
     def showMoreMenu(self):
-        """더 보기 메뉴 표시"""
-        moreMenu = QMenu(self)
-        
-        # 메뉴 항목 추가
-        actions = [
-            {"text": "스레드", "icon": "🧵", "action": self.showThreads},
-            {"text": "파일", "icon": "📁", "action": self.showFiles},
-            {"text": "앱", "icon": "🧩", "action": self.showApps},
-            {"text": "설정", "icon": "⚙️", "action": self.openSettingsDialog}
-        ]
-        
-        for action in actions:
-            act = QAction(f"{action['icon']} {action['text']}", self)
-            if "action" in action and action["action"]:
-                act.triggered.connect(action["action"])
-            moreMenu.addAction(act)
+        """더 보기 메뉴 표시 (처음 열 때 만들어 재사용)"""
+        if self.moreMenu is None:
+            self.moreMenu = QMenu(self)
+            
+            # 메뉴 항목 추가
+            actions = [
+                {"text": "스레드", "icon": "🧵", "action": self.showThreads},
+                {"text": "파일", "icon": "📁", "action": self.showFiles},
+                {"text": "앱", "icon": "🧩", "action": self.showApps},
+                {"text": "설정", "icon": "⚙️", "action": self.openSettingsDialog}
+            ]
+            
+            for action in actions:
+                act = QAction(f"{action['icon']} {action['text']}", self)
+                if "action" in action and action["action"]:
+                    act.triggered.connect(action["action"])
+                self.moreMenu.addAction(act)
         
         # 버튼 위치에 메뉴 표시
         senderBtn = self.sender()
         if senderBtn:
-            moreMenu.exec(senderBtn.mapToGlobal(senderBtn.rect().bottomLeft()))
+            self.moreMenu.exec(senderBtn.mapToGlobal(senderBtn.rect().bottomLeft()))
 
     def showThreads(self):
         """스레드 화면으로 이동하는 로직"""
-        self.messageArea.clear()
-        self.messageArea.append("""
-        <div style="text-align:center; margin-top:50px;">
-            <h2>스레드</h2>
-            <p>스레드된 메시지를 모아서 보는 화면입니다.</p>
-        </div>
-        """)
+        self.showNotice("스레드", "스레드된 메시지를 모아서 보는 화면입니다.")
         self.channelTitle.setText("🧵 스레드")
 
     def showFiles(self):
         """파일 화면으로 이동하는 로직"""
-        self.messageArea.clear()
-        self.messageArea.append("""
-        <div style="text-align:center; margin-top:50px;">
-            <h2>파일</h2>
-            <p>공유된 파일을 모아서 보는 화면입니다.</p>
-        </div>
-        """)
+        self.showNotice("파일", "공유된 파일을 모아서 보는 화면입니다.")
         self.channelTitle.setText("📁 파일")
 
     def showApps(self):
         """앱 화면으로 이동하는 로직"""
-        self.messageArea.clear()
-        self.messageArea.append("""
-        <div style="text-align:center; margin-top:50px;">
-            <h2>앱</h2>
-            <p>설치된 앱 목록을 보는 화면입니다.</p>
-        </div>
-        """)
+        self.showNotice("앱", "설치된 앱 목록을 보는 화면입니다.")
         self.channelTitle.setText("🧩 앱")
         
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Slack 클론")
+    parser.add_argument("--record-traffic", metavar="PATH", help="WebSocket 송수신 프레임을 파일에 기록")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], type=str.upper,
+                        help="로그 수준 (기본값은 설정의 log_level 또는 INFO)")
+    parser.add_argument("--log-file", metavar="PATH", help="로그 파일 경로 (기본값은 앱 데이터 폴더의 slack-clone.log)")
+    parser.add_argument("--log-format", choices=["text", "json"], default="text", help="로그 출력 형식")
+    parser.add_argument("--startup-report", metavar="PATH", help="단계별 시작 시간을 JSON 파일로 저장")
+    args, qt_args = parser.parse_known_args()
+    startup = StartupTimer(STARTUP_STARTED, args.startup_report)
+    startup.mark("imports")
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    app.setApplicationName("SlackClone")
+    startup.mark("qapplication")
+
+    # 로그 출력은 백그라운드 스레드에서 처리 (앱 이름을 정한 뒤에 데이터 폴더 경로가 결정됨)
+    log_listener = setup_logging(args.log_level or app_settings().value("log_level") or "INFO",
+                                 args.log_file or app_data_path("slack-clone.log"), args.log_format)
+    startup.mark("logging")
     
     # 앱 아이콘 설정 (선택 사항)
     # app.setWindowIcon(QIcon(":/images/app_icon.png"))
@@ -1705,7 +4463,9 @@ if __name__ == '__main__':
     # 스타일 설정 (선택 사항)
     # app.setStyle("Fusion")
     
-    window = MainWindow()
+    window = MainWindow(record_path=args.record_traffic, startup=startup)
     window.show()
     
-    sys.exit(app.exec())
\ No newline at end of file
+    exit_code = app.exec()
+    log_listener.stop()
+    sys.exit(exit_code)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""테스트 공용 설정 (offscreen Qt 플랫폼과 임시 데이터 경로에서 클라이언트 모듈을 불러옴)"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Qt와 클라이언트를 불러오기 전에 화면 없는 플랫폼과 임시 데이터 경로 지정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp(prefix="slack-clone-test-")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "tools"))
+
+from PySide6.QtWidgets import QApplication
+
+from client_module import load_client
+
+@pytest.fixture(scope="session")
+def client():
+    return load_client()
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    app.setApplicationName("SlackCloneTest")
+    return app
+
+@pytest.fixture
+def window(client, qapp):
+    """서버에 연결되지 않는 주 창 (응답 프레임은 onWebSocketFrame으로 직접 넣음)"""
+    client.app_settings().setValue("server_url", "ws://127.0.0.1:1/ws")
+    window = client.MainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
@@ -0,0 +1,51 @@
+"""bootstrap 시작 요청 테스트 (request_id 없이 온 응답, 미지원 서버 대비)"""
+import json
+
+import pytest
+
+@pytest.fixture
+def restarts(window, monkeypatch):
+    calls = []
+    monkeypatch.setattr(window, "requestStartupPipelined", lambda: calls.append(1))
+    return calls
+
+def reply(client, window, **fields):
+    data = {"action": "bootstrap_response", "status": "success",
+            "registration": {"status": "success", "message": "등록되었습니다."},
+            "workspaces": {window.current_workspace: [window.current_channel, "개발"]},
+            "channel_data": {"workspace": window.current_workspace, "channel": window.current_channel,
+                             "message": [{"id": 1, "date": "2024-01-01", "time": "10:00:00",
+                                          "sender": "철수", "message": "안녕하세요"}]}}
+    data.update(fields)
+    window.onWebSocketFrame(client.decode_frame(json.dumps(data)))
+
+def test_reply_without_request_id_releases_bootstrap(client, window, restarts, monkeypatch):
+    window.requestBootstrap()
+    assert "bootstrap" in window.requests.keys
+    reply(client, window)
+    assert window.channels == [window.current_channel, "개발"]
+    assert window.requests.pending == {}
+
+    # 응답을 반영한 뒤에는 시간 초과가 와도 시작 요청을 다시 보내지 않음
+    later = client.time.monotonic() + client.REQUEST_TIMEOUTS["bootstrap"] + 1
+    monkeypatch.setattr(client.time, "monotonic", lambda: later)
+    window.requests.checkTimeouts()
+    window.onBootstrapTimeout()
+    assert restarts == []
+    assert window.bootstrapSupported is True
+
+def test_unknown_action_falls_back_once(client, window, restarts):
+    window.requestBootstrap()
+    error = json.dumps({"action": "bootstrap_response", "status": "error", "message": "Unknown action"})
+    window.onWebSocketFrame(client.decode_frame(error))
+    window.onWebSocketFrame(client.decode_frame(error))
+    window.onBootstrapTimeout()
+    assert restarts == [1]
+    assert window.bootstrapSupported is False
+    assert window.requests.pending == {}
+
+def test_timeout_without_reply_falls_back(client, window, restarts):
+    window.requestBootstrap()
+    window.onBootstrapTimeout()
+    assert restarts == [1]
+    assert window.bootstrapSupported is False
@@ -0,0 +1,44 @@
+"""실시간 메시지 수신 버퍼(IngestBuffer) 테스트"""
+import pytest
+
+@pytest.fixture
+def clock(client, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(client.time, "monotonic", lambda: now[0])
+    return now
+
+@pytest.fixture
+def buffer(client, qapp):
+    buffer = client.IngestBuffer()
+    buffer.emitted = []
+    buffer.flushed.connect(buffer.emitted.append)
+    return buffer
+
+def test_messages_are_flushed_together(buffer):
+    for i in range(3):
+        buffer.add({"id": i})
+    assert buffer.timer.isActive()
+    buffer.flush()
+    assert buffer.emitted == [[{"id": 0}, {"id": 1}, {"id": 2}]]
+    assert buffer.pending == []
+    assert not buffer.timer.isActive()
+
+def test_empty_flush_emits_nothing(buffer):
+    buffer.flush()
+    assert buffer.emitted == []
+
+def test_rate_counts_recent_window(buffer, clock):
+    buffer.add({"id": 1})
+    buffer.add({"id": 2})
+    buffer.flush()
+    assert buffer.rate() == 2 / buffer.RATE_WINDOW
+    clock[0] += buffer.RATE_WINDOW + 0.1
+    assert buffer.rate() == 0
+
+def test_rate_window_does_not_grow_without_rate_calls(buffer, clock):
+    # rate()를 부르지 않는 세션에서도 오래된 기록이 쌓이지 않아야 함
+    for _ in range(1000):
+        buffer.add({"id": 1})
+        buffer.flush()
+        clock[0] += 0.1
+    assert len(buffer.recent) <= buffer.RATE_WINDOW / 0.1 + 1
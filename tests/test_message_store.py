@@ -0,0 +1,101 @@
+"""로컬 메시지 저장소(MessageStore) 페이지 조회, 검색, 나누어 저장 테스트"""
+import pytest
+
+WORKSPACE = "실험실"
+CHANNEL = "전체"
+
+def messages(first, last, date="2024-01-01"):
+    return [{"id": i, "date": date, "time": f"10:{i % 60:02d}:00", "sender": "철수", "message": f"메시지 {i}"}
+            for i in range(first, last + 1)]
+
+@pytest.fixture
+def store(client, tmp_path):
+    store = client.MessageStore(str(tmp_path / "messages.db"))
+    yield store
+    store.close()
+
+def ids(page):
+    return [message["id"] for message in page]
+
+def test_load_latest_returns_oldest_first(store):
+    store.saveMessages(WORKSPACE, CHANNEL, messages(1, 30))
+    assert ids(store.loadLatest(WORKSPACE, CHANNEL, 5)) == [26, 27, 28, 29, 30]
+
+def test_numeric_ids_sort_numerically(store):
+    # 문자열 정렬이면 9가 10보다 뒤에 옴
+    store.saveMessages(WORKSPACE, CHANNEL, messages(8, 12))
+    assert ids(store.loadLatest(WORKSPACE, CHANNEL, 10)) == [8, 9, 10, 11, 12]
+
+def test_load_before_pages_backwards(store):
+    store.saveMessages(WORKSPACE, CHANNEL, messages(1, 30))
+    assert ids(store.loadBefore(WORKSPACE, CHANNEL, 26, 5)) == [21, 22, 23, 24, 25]
+    assert ids(store.loadBefore(WORKSPACE, CHANNEL, 3, 5)) == [1, 2]
+
+def test_channels_are_kept_apart(store):
+    store.saveMessages(WORKSPACE, CHANNEL, messages(1, 3))
+    store.saveMessages("다른 워크스페이스", CHANNEL, messages(4, 6))
+    assert ids(store.loadLatest(WORKSPACE, CHANNEL, 10)) == [1, 2, 3]
+    assert store.lastMessageId("다른 워크스페이스", CHANNEL) == 6
+
+def test_saving_again_updates_instead_of_duplicating(store):
+    store.saveMessages(WORKSPACE, CHANNEL, messages(1, 3))
+    store.saveMessages(WORKSPACE, CHANNEL, [dict(messages(2, 2)[0], message="수정됨")])
+    page = store.loadLatest(WORKSPACE, CHANNEL, 10)
+    assert ids(page) == [1, 2, 3]
+    assert page[1]["message"] == "수정됨"
+
+def test_messages_without_id_are_deduplicated(store):
+    message = {"date": "2024-01-01", "time": "10:00:00", "sender": "철수", "message": "ID 없음"}
+    store.saveMessages(WORKSPACE, CHANNEL, [message])
+    store.saveMessages(WORKSPACE, CHANNEL, [dict(message)])
+    assert ids(store.loadLatest(WORKSPACE, CHANNEL, 10)) == [None]
+    assert store.lastMessageId(WORKSPACE, CHANNEL) is None
+
+def test_search_query(client):
+    assert client.search_query("deploy") == '"deploy"*'
+    assert client.search_query("회의실") == '"회의 의실"*'
+    assert client.search_query("회의 배포") == '"회의"* "배포"*'
+    # 입력 중인 자모와 기호만 있으면 검색하지 않음
+    assert client.search_query("ㅎ") is None
+    assert client.search_query("!!") is None
+
+def test_search_matches_korean_with_particles(store):
+    if not store.searchEnabled:
+        pytest.skip("SQLite에 FTS5가 없음")
+    store.saveMessages(WORKSPACE, CHANNEL, [
+        {"id": 1, "date": "2024-01-01", "time": "10:00:00", "sender": "철수", "message": "회의실에서 만나요"},
+        {"id": 2, "date": "2024-01-02", "time": "10:00:00", "sender": "영희", "message": "배포는 내일"},
+    ])
+    assert ids(store.search("회의")) == [1]
+    assert ids(store.search("배포", sender="영")) == [2]
+    assert store.search("배포", date_to="2024-01-01") == []
+
+def test_search_sees_updated_text(store):
+    if not store.searchEnabled:
+        pytest.skip("SQLite에 FTS5가 없음")
+    store.saveMessages(WORKSPACE, CHANNEL, [{"id": 1, "date": "2024-01-01", "message": "점심 메뉴"}])
+    store.saveMessages(WORKSPACE, CHANNEL, [{"id": 1, "date": "2024-01-01", "message": "저녁 메뉴"}])
+    assert store.search("점심") == []
+    assert ids(store.search("저녁")) == [1]
+
+def test_write_queued_saves_in_chunks(store):
+    store.queueMessages(WORKSPACE, CHANNEL, messages(1, 7))
+    store.queueMessages(WORKSPACE, "개발", messages(8, 9))
+    assert store.loadLatest(WORKSPACE, CHANNEL, 10) == []
+
+    assert store.writeQueued(3) is True
+    assert ids(store.loadLatest(WORKSPACE, CHANNEL, 10)) == [1, 2, 3]
+    assert store.writeQueued(5) is True
+    assert ids(store.loadLatest(WORKSPACE, CHANNEL, 10)) == [1, 2, 3, 4, 5, 6, 7]
+    assert ids(store.loadLatest(WORKSPACE, "개발", 10)) == [8]
+    assert store.writeQueued(5) is False
+    assert ids(store.loadLatest(WORKSPACE, "개발", 10)) == [8, 9]
+
+def test_close_flushes_queued_messages(client, tmp_path):
+    path = str(tmp_path / "messages.db")
+    store = client.MessageStore(path)
+    store.queueMessages(WORKSPACE, CHANNEL, messages(1, 3))
+    store.close()
+    store = client.MessageStore(path)
+    assert ids(store.loadLatest(WORKSPACE, CHANNEL, 10)) == [1, 2, 3]
+    store.close()
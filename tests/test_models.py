@@ -0,0 +1,77 @@
+"""메시지 목록 모델과 채널 목록 모델 테스트"""
+import pytest
+
+def message(message_id, date, text="안녕하세요"):
+    return {"id": message_id, "date": date, "time": "10:00:00", "sender": "철수", "message": text}
+
+def kinds(model):
+    return [(row["kind"], row.get("id", row["date"])) for row in model.rows]
+
+def test_messages_are_grouped_by_date(client, qapp):
+    model = client.MessageListModel()
+    model.setMessages([message(1, "2024-01-01"), message(2, "2024-01-01"), message(3, "2024-01-02")])
+    assert kinds(model) == [("date", "2024-01-01"), ("message", 1), ("message", 2),
+                            ("date", "2024-01-02"), ("message", 3)]
+
+def test_append_skips_known_ids_and_continues_date(client, qapp):
+    model = client.MessageListModel()
+    model.setMessages([message(1, "2024-01-01")])
+    model.appendMessages([message(1, "2024-01-01"), message(2, "2024-01-01")])
+    assert kinds(model) == [("date", "2024-01-01"), ("message", 1), ("message", 2)]
+
+def test_prepend_merges_date_separator(client, qapp):
+    model = client.MessageListModel()
+    model.setMessages([message(3, "2024-01-02")])
+    model.prependMessages([message(1, "2024-01-01"), message(2, "2024-01-02")])
+    assert kinds(model) == [("date", "2024-01-01"), ("message", 1),
+                            ("date", "2024-01-02"), ("message", 2), ("message", 3)]
+
+@pytest.fixture
+def model(client, qapp):
+    model = client.ChannelListModel(["전체", "개발", "잡담"])
+    events = []
+    model.rowsInserted.connect(lambda parent, first, last: events.append(("insert", first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(("remove", first, last)))
+    model.dataChanged.connect(lambda top, bottom, roles: events.append(("change", top.row(), bottom.row())))
+    model.events = events
+    return model
+
+def test_same_list_emits_nothing(model):
+    model.setChannels(["전체", "개발", "잡담"])
+    assert model.channels == ["전체", "개발", "잡담"]
+    assert model.events == []
+
+def test_append_inserts_only_new_rows(model):
+    model.setChannels(["전체", "개발", "잡담", "공지", "배포"])
+    assert model.channels == ["전체", "개발", "잡담", "공지", "배포"]
+    assert model.events == [("insert", 3, 4)]
+
+def test_remove_middle_row(model):
+    model.setChannels(["전체", "잡담"])
+    assert model.channels == ["전체", "잡담"]
+    assert model.events == [("remove", 1, 1)]
+
+def test_rename_in_place_is_a_data_change(model):
+    model.setChannels(["전체", "백엔드", "잡담"])
+    assert model.channels == ["전체", "백엔드", "잡담"]
+    assert model.events == [("change", 1, 1)]
+
+def test_mixed_changes_match_new_list(model):
+    channels = ["공지", "전체", "잡담", "배포", "리뷰"]
+    model.setChannels(channels)
+    assert model.channels == channels
+    assert model.rowCount() == len(channels)
+
+def test_selection_follows_channel_name(model, client):
+    model.setSelected("잡담")
+    model.setChannels(["공지", "전체", "잡담"])
+    assert model.data(model.index(2), client.ChannelListModel.SelectedRole) is True
+    assert model.data(model.index(0), client.ChannelListModel.SelectedRole) is False
+
+def test_hover_is_cleared_and_repainted(model):
+    model.setHoverRow(2)
+    model.events.clear()
+    model.setChannels(["전체", "개발"])
+    # 호버 행을 먼저 다시 그린 뒤 삭제
+    assert model.events == [("change", 2, 2), ("remove", 2, 2)]
+    assert model.hoverRow == -1
@@ -0,0 +1,97 @@
+"""전송 대기열(Outbox) ack, 재전송, 디스크 보존 테스트"""
+import json
+
+import pytest
+
+def frame(client_msg_id, text="안녕하세요"):
+    return json.dumps({"action": "send_message", "message": text, "client_msg_id": client_msg_id})
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "outbox.json")
+
+def saved_ids(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [entry["client_msg_id"] for entry in json.load(f)["messages"]]
+
+def test_queued_messages_survive_restart(client, path):
+    outbox = client.Outbox(path)
+    outbox.enqueue(frame("a"), "a")
+    outbox.enqueue(json.dumps({"action": "get_channel_list"}))
+    outbox.enqueue(frame("b"), "b")
+
+    # 조회 요청은 보존하지 않고 사용자 메시지만 순서대로 복원
+    restored = client.Outbox(path)
+    assert [cid for _, cid in restored.queue] == ["a", "b"]
+
+def test_enqueue_drops_oldest_over_limit(client, path):
+    outbox = client.Outbox(path, max_frames=2)
+    outbox.enqueue(frame("a"), "a")
+    outbox.enqueue(frame("b"), "b")
+    dropped = outbox.enqueue(frame("c"), "c")
+    assert [cid for _, cid in dropped] == ["a"]
+    assert saved_ids(path) == ["b", "c"]
+
+def test_sent_message_is_saved_until_ack(client, path):
+    outbox = client.Outbox(path)
+    outbox.acksSupported = True
+    outbox.markSent(frame("a"), "a")
+    assert saved_ids(path) == ["a"]
+
+    assert outbox.ack("a") is True
+    assert saved_ids(path) == []
+    assert outbox.ack("a") is False
+
+def test_without_acks_sending_completes_message(client, path):
+    outbox = client.Outbox(path)
+    outbox.markSent(frame("a"), "a")
+    assert outbox.inflight == {}
+
+def test_first_ack_enables_tracking_and_is_remembered(client, path):
+    outbox = client.Outbox(path)
+    outbox.ack("unknown")
+    assert outbox.acksSupported is True
+    assert client.Outbox(path).acksSupported is True
+
+def test_expired_messages_count_attempts(client, path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(client.time, "monotonic", lambda: now[0])
+    outbox = client.Outbox(path)
+    outbox.acksSupported = True
+    outbox.markSent(frame("a"), "a")
+
+    assert outbox.expired(client.ACK_TIMEOUT_SEC) == []
+    now[0] += client.ACK_TIMEOUT_SEC
+    expired = outbox.expired(client.ACK_TIMEOUT_SEC)
+    assert [cid for cid, _ in expired] == ["a"]
+
+    # 재전송하면 시도 횟수가 늘고 대기 시간이 다시 시작됨
+    outbox.markSent(frame("a"), "a")
+    assert outbox.inflight["a"]["attempts"] == 2
+    assert outbox.expired(client.ACK_TIMEOUT_SEC) == []
+
+    outbox.drop("a")
+    assert outbox.inflight == {}
+    assert saved_ids(path) == []
+
+def test_unacknowledged_messages_are_resent_after_restart(client, path):
+    outbox = client.Outbox(path)
+    outbox.acksSupported = True
+    outbox.markSent(frame("a"), "a")
+    outbox.enqueue(frame("b"), "b")
+
+    restored = client.Outbox(path)
+    assert [cid for _, cid in restored.queue] == ["a", "b"]
+
+def test_worker_keeps_messages_but_not_lookups_while_offline(client, qapp, tmp_path):
+    from PySide6.QtCore import QUrl
+
+    worker = client.WebSocketWorker(QUrl("ws://127.0.0.1:1/ws"), str(tmp_path / "outbox.json"))
+    errors = []
+    worker.errorOccurred.connect(errors.append)
+    worker.sendMessage(frame("a"))
+    worker.sendMessage(json.dumps({"action": "search", "query": "회의"}))
+    worker.sendMessage(json.dumps({"action": "get_channel_data", "channel": "전체"}))
+
+    assert [cid for _, cid in worker.outbox.queue] == ["a"]
+    assert len(errors) == 2
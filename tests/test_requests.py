@@ -0,0 +1,85 @@
+"""요청 계층(RequestTracker) 응답 연결, 시간 초과, 무효 요청 테스트"""
+import json
+
+import pytest
+
+@pytest.fixture
+def clock(client, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(client.time, "monotonic", lambda: now[0])
+    return now
+
+@pytest.fixture
+def tracker(client, qapp, clock):
+    return client.RequestTracker()
+
+def frame(client, action, **data):
+    return client.Frame(action, dict(data, action=action))
+
+def test_response_is_matched_by_request_id(client, tracker):
+    responses = []
+    request_id = tracker.track("search", 30, on_response=responses.append)
+    handled, request = tracker.resolve(frame(client, "search_response", request_id=request_id))
+    assert handled is False
+    request.on_response({"status": "success"})
+    assert responses == [{"status": "success"}]
+    assert tracker.pending == {}
+
+def test_frames_without_known_id_go_to_action_handlers(client, tracker):
+    assert tracker.resolve(frame(client, "channel_data")) == (False, None)
+    assert tracker.resolve(frame(client, "channel_data", request_id="unknown")) == (False, None)
+
+def test_new_request_with_same_key_retires_previous(client, tracker):
+    first = tracker.track("get_channel_data", 15, key="history")
+    second = tracker.track("get_channel_data", 15, key="history")
+    assert list(tracker.pending) == [second]
+    # 늦게 도착한 이전 응답은 버림
+    assert tracker.resolve(frame(client, "channel_data", request_id=first)) == (True, None)
+    assert tracker.resolve(frame(client, "channel_data", request_id=second))[1].request_id == second
+
+def test_cancel_retires_and_complete_releases(client, tracker):
+    cancelled = tracker.track("search", 30, key="search")
+    tracker.cancel("search")
+    assert tracker.resolve(frame(client, "search_response", request_id=cancelled)) == (True, None)
+
+    completed = tracker.track("send_message", 120, key="msg")
+    tracker.complete("msg")
+    assert tracker.pending == {} and tracker.keys == {}
+    # 완료 처리한 요청의 응답은 버리지 않고 일반 프레임으로 처리
+    assert tracker.resolve(frame(client, "send_message", request_id=completed)) == (False, None)
+
+def test_timeout_calls_handler_once(client, tracker, clock):
+    timeouts = []
+    request_id = tracker.track("search", 30, on_timeout=lambda: timeouts.append(1))
+    clock[0] += 29
+    tracker.checkTimeouts()
+    assert timeouts == []
+    clock[0] += 1
+    tracker.checkTimeouts()
+    tracker.checkTimeouts()
+    assert timeouts == [1]
+    assert tracker.pending == {}
+    assert not tracker.timer.isActive()
+    assert tracker.resolve(frame(client, "search_response", request_id=request_id)) == (True, None)
+
+def test_retired_ids_are_bounded(client, tracker):
+    for _ in range(client.RequestTracker.RETIRED_MAX + 10):
+        tracker.track("search", 30, key="search")
+    tracker.cancel("search")
+    assert len(tracker.retired) == client.RequestTracker.RETIRED_MAX
+
+def test_every_request_action_has_a_finite_timeout(client):
+    # 시간 제한이 없으면 확인이 오지 않은 요청이 영영 남고 점검 타이머도 멈추지 않음
+    assert all(timeout is not None for timeout in client.REQUEST_TIMEOUTS.values())
+
+def test_send_message_is_released_by_confirmation_without_request_id(client, window):
+    window.messageInput.setPlainText("안녕하세요")
+    window.onSendClicked()
+    client_msg_id = next(iter(window.pendingEchoIds))
+    assert len(window.requests.pending) == 1
+
+    window.onWebSocketFrame(client.decode_frame(json.dumps({
+        "action": "send_message", "channel": window.current_channel, "sender": "다른 사람",
+        "message": "안녕하세요", "client_msg_id": client_msg_id
+    })))
+    assert window.requests.pending == {}
@@ -0,0 +1,78 @@
+"""프레임 인코딩(WireCodec), 수신 프레임 검증, 재연결 백오프 테스트"""
+import json
+
+import pytest
+from PySide6.QtCore import QUrl
+
+DATA = {"action": "channel_data", "channel": "전체", "message": [{"id": 1, "message": "안녕하세요"}]}
+
+@pytest.fixture
+def worker(client, qapp):
+    return client.WebSocketWorker(QUrl("ws://127.0.0.1:1/ws"))
+
+def test_json_without_compression_stays_text(client):
+    assert client.WireCodec().binary is False
+    assert client.WireCodec("json", "zlib").binary is True
+
+@pytest.mark.parametrize("encoding", ["msgpack", "cbor", "json"])
+def test_round_trip(client, encoding):
+    if encoding not in client.WireCodec.supportedEncodings():
+        pytest.skip(f"{encoding} 라이브러리가 설치되지 않음")
+    codec = client.WireCodec(encoding, "zlib")
+    assert codec.decode(codec.encode(DATA)) == DATA
+
+def test_flag_byte_marks_compressed_frames(client):
+    codec = client.WireCodec("json", "zlib")
+    small = codec.encode(DATA)
+    large = codec.encode(dict(DATA, message=[{"id": i, "message": "x" * 50} for i in range(50)]))
+    # 작은 프레임은 압축하지 않음
+    assert small[0] == 0x00
+    assert large[0] == client.WireCodec.FLAG_COMPRESSED
+    assert codec.decode(large)["message"][49]["id"] == 49
+
+def test_decode_rejects_bad_frames(client):
+    codec = client.WireCodec("json", "zlib")
+    with pytest.raises(ValueError):
+        codec.decode(b"")
+    with pytest.raises(ValueError):
+        codec.decode(bytes([client.WireCodec.FLAG_COMPRESSED]) + b"not zlib")
+    with pytest.raises(ValueError):
+        codec.decode(b"\x00{broken")
+
+def test_decode_frame_checks_schema(client):
+    frame = client.decode_frame(json.dumps(DATA))
+    assert frame.action == "channel_data"
+    assert frame.data["message"][0]["id"] == 1
+    with pytest.raises(ValueError):
+        client.decode_frame(json.dumps({"action": "channel_data", "message": "목록이 아님"}))
+    with pytest.raises(ValueError):
+        client.decode_frame(json.dumps([1, 2, 3]))
+
+def test_decode_frame_uses_negotiated_codec(client):
+    codec = client.WireCodec("json", "zlib")
+    frame = client.decode_frame(codec.encode(DATA), codec)
+    assert frame.data == DATA
+
+def test_hello_response_switches_codec(client, worker):
+    worker.onHelloResponse({"encoding": "json", "compression": "zlib"})
+    assert (worker.codec.encoding, worker.codec.compression) == ("json", "zlib")
+
+def test_unsupported_hello_response_keeps_text(client, worker):
+    worker.onHelloResponse({"encoding": "protobuf"})
+    assert worker.codec.binary is False
+    worker.onHelloResponse({"encoding": "json", "compression": "brotli"})
+    assert worker.codec.binary is False
+
+def test_reconnect_delay_doubles_within_jitter(client):
+    policy = client.ReconnectPolicy(base_ms=100, max_ms=1000)
+    for ceiling in (100, 200, 400, 800, 1000, 1000):
+        delay = policy.nextDelay()
+        assert ceiling / 2 <= delay <= ceiling
+    assert policy.attempt == 6
+
+def test_reconnect_reset_starts_over(client):
+    policy = client.ReconnectPolicy(base_ms=100, max_ms=1000)
+    for _ in range(5):
+        policy.nextDelay()
+    policy.reset()
+    assert policy.nextDelay() <= 100
@@ -0,0 +1,329 @@
+"""Slack 클론 클라이언트 성능 측정 도구
+
+offscreen Qt 플랫폼에서 합성 데이터로 주요 경로(창 생성, 채널 히스토리 표시, 실시간 메시지,
+채널 목록 갱신, 검색 결과 표시, 로컬 검색)를 실행하고 시나리오별 실행 시간,
+최대 메모리 사용량(파이썬 할당과 프로세스 RSS), GUI 스레드 멈춤 시간을 출력하고 --output을 주면 JSON으로 저장한다.
+
+    python tools/bench-client.py                       # 전체 시나리오 실행
+    python tools/bench-client.py --only channel_data   # 이름에 포함된 시나리오만 실행
+    python tools/bench-client.py --output new.json --compare old.json  # 저장 후 이전 결과와 비교
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource  # 최대 RSS 측정 (Windows에는 없음)
+except ImportError:
+    resource = None
+
+# Qt를 불러오기 전에 화면 없는 플랫폼과 임시 데이터 경로 지정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+DATA_DIR = tempfile.mkdtemp(prefix="slack-clone-bench-")
+os.environ["XDG_DATA_HOME"] = DATA_DIR
+
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer, QEventLoop, QMetaObject, Qt
+
+from client_module import load_client, BlockMonitor
+
+client = load_client()
+
+def run_in_loop(action, done=lambda: True, timeout=300):
+    """이벤트 루프 안에서 action을 실행하고 done()이 참이 될 때까지 대기
+
+    실행 시간(ms)과 GUI 스레드 멈춤 통계를 반환한다.
+    """
+    monitor = BlockMonitor()
+    loop = QEventLoop()
+    state = {"start": None, "end": None}
+
+    def begin():
+        state["start"] = time.perf_counter()
+        action()
+        poll()
+
+    def poll():
+        if done():
+            state["end"] = time.perf_counter()
+            loop.quit()
+        elif time.perf_counter() - state["start"] > timeout:
+            raise TimeoutError("benchmark scenario did not finish")
+        else:
+            QTimer.singleShot(0, poll)
+
+    monitor.start()
+    QTimer.singleShot(0, begin)
+    loop.exec()
+    result = monitor.stop()
+    result["wall_ms"] = round((state["end"] - state["start"]) * 1000, 2)
+    return result
+
+# 합성 데이터
+
+SENDERS = [f"사용자{i}" for i in range(50)]
+WORDS = ["회의", "배포", "서버", "점검", "내일", "오늘", "리뷰", "release", "deploy", "bug",
+         "fix", "확인했습니다", "감사합니다", "API", "테스트", "일정", "공유", "문서"]
+
+def make_messages(count, seed=1):
+    rng = random.Random(seed)
+    messages = []
+    for i in range(count):
+        day = 1 + i * 28 // max(count, 1)
+        messages.append({
+            "id": i + 1,
+            "date": f"2024-02-{day:02d}",
+            "time": f"{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}",
+            "sender": rng.choice(SENDERS),
+            "message": " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 30)))
+        })
+    return messages
+
+def make_results(count, seed=2):
+    rng = random.Random(seed)
+    results = make_messages(count, seed)
+    for result in results:
+        result["workspace"] = "실험실"
+        result["channel"] = f"채널{rng.randrange(200)}"
+    return results
+
+# 시나리오 (각 함수는 준비 작업 후 측정할 (action, done) 반환)
+
+def new_window():
+    window = client.MainWindow()
+    # 서버 없이 측정하므로 재연결 시도 중지
+    QMetaObject.invokeMethod(window.wsWorker, "stop", Qt.BlockingQueuedConnection)
+    window.resize(1280, 800)
+    window.show()
+    QApplication.processEvents()
+    return window
+
+def close_window(window):
+    window.close()
+    window.deleteLater()
+    QApplication.processEvents()
+
+def scenario_startup(size):
+    """메인 창 size개를 차례로 만들어 첫 화면을 표시할 때까지 (자세한 단계별 시간은 --startup-report)"""
+    windows = []
+
+    def action():
+        for _ in range(size):
+            window = client.MainWindow()
+            QMetaObject.invokeMethod(window.wsWorker, "stop", Qt.BlockingQueuedConnection)
+            window.show()
+            QApplication.processEvents()
+            windows.append(window)
+
+    def cleanup():
+        for window in windows:
+            close_window(window)
+
+    return action, lambda: True, cleanup
+
+def scenario_channel_data(size):
+    """channel_data 프레임 디코딩, 저장, 배치 렌더링이 끝날 때까지"""
+    window = new_window()
+    window.current_channel = f"bench-{size}"
+    frame = json.dumps({"action": "channel_data", "channel": window.current_channel,
+                        "message": make_messages(size)}, ensure_ascii=False)
+
+    def action():
+        window.onWebSocketFrame(client.decode_frame(frame))
+
+    def done():
+        return not window.hasPendingRender(window.messageModel) and not window.messageStore.pendingWrites
+
+    return action, done, window
+
+def scenario_live_burst(size):
+    """같은 프레임 안에 도착한 실시간 메시지가 한 번에 반영될 때까지"""
+    window = new_window()
+    messages = [dict(m, action="send_message", channel=window.current_channel) for m in make_messages(size)]
+    frames = [json.dumps(m, ensure_ascii=False) for m in messages]
+
+    def action():
+        for frame in frames:
+            window.onWebSocketFrame(client.decode_frame(frame))
+
+    def done():
+        return not window.ingestBuffer.pending and not window.hasPendingRender(window.messageModel)
+
+    return action, done, window
+
+def scenario_channel_list(size):
+    """channel_list 수신 후 채널 목록 표시"""
+    window = new_window()
+    channels = ["전체"] + [f"채널{i:05d}" for i in range(size - 1)]
+    frame = json.dumps({"action": "channel_list", "workspace": window.current_workspace, "message": channels},
+                       ensure_ascii=False)
+
+    def action():
+        window.onWebSocketFrame(client.decode_frame(frame))
+        window.channelList.repaint()
+
+    return action, lambda: True, window
+
+def scenario_channel_update(size):
+    """채널 size개 중 하나의 이름이 바뀐 channel_update 반영"""
+    window = new_window()
+    channels = ["전체"] + [f"채널{i:05d}" for i in range(size - 1)]
+    window.updateChannelList(channels)
+    QApplication.processEvents()
+    renamed = list(channels)
+    renamed[len(renamed) // 2] += "-renamed"
+    frame = json.dumps({"action": "channel_update", "workspace": window.current_workspace, "message": renamed},
+                       ensure_ascii=False)
+
+    def action():
+        window.onWebSocketFrame(client.decode_frame(frame))
+        window.channelList.repaint()
+
+    return action, lambda: True, window
+
+def scenario_search_results(size):
+    """검색 결과 size개를 결과 창에 채우고 날짜순으로 정렬"""
+    window = new_window()
+    results = make_results(size)
+    panel = client.SearchResultsPanel()
+    panel.resize(900, 600)
+    panel.show()
+    QApplication.processEvents()
+
+    def action():
+        panel.setQuery("bench")
+        panel.addResults(results)
+        panel.setLoading(False)
+        panel.resultsList.sortByColumn(0, Qt.DescendingOrder)
+        panel.resultsList.repaint()
+
+    def cleanup():
+        panel.deleteLater()
+        close_window(window)
+
+    return action, lambda: True, cleanup
+
+def scenario_local_search(size):
+    """저장된 메시지 size개에서 로컬 검색"""
+    store = client.MessageStore(os.path.join(DATA_DIR, f"search-{size}.db"))
+    store.saveMessages("실험실", "전체", make_messages(size))
+
+    def action():
+        store.search("회의 배포", limit=client.LOCAL_SEARCH_LIMIT)
+        store.search("deploy", sender="사용자1", date_from="2024-02-10", date_to="2024-02-20")
+
+    return action, lambda: True, store.close
+
+SCENARIOS = [
+    ("startup", scenario_startup, [1, 10]),
+    ("channel_data", scenario_channel_data, [1000, 10000, 100000]),
+    ("live_burst", scenario_live_burst, [100, 1000]),
+    ("channel_list", scenario_channel_list, [10, 1000, 5000]),
+    ("channel_update", scenario_channel_update, [10, 1000, 5000]),
+    ("search_results", scenario_search_results, [1000, 10000, 50000]),
+    ("local_search", scenario_local_search, [10000, 100000]),
+]
+
+def cleanup_target(target):
+    if callable(target):
+        target()
+    elif target is not None:
+        close_window(target)
+
+def max_rss_mb():
+    """프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+def run_scenario(factory, size, measure_memory):
+    action, done, target = factory(size)
+    rss_before = max_rss_mb()
+    try:
+        result = run_in_loop(action, done)
+    finally:
+        cleanup_target(target)
+    rss_after = max_rss_mb()
+    if rss_after is not None:
+        # 최대 RSS는 줄지 않으므로 앞선 시나리오보다 더 쓴 만큼만 증가분으로 나타남
+        result["rss_peak_mb"] = round(rss_after, 1)
+        result["rss_growth_mb"] = round(rss_after - rss_before, 1)
+
+    if measure_memory:
+        # 메모리는 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 따로 한 번 더 실행
+        action, done, target = factory(size)
+        tracemalloc.start()
+        try:
+            run_in_loop(action, done)
+            result["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+        finally:
+            tracemalloc.stop()
+            cleanup_target(target)
+    return result
+
+def compare(results, baseline_path):
+    """이전 결과 파일과 실행 시간 비교 출력"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["scenario"], r["size"]): r for r in json.load(f)["results"]}
+    print(f"\n{'scenario':<16}{'size':>8}{'before ms':>12}{'after ms':>12}{'change':>10}")
+    for result in results:
+        before = baseline.get((result["scenario"], result["size"]))
+        if not before:
+            continue
+        change = (result["wall_ms"] - before["wall_ms"]) / before["wall_ms"] * 100 if before["wall_ms"] else 0.0
+        print(f"{result['scenario']:<16}{result['size']:>8}{before['wall_ms']:>12.1f}{result['wall_ms']:>12.1f}{change:>+9.1f}%")
+
+def main():
+    parser = argparse.ArgumentParser(description="Slack 클론 클라이언트 성능 측정")
+    parser.add_argument("--only", action="append", default=[], help="이름에 이 문자열이 포함된 시나리오만 실행")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로 (없으면 화면에만 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--no-memory", action="store_true", help="메모리 측정 생략 (실행 시간 단축)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    app.setApplicationName("SlackCloneBench")
+
+    results = []
+    for name, factory, sizes in SCENARIOS:
+        if args.only and not any(pattern in name for pattern in args.only):
+            continue
+        for size in sizes:
+            result = {"scenario": name, "size": size}
+            result.update(run_scenario(factory, size, not args.no_memory))
+            results.append(result)
+            print(f"{name:<16}{size:>8}  wall {result['wall_ms']:>9.1f} ms  "
+                  f"max block {result['max_block_ms']:>8.1f} ms  "
+                  f"peak {result.get('peak_mb', '-'):>7} MB  "
+                  f"rss {result.get('rss_peak_mb', '-'):>7} MB (+{result.get('rss_growth_mb', '-')})")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pyside": PYSIDE_VERSION,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM")
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
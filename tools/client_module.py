@@ -0,0 +1,56 @@
+"""도구 스크립트 공용 모듈 (클라이언트 로더, GUI 스레드 멈춤 측정)"""
+import os
+import sys
+import time
+import importlib.util
+
+from PySide6.QtCore import QObject, QTimer, Qt
+
+CLIENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "slack-clone.py")
+BLOCK_THRESHOLD_MS = 16  # 한 프레임보다 오래 걸린 이벤트 처리를 멈춤으로 집계
+
+def load_client():
+    """slack-clone.py를 모듈로 불러옴 (파일 이름에 '-'가 있어 import 문을 쓸 수 없음)"""
+    if "slack_clone" in sys.modules:
+        return sys.modules["slack_clone"]
+    spec = importlib.util.spec_from_file_location("slack_clone", CLIENT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["slack_clone"] = module
+    spec.loader.exec_module(module)
+    return module
+
+class BlockMonitor(QObject):
+    """짧은 주기 타이머가 늦게 호출된 시간으로 GUI 스레드 멈춤 측정"""
+
+    def __init__(self, interval_ms=2, parent=None):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.tick)
+
+    def start(self):
+        self.maxBlock = 0.0
+        self.blocked = 0.0
+        self.stalls = 0
+        self.last = time.perf_counter()
+        self.timer.start()
+
+    def tick(self):
+        now = time.perf_counter()
+        gap = (now - self.last) * 1000 - self.interval_ms
+        self.last = now
+        self.maxBlock = max(self.maxBlock, gap)
+        if gap >= BLOCK_THRESHOLD_MS:
+            self.blocked += gap
+            self.stalls += 1
+
+    def stop(self):
+        self.tick()
+        self.timer.stop()
+        return {
+            "max_block_ms": round(self.maxBlock, 2),
+            "blocked_ms": round(self.blocked, 2),
+            "stalls": self.stalls
+        }
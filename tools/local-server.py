@@ -0,0 +1,452 @@
+"""Slack 클론 로컬 테스트 서버
+
+클라이언트가 사용하는 WebSocket 프로토콜을 메모리 안에서 구현한다. 외부 서비스 없이
+한 대의 컴퓨터에서 클라이언트를 실행하고 부하 테스트나 프로파일링을 할 수 있다.
+
+    python tools/local-server.py                                  # ws://localhost:8081/ws
+    python tools/local-server.py --channels 1000 --messages 5000  # 큰 데이터
+    python tools/local-server.py --latency 80 --jitter 40 --broadcast-rate 50
+
+지원하는 요청: hello, bootstrap, register_user, get_workspace_list, get_channel_list,
+get_channel_data, send_message, search, 워크스페이스/채널 생성, 삭제, 수정.
+응답에는 요청의 request_id와 client_msg_id를 그대로 돌려준다.
+"""
+import sys
+import json
+import time
+import random
+import signal
+import argparse
+from datetime import datetime, timedelta
+
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Slot
+from PySide6.QtNetwork import QHostAddress
+from PySide6.QtWebSockets import QWebSocketServer
+
+from client_module import load_client
+
+WireCodec = load_client().WireCodec
+
+DEFAULT_WORKSPACE = "실험실"
+DEFAULT_CHANNEL = "전체"
+MAX_PAGE_SIZE = 500
+SENDERS = [f"사용자{i}" for i in range(50)]
+WORDS = ["회의", "배포", "서버", "점검", "내일", "오늘", "리뷰", "release", "deploy", "bug",
+         "fix", "확인했습니다", "감사합니다", "API", "테스트", "일정", "공유", "문서"]
+
+class ServerState:
+    """워크스페이스, 채널, 메시지를 메모리에 보관"""
+
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.workspaces = {}  # workspace -> {channel: [message, ...]} (id 오름차순)
+        self.next_id = 1
+
+    def generate(self, workspaces, channels, messages):
+        """합성 데이터 생성 (메시지는 지금부터 거슬러 올라가며 1분 간격)"""
+        names = [DEFAULT_WORKSPACE] + [f"워크스페이스{i}" for i in range(1, workspaces)]
+        start = datetime.now() - timedelta(minutes=messages)
+        for workspace in names:
+            self.workspaces[workspace] = {}
+            for c in range(channels):
+                channel = DEFAULT_CHANNEL if c == 0 else f"채널{c:04d}"
+                self.workspaces[workspace][channel] = [
+                    self.makeMessage(workspace, channel, self.randomSender(), self.randomText(),
+                                     start + timedelta(minutes=m))
+                    for m in range(messages)
+                ]
+
+    def randomSender(self):
+        return self.rng.choice(SENDERS)
+
+    def randomText(self):
+        return " ".join(self.rng.choice(WORDS) for _ in range(self.rng.randint(3, 30)))
+
+    def makeMessage(self, workspace, channel, sender, text, when=None):
+        when = when or datetime.now()
+        message = {
+            "id": self.next_id,
+            "workspace": workspace,
+            "channel": channel,
+            "date": when.strftime("%Y-%m-%d"),
+            "time": when.strftime("%H:%M:%S"),
+            "sender": sender,
+            "message": text
+        }
+        self.next_id += 1
+        return message
+
+    def addMessage(self, workspace, channel, sender, text):
+        message = self.makeMessage(workspace, channel, sender, text)
+        self.workspaces.setdefault(workspace, {}).setdefault(channel, []).append(message)
+        return message
+
+    def workspaceList(self):
+        return {workspace: list(channels) for workspace, channels in self.workspaces.items()}
+
+    def channelList(self, workspace):
+        return list(self.workspaces.get(workspace, {}))
+
+    def page(self, workspace, channel, limit, before=None, after=None):
+        """채널 히스토리 한 페이지와 남은 메시지 여부 반환
+
+        after가 있으면 그 이후 메시지를 오래된 순으로, 아니면 before(없으면 최신) 이전의
+        마지막 limit개를 반환한다.
+        """
+        messages = self.workspaces.get(workspace, {}).get(channel, [])
+        if after is not None:
+            newer = [m for m in messages if m["id"] > after]
+            return newer[:limit], len(newer) > limit
+        if before is not None:
+            messages = [m for m in messages if m["id"] < before]
+        return messages[-limit:], len(messages) > limit
+
+    def search(self, query, limit, offset, workspace=None, channel=None, sender=None,
+               date_from=None, date_to=None):
+        """모든 검색어를 포함하는 메시지를 최신순으로 검색"""
+        terms = query.lower().split()
+        matches = []
+        for ws, channels in self.workspaces.items():
+            if workspace and ws != workspace:
+                continue
+            for ch, messages in channels.items():
+                if channel and ch != channel:
+                    continue
+                for m in messages:
+                    if sender and m["sender"] != sender:
+                        continue
+                    if (date_from and m["date"] < date_from) or (date_to and m["date"] > date_to):
+                        continue
+                    text = m["message"].lower()
+                    if all(term in text for term in terms):
+                        matches.append(m)
+        matches.sort(key=lambda m: m["id"], reverse=True)
+        return matches[offset:offset + limit], offset + limit < len(matches)
+
+class Session:
+    """클라이언트 연결 하나의 상태"""
+
+    def __init__(self, socket):
+        self.socket = socket
+        self.codec = WireCodec()
+        self.username = None
+        self.ready_at = 0.0  # 지연을 흔들어도 응답 순서가 바뀌지 않도록 마지막 전송 예정 시각 기록
+
+class LocalServer(QObject):
+    """QWebSocketServer 기반 프로토콜 서버"""
+
+    def __init__(self, state, latency=0, jitter=0, broadcast_rate=0.0, encodings=None, compression=True,
+                 parent=None):
+        super().__init__(parent)
+        self.state = state
+        self.latency = latency
+        self.jitter = jitter
+        self.encodings = encodings or WireCodec.supportedEncodings()
+        self.compression = compression
+        self.sessions = {}  # socket -> Session
+        self.rng = random.Random()
+
+        self.server = QWebSocketServer("slack-clone-local", QWebSocketServer.NonSecureMode, self)
+        self.server.newConnection.connect(self.onNewConnection)
+
+        self.handlers = {
+            "hello": self.onHello,
+            "bootstrap": self.onBootstrap,
+            "register_user": self.onRegisterUser,
+            "get_workspace_list": self.onGetWorkspaceList,
+            "get_channel_list": self.onGetChannelList,
+            "get_channel_data": self.onGetChannelData,
+            "send_message": self.onSendMessage,
+            "search": self.onSearch,
+            "create_workspace": self.onCreateWorkspace,
+            "delete_workspace": self.onDeleteWorkspace,
+            "update_workspace": self.onUpdateWorkspace,
+            "create_channel": self.onCreateChannel,
+            "delete_channel": self.onDeleteChannel,
+            "update_channel": self.onUpdateChannel,
+        }
+
+        # 다른 사용자가 보내는 메시지 흉내 (초당 broadcast_rate개)
+        self.broadcastTimer = QTimer(self)
+        self.broadcastTimer.timeout.connect(self.broadcastRandomMessage)
+        if broadcast_rate > 0:
+            self.broadcastTimer.start(max(1, int(1000 / broadcast_rate)))
+
+    def listen(self, host, port):
+        if not self.server.listen(QHostAddress(host), port):
+            raise OSError(f"cannot listen on {host}:{port}: {self.server.errorString()}")
+        print(f"[LocalServer] Listening on ws://{host}:{port}/ws")
+
+    @Slot()
+    def onNewConnection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            session = Session(socket)
+            self.sessions[socket] = session
+            socket.textMessageReceived.connect(lambda message, s=session: self.onFrame(s, message))
+            socket.binaryMessageReceived.connect(lambda message, s=session: self.onFrame(s, message))
+            socket.disconnected.connect(lambda s=session: self.onDisconnected(s))
+            print(f"[LocalServer] Client connected ({len(self.sessions)} connected)")
+
+    def onDisconnected(self, session):
+        self.sessions.pop(session.socket, None)
+        session.socket.deleteLater()
+        print(f"[LocalServer] Client disconnected ({len(self.sessions)} connected)")
+
+    def onFrame(self, session, message):
+        try:
+            if isinstance(message, str):
+                data = json.loads(message)
+            else:
+                data = session.codec.decode(message.data() if hasattr(message, "data") else bytes(message))
+        except ValueError as e:
+            print("[LocalServer] Bad frame:", str(e))
+            return
+        if not isinstance(data, dict):
+            return
+
+        action = data.get("action")
+        handler = self.handlers.get(action)
+        if handler is None:
+            self.reply(session, data, f"{action}_response", status="error", message=f"지원하지 않는 요청: {action}")
+            return
+        handler(session, data)
+
+    # 전송
+
+    def send(self, session, data, delay=True):
+        """지연을 적용해서 프레임 전송 (협상한 형식이 바이너리면 바이너리 프레임)"""
+        wait = 0.0
+        if delay and (self.latency or self.jitter):
+            now = time.monotonic()
+            due = now + (self.latency + self.rng.uniform(0, self.jitter)) / 1000
+            session.ready_at = max(due, session.ready_at)
+            wait = session.ready_at - now
+        if wait > 0:
+            QTimer.singleShot(int(wait * 1000), self, lambda: self.transmit(session, data))
+        else:
+            self.transmit(session, data)
+
+    def transmit(self, session, data):
+        if session.socket not in self.sessions:
+            return  # 지연 중에 연결이 끊김
+        if session.codec.binary:
+            session.socket.sendBinaryMessage(session.codec.encode(data))
+        else:
+            session.socket.sendTextMessage(json.dumps(data, ensure_ascii=False))
+
+    def reply(self, session, request, action, **fields):
+        """요청에 대한 응답 (request_id, client_msg_id를 그대로 돌려줌)"""
+        response = {"action": action}
+        for field in ("request_id", "client_msg_id"):
+            if request.get(field) is not None:
+                response[field] = request[field]
+        response.update(fields)
+        self.send(session, response)
+
+    def broadcast(self, data):
+        for session in list(self.sessions.values()):
+            self.send(session, data)
+
+    def broadcastWorkspaces(self):
+        self.broadcast({"action": "workspace_update", "message": self.state.workspaceList()})
+
+    def broadcastChannels(self, workspace):
+        self.broadcast({"action": "channel_update", "workspace": workspace,
+                        "message": self.state.channelList(workspace)})
+
+    @Slot()
+    def broadcastRandomMessage(self):
+        if not self.sessions or not self.state.workspaces:
+            return
+        workspace = self.state.rng.choice(list(self.state.workspaces))
+        channels = self.state.channelList(workspace)
+        if not channels:
+            return
+        channel = self.state.rng.choice(channels)
+        message = self.state.addMessage(workspace, channel, self.state.randomSender(), self.state.randomText())
+        self.broadcast(dict(message, action="send_message"))
+
+    # 요청 처리
+
+    def onHello(self, session, data):
+        """클라이언트가 제안한 형식 중 서버 선호 순서로 선택 (hello_response는 항상 텍스트)"""
+        offered = data.get("encodings") or ["json"]
+        encoding = next((e for e in self.encodings if e in offered), "json")
+        compression = "zlib" if self.compression and "zlib" in (data.get("compression") or []) else None
+        self.transmit(session, {"action": "hello_response", "encoding": encoding, "compression": compression})
+        session.codec = WireCodec(encoding, compression)
+        print(f"[LocalServer] Wire format: {encoding}" + (f" + {compression}" if compression else ""))
+
+    def onBootstrap(self, session, data):
+        """사용자 등록, 워크스페이스(채널 포함) 목록, 채널 최신 페이지를 한 응답으로 반환"""
+        session.username = data.get("username") or data.get("sender")
+        workspace = data.get("workspace", DEFAULT_WORKSPACE)
+        channel = data.get("channel", DEFAULT_CHANNEL)
+        limit = min(int(data.get("limit") or MAX_PAGE_SIZE), MAX_PAGE_SIZE)
+        messages, has_more = self.state.page(workspace, channel, limit, after=data.get("after"))
+        self.reply(session, data, "bootstrap_response", status="success",
+                   registration={"status": "success", "message": f"{session.username} 등록 완료"},
+                   workspaces=self.state.workspaceList(),
+                   channel_data={"workspace": workspace, "channel": channel,
+                                 "message": messages, "has_more": has_more})
+
+    def onRegisterUser(self, session, data):
+        session.username = data.get("username") or data.get("sender")
+        self.reply(session, data, "register_user_response", status="success",
+                   message=f"{session.username} 등록 완료")
+
+    def onGetWorkspaceList(self, session, data):
+        self.reply(session, data, "workspace_list", message=self.state.workspaceList())
+
+    def onGetChannelList(self, session, data):
+        workspace = data.get("workspace", DEFAULT_WORKSPACE)
+        self.reply(session, data, "channel_list", workspace=workspace, message=self.state.channelList(workspace))
+
+    def onGetChannelData(self, session, data):
+        workspace = data.get("workspace", DEFAULT_WORKSPACE)
+        channel = data.get("channel", DEFAULT_CHANNEL)
+        limit = min(int(data.get("limit") or MAX_PAGE_SIZE), MAX_PAGE_SIZE)
+        messages, has_more = self.state.page(workspace, channel, limit, data.get("before"), data.get("after"))
+        self.reply(session, data, "channel_data", workspace=workspace, channel=channel,
+                   message=messages, has_more=has_more)
+
+    def onSendMessage(self, session, data):
+        workspace = data.get("workspace", DEFAULT_WORKSPACE)
+        channel = data.get("channel", DEFAULT_CHANNEL)
+        if channel not in self.state.workspaces.get(workspace, {}):
+            self.reply(session, data, "send_message_response", status="error", message="채널이 없습니다.")
+            return
+        message = self.state.addMessage(workspace, channel, data.get("sender") or session.username,
+                                        data.get("message", ""))
+        self.reply(session, data, "send_message_response", status="success", id=message["id"])
+        broadcast = dict(message, action="send_message")
+        if data.get("client_msg_id"):
+            broadcast["client_msg_id"] = data["client_msg_id"]
+        self.broadcast(broadcast)
+
+    def onSearch(self, session, data):
+        # 클라이언트는 sender 필터를 공통 헤더의 sender 자리에 보내므로 본인 이름이면 필터가 아님
+        sender = data.get("sender")
+        if sender == session.username:
+            sender = None
+        limit = min(int(data.get("limit") or MAX_PAGE_SIZE), MAX_PAGE_SIZE)
+        results, has_more = self.state.search(
+            data.get("query", ""), limit, int(data.get("offset") or 0),
+            workspace=data.get("workspace"), channel=data.get("channel"), sender=sender,
+            date_from=data.get("date_from"), date_to=data.get("date_to")
+        )
+        self.reply(session, data, "search_response", status="success", results=results, has_more=has_more)
+
+    def onCreateWorkspace(self, session, data):
+        name = data.get("workspace_name")
+        if not name or name in self.state.workspaces:
+            self.reply(session, data, "create_workspace_response", status="error",
+                       message="워크스페이스 이름이 없거나 이미 있습니다.")
+            return
+        self.state.workspaces[name] = {DEFAULT_CHANNEL: []}
+        self.reply(session, data, "create_workspace_response", status="success",
+                   message=f"'{name}' 워크스페이스를 만들었습니다.")
+        self.broadcastWorkspaces()
+
+    def onDeleteWorkspace(self, session, data):
+        name = data.get("workspace")
+        if self.state.workspaces.pop(name, None) is None:
+            self.reply(session, data, "delete_workspace_response", status="error", message="워크스페이스가 없습니다.")
+            return
+        self.reply(session, data, "delete_workspace_response", status="success",
+                   message=f"'{name}' 워크스페이스를 삭제했습니다.")
+        self.broadcastWorkspaces()
+
+    def onUpdateWorkspace(self, session, data):
+        name = data.get("workspace")
+        new_name = data.get("workspace_name")
+        if name not in self.state.workspaces or not new_name or new_name in self.state.workspaces:
+            self.reply(session, data, "update_workspace_response", status="error",
+                       message="워크스페이스 이름을 바꿀 수 없습니다.")
+            return
+        self.state.workspaces = {new_name if ws == name else ws: channels
+                                 for ws, channels in self.state.workspaces.items()}
+        self.reply(session, data, "update_workspace_response", status="success",
+                   message=f"'{name}' 워크스페이스 이름을 '{new_name}'(으)로 바꿨습니다.")
+        self.broadcastWorkspaces()
+
+    def onCreateChannel(self, session, data):
+        workspace = data.get("workspace", DEFAULT_WORKSPACE)
+        name = data.get("channel_name")
+        channels = self.state.workspaces.get(workspace)
+        if channels is None or not name or name in channels:
+            self.reply(session, data, "create_channel_response", status="error",
+                       message="채널 이름이 없거나 이미 있습니다.")
+            return
+        channels[name] = []
+        self.reply(session, data, "create_channel_response", status="success",
+                   message=f"'{name}' 채널을 만들었습니다.")
+        self.broadcastChannels(workspace)
+
+    def onDeleteChannel(self, session, data):
+        workspace = data.get("workspace", DEFAULT_WORKSPACE)
+        name = data.get("channel")
+        channels = self.state.workspaces.get(workspace, {})
+        if channels.pop(name, None) is None:
+            self.reply(session, data, "delete_channel_response", status="error", message="채널이 없습니다.")
+            return
+        self.reply(session, data, "delete_channel_response", status="success",
+                   message=f"'{name}' 채널을 삭제했습니다.")
+        self.broadcastChannels(workspace)
+
+    def onUpdateChannel(self, session, data):
+        workspace = data.get("workspace", DEFAULT_WORKSPACE)
+        name = data.get("channel")
+        new_name = data.get("channel_name")
+        channels = self.state.workspaces.get(workspace, {})
+        if name not in channels or not new_name or new_name in channels:
+            self.reply(session, data, "update_channel_response", status="error",
+                       message="채널 이름을 바꿀 수 없습니다.")
+            return
+        self.state.workspaces[workspace] = {new_name if ch == name else ch: messages
+                                            for ch, messages in channels.items()}
+        self.reply(session, data, "update_channel_response", status="success",
+                   message=f"'{name}' 채널 이름을 '{new_name}'(으)로 바꿨습니다.")
+        self.broadcastChannels(workspace)
+
+def main():
+    parser = argparse.ArgumentParser(description="Slack 클론 로컬 테스트 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--workspaces", type=int, default=1, help="워크스페이스 수")
+    parser.add_argument("--channels", type=int, default=10, help="워크스페이스별 채널 수")
+    parser.add_argument("--messages", type=int, default=200, help="채널별 메시지 수")
+    parser.add_argument("--latency", type=int, default=0, help="응답 지연 (ms)")
+    parser.add_argument("--jitter", type=int, default=0, help="응답 지연에 더할 무작위 시간의 최대값 (ms)")
+    parser.add_argument("--broadcast-rate", type=float, default=0.0, help="초당 다른 사용자 메시지 수")
+    parser.add_argument("--encoding", action="append", choices=["msgpack", "cbor", "json"],
+                        help="선호하는 인코딩 (여러 번 지정하면 순서대로 선호, 기본값은 가능한 전부)")
+    parser.add_argument("--no-compression", action="store_true", help="zlib 압축 사용 안 함")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    # 파이썬 시그널 처리기가 실행될 수 있도록 주기적으로 이벤트 루프를 깨움
+    wakeTimer = QTimer()
+    wakeTimer.timeout.connect(lambda: None)
+    wakeTimer.start(200)
+
+    started = time.perf_counter()
+    state = ServerState(args.seed)
+    state.generate(args.workspaces, args.channels, args.messages)
+    print(f"[LocalServer] Generated {state.next_id - 1} messages in "
+          f"{args.workspaces * args.channels} channels ({time.perf_counter() - started:.1f} s)")
+
+    encodings = [e for e in (args.encoding or WireCodec.supportedEncodings()) if e in WireCodec.supportedEncodings()]
+    server = LocalServer(state, args.latency, args.jitter, args.broadcast_rate, encodings, not args.no_compression)
+    try:
+        server.listen(args.host, args.port)
+    except OSError as e:
+        print("[LocalServer]", str(e))
+        return 1
+    return app.exec()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Slack 클론 트래픽 재생 도구
+
+`slack-clone.py --record-traffic PATH`로 기록한 파일의 수신 프레임을 서버 없이
+기록된 시간 간격 그대로 WebSocket 워커에 다시 넣는다. 실제 연결과 같은 경로
+(워커 스레드 디코딩, GUI 스레드 처리)를 거치므로 기록된 폭주 상황을 반복해서 재현할 수 있다.
+
+    python tools/replay-traffic.py traffic.rec                 # 1배속
+    python tools/replay-traffic.py traffic.rec --speed 10      # 10배속
+    python tools/replay-traffic.py traffic.rec --speed 0       # 최대한 빠르게
+    python tools/replay-traffic.py traffic.rec --show --stay   # 창을 띄우고 재생 후 유지
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Slack 클론 트래픽 재생")
+    parser.add_argument("recording", help="--record-traffic로 기록한 파일")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0이면 간격 없이 최대한 빠르게)")
+    parser.add_argument("--show", action="store_true", help="화면에 창을 띄움 (기본은 offscreen)")
+    parser.add_argument("--stay", action="store_true", help="재생이 끝나도 종료하지 않음")
+    parser.add_argument("--report", help="재생 결과를 저장할 JSON 파일")
+    return parser.parse_args()
+
+args = parse_args()
+if not args.show:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# 사용자의 메시지 저장소와 설정을 건드리지 않도록 임시 데이터 경로 사용
+os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp(prefix="slack-clone-replay-")
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QObject, QTimer, QMetaObject, Qt, Signal, Slot
+
+from client_module import load_client, BlockMonitor
+
+client = load_client()
+TrafficRecorder = client.TrafficRecorder
+
+class TrafficReplayer(QObject):
+    """기록된 수신 프레임을 워커 스레드에서 시간에 맞춰 워커에 전달"""
+    finished = Signal(object)
+
+    def __init__(self, worker, records, speed=1.0, parent=None):
+        super().__init__(parent)
+        self.worker = worker
+        self.frames = [(t, payload) for t, direction, payload in records if direction == TrafficRecorder.INBOUND]
+        self.speed = speed
+        self.timer = None
+
+    @Slot()
+    def start(self):
+        # 실제 서버로 연결하지 않고 협상 전 상태(JSON 텍스트)에서 시작
+        self.worker.stop()
+        self.worker.closeSocket()
+        self.worker.codec = client.WireCodec()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.feed)
+        self.index = 0
+        self.maxLag = 0.0
+        self.started = time.perf_counter()
+        self.feed()
+
+    @Slot()
+    def feed(self):
+        """예정 시각이 지난 프레임을 모두 전달하고 다음 프레임 시각에 다시 호출"""
+        while self.index < len(self.frames):
+            timestamp, payload = self.frames[self.index]
+            if self.speed > 0:
+                lag = (time.perf_counter() - self.started) - timestamp / self.speed
+                if lag < 0:
+                    self.timer.start(int(-lag * 1000))
+                    return
+                self.maxLag = max(self.maxLag, lag)
+            if isinstance(payload, str):
+                self.worker.onTextMessageReceived(payload)
+            else:
+                self.worker.onBinaryMessageReceived(payload)
+            self.index += 1
+        self.finished.emit({
+            "frames": len(self.frames),
+            "feed_ms": round((time.perf_counter() - self.started) * 1000, 2),
+            "max_lag_ms": round(self.maxLag * 1000, 2)
+        })
+
+class ReplayRun(QObject):
+    """GUI 스레드에서 재생 결과를 모아 출력 (워커 스레드의 finished 시그널을 큐로 받음)"""
+
+    def __init__(self, app, window, records, parent=None):
+        super().__init__(parent)
+        self.app = app
+        self.window = window
+        self.monitor = BlockMonitor(parent=self)
+        self.result = {"recording": args.recording, "speed": args.speed,
+                       "outbound_frames": sum(1 for r in records if r[1] == TrafficRecorder.OUTBOUND)}
+
+    def start(self, replayer):
+        self.monitor.start()
+        self.started = time.perf_counter()
+        QMetaObject.invokeMethod(replayer, "start", Qt.QueuedConnection)
+
+    def drained(self):
+        return not self.window.ingestBuffer.pending and not self.window.hasPendingRender(self.window.messageModel)
+
+    @Slot(object)
+    def onFinished(self, stats):
+        self.result.update(stats)
+        self.finish()
+
+    @Slot()
+    def finish(self):
+        # 워커가 전달한 프레임이 GUI 스레드에서 모두 처리될 때까지 기다린 뒤 결과 출력
+        if not self.drained():
+            QTimer.singleShot(10, self.finish)
+            return
+        self.result["wall_ms"] = round((time.perf_counter() - self.started) * 1000, 2)
+        self.result.update(self.monitor.stop())
+        print(json.dumps(self.result, ensure_ascii=False, indent=2))
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(self.result, f, ensure_ascii=False, indent=2)
+        if not args.stay:
+            self.window.close()
+            self.app.quit()
+
+def main():
+    try:
+        records = TrafficRecorder.read(args.recording)
+    except (OSError, ValueError) as e:
+        print("[Replay]", str(e))
+        return 1
+
+    app = QApplication(sys.argv[:1])
+    app.setApplicationName("SlackCloneReplay")
+    window = client.MainWindow()
+    window.show()
+
+    run = ReplayRun(app, window, records)
+    replayer = TrafficReplayer(window.wsWorker, records, args.speed)
+    replayer.moveToThread(window.wsThread)
+    replayer.finished.connect(run.onFinished)
+    window.wsThread.finished.connect(replayer.deleteLater)
+
+    print(f"[Replay] {len(replayer.frames)} inbound frames, "
+          f"{records[-1][0] if records else 0:.1f} s recorded, speed {args.speed or 'max'}")
+    run.start(replayer)
+    return app.exec()
+
+if __name__ == "__main__":
+    sys.exit(main())